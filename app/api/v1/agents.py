@@ -1,19 +1,35 @@
+import json
+from typing import Any, AsyncIterator, Dict
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from ...schemas.agent_schema import AgentQueryRequest, AgentQueryResponse
-from ...services.agent.graph import agent # LangGraph 에이전트 인스턴스 임포트
+from ...services.agent_service import AgentService
+from ...services.sync.scheduler import refresh_scheduler
+from ...services.monitoring.metrics import metrics
+from ...db.repositories.place_repository import PlaceRepository
+from ...db.connection import get_database
 
 router = APIRouter()
 
+# 의존성 주입: AgentService (빠른 경로 라우터 + LLM 에이전트)
+def get_agent_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> AgentService:
+    return AgentService(place_repo=PlaceRepository(db))
+
 @router.post("/agent/query", response_model=AgentQueryResponse)
-def query_agent(
-    request: AgentQueryRequest
+async def query_agent(
+    request: AgentQueryRequest,
+    service: AgentService = Depends(get_agent_service)
 ):
     """
-    사용자의 질문에 대해 LangGraph AI 에이전트가 답변을 생성합니다.
+    사용자의 질문에 대해 답변을 생성합니다.
+    영업시간/메뉴/혼잡도 질문은 장소 문서로 바로 답하고, 나머지는 LangGraph AI 에이전트가 답합니다.
     """
+    # 자주 질문받는 장소가 먼저 갱신되도록 조회 기록
+    refresh_scheduler.record_query(request.place_id)
     try:
         # LangGraph 에이전트 실행 시 category도 함께 전달
-        answer = agent.run(
+        result = await service.answer(
             place_id=request.place_id,
             query=request.query,
             category=request.category
@@ -21,7 +37,63 @@ def query_agent(
         return AgentQueryResponse(
             place_id=request.place_id,
             query=request.query,
-            answer=answer
+            answer=result["answer"],
+            route=result["route"]
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"에이전트 실행 중 오류 발생: {e}")
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 메시지 하나를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.post("/agent/query/stream")
+async def stream_agent_query(
+    request: AgentQueryRequest,
+    service: AgentService = Depends(get_agent_service)
+):
+    """
+    /agent/query와 같은 질문을 처리하되, 답변 토큰과 도구 호출 진행 상황을
+    Server-Sent Events(text/event-stream)로 바로 전달합니다.
+    이벤트 종류: token, tool_start, tool_end, done, error
+    """
+    refresh_scheduler.record_query(request.place_id)
+
+    async def events() -> AsyncIterator[str]:
+        metrics.increment("agent.stream.requests")
+        try:
+            fast = await service.generate_response(request.place_id, request.query)
+            if fast["answer"] is not None:
+                service.record_route("fast_path", fast["intent"])
+                yield _sse("token", {"content": fast["answer"]})
+                yield _sse("done", {"answer": fast["answer"], "route": "fast_path"})
+                return
+
+            key, cached = await service.lookup_cached(request.place_id, request.query)
+            if cached is not None:
+                service.record_route("cache", fast["intent"])
+                yield _sse("token", {"content": cached})
+                yield _sse("done", {"answer": cached, "route": "cache"})
+                return
+
+            service.record_route("llm", fast["intent"])
+            async for event in service.agent_factory().astream(
+                place_id=request.place_id,
+                query=request.query,
+                category=request.category
+            ):
+                if event["type"] == "done":
+                    event["route"] = "llm"
+                    service.store_cached(key, event["answer"])
+                yield _sse(event.pop("type"), event)
+        except Exception as e:
+            # 응답 헤더는 이미 전송되었으므로 HTTP 상태 코드 대신 error 이벤트로 알림
+            metrics.increment("agent.stream.errors")
+            yield _sse("error", {"detail": f"에이전트 실행 중 오류 발생: {e}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 버퍼링하지 않고 바로 전달하도록 설정
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, HTTPException
+from ...services.crawler.client import get_shared_client
+from ...services.monitoring.metrics import metrics
+from ...db.repositories.place_cache import place_cache
+from ...services.agent.answer_cache import answer_cache
+
+router = APIRouter()
+
+@router.get("/monitoring/firecrawl")
+def get_firecrawl_status():
+    """
+    Firecrawl 클라이언트의 서킷 브레이커 상태, 요청 카운터, 응답 캐시 통계를 조회합니다.
+    """
+    try:
+        client = get_shared_client()
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {
+        "circuit_breaker": client.circuit_breaker.snapshot(),
+        "counters": metrics.snapshot("firecrawl."),
+        "scrape_cache": client.cache.stats() if client.cache else None,
+    }
+
+@router.post("/monitoring/firecrawl/circuit/reset")
+def reset_firecrawl_circuit():
+    """
+    장애 복구가 확인되었을 때 서킷 브레이커를 수동으로 닫습니다.
+    """
+    try:
+        client = get_shared_client()
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    client.circuit_breaker.reset()
+    return {"circuit_breaker": client.circuit_breaker.snapshot()}
+
+@router.get("/monitoring/place-cache")
+def get_place_cache_status():
+    """
+    장소 문서 캐시의 적중률과 항목 수를 조회합니다.
+    """
+    return place_cache.stats()
+
+@router.get("/monitoring/agent")
+def get_agent_status():
+    """
+    질문이 빠른 경로(템플릿), 답변 캐시, LLM 에이전트 중 어디로 처리되었는지 집계와
+    답변 캐시의 적중률, LLM 호출당 토큰 사용량을 조회합니다.
+    """
+    counters = metrics.snapshot("agent.")
+    turns = counters.get("agent.turns", 0)
+    tool_calls = counters.get("agent.tool_output.calls", 0)
+    return {
+        "counters": counters,
+        "tokens_per_turn": {
+            "input": round(counters.get("agent.tokens.input", 0) / turns, 1) if turns else 0.0,
+            "output": round(counters.get("agent.tokens.output", 0) / turns, 1) if turns else 0.0,
+        },
+        "tool_output_tokens_per_call": round(counters.get("agent.tool_output.tokens", 0) / tool_calls, 1) if tool_calls else 0.0,
+        "answer_cache": answer_cache.stats(),
+    }
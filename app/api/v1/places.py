@@ -1,50 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Any
 
 from ...services.sync.sync_pipeline import SyncPipeline
+from ...services.sync.job_queue import sync_job_queue
+from ...services.sync.scheduler import refresh_scheduler
+from ...services.sync.write_batcher import place_write_batcher
 from ...services.url_processor import url_processor
 from ...db.repositories.place_repository import PlaceRepository
 from ...db.connection import get_database
-from ...schemas.place_schema import PlaceSyncRequest, PlaceSyncResponse, PlaceResponse
-from pymongo.database import Database
-from ...services.crawler.client import FirecrawlClient
-from firecrawl import FirecrawlApp
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from ...schemas.place_schema import (
+    PlaceSyncRequest, PlaceSyncResponse, PlaceResponse,
+    PlaceBatchSyncRequest, PlaceBatchSyncResponse, SyncJobResponse, PlaceProjection,
+)
+from ...core.config import settings
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from ...services.crawler.client import FirecrawlClient, FirecrawlUnavailableException, get_shared_client
 
 # 의존성 주입: SyncPipeline
-def get_sync_pipeline(db: Database = Depends(get_database)) -> SyncPipeline:
-    from ...services.crawler.client import FirecrawlClient
+def get_sync_pipeline(db: AsyncIOMotorDatabase = Depends(get_database)) -> SyncPipeline:
     from ...services.normalizer.data_normalizer import DataNormalizer
     from ...services.congestion.predictor import CongestionPredictor
     
     return SyncPipeline(
         place_repo=PlaceRepository(db),
-        crawler=FirecrawlClient(),
+        crawler=get_shared_client(),
         normalizer=DataNormalizer(),
-        predictor=CongestionPredictor()
+        predictor=CongestionPredictor(),
+        writer=place_write_batcher if place_write_batcher.is_running else None,
     )
-firecrawl = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
 
 # 의존성 주입: PlaceRepository
-def get_place_repository(db: Database = Depends(get_database)) -> PlaceRepository:
+def get_place_repository(db: AsyncIOMotorDatabase = Depends(get_database)) -> PlaceRepository:
     return PlaceRepository(db)
 
 def get_firecrawl_client() -> FirecrawlClient:
-    return FirecrawlClient()
+    return get_shared_client()
 
 router = APIRouter()
 
 @router.post("/places/sync", response_model=PlaceSyncResponse, status_code=202)
-async def trigger_sync(
-    request: PlaceSyncRequest,
-    background_tasks: BackgroundTasks,
-    pipeline: SyncPipeline = Depends(get_sync_pipeline)
-):
+async def trigger_sync(request: PlaceSyncRequest):
     """
     Naver Place URL을 받아 해당 장소의 데이터 동기화를 비동기적으로 시작합니다.
+    같은 장소의 동기화가 이미 진행 중이면 새로 시작하지 않고 기존 작업을 반환합니다.
     """
     try:
         processed_info = url_processor.process(str(request.url))
@@ -53,22 +51,82 @@ async def trigger_sync(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"잘못된 URL입니다: {e}")
 
-    background_tasks.add_task(pipeline.run_sync, place_id, category)
+    existing_job = sync_job_queue.find_inflight_job(place_id)
+    if existing_job:
+        return {"message": "이미 진행 중인 동기화 작업이 있습니다.", "place_id": place_id, "job_id": existing_job.job_id}
+
+    try:
+        job = sync_job_queue.submit([(place_id, category)], force=request.force)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return {"message": "데이터 동기화 작업이 시작되었습니다.", "place_id": place_id, "job_id": job.job_id}
+
+@router.post("/places/sync:batch", response_model=PlaceBatchSyncResponse, status_code=202)
+async def trigger_batch_sync(request: PlaceBatchSyncRequest):
+    """
+    여러 Naver Place URL 또는 placeId를 받아 중복을 제거한 뒤
+    작업 큐에 넣고, 워커 풀이 순차적으로 동기화하도록 합니다.
+    """
+    if len(request.items) > settings.SYNC_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.SYNC_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.",
+        )
+
+    places: Dict[str, str] = {}
+    invalid = []
+    for item in request.items:
+        processed_info = url_processor.process(item.strip())
+        if not processed_info:
+            invalid.append(item)
+            continue
+        place_id = processed_info["place_id"]
+        # 순수 ID는 기본 카테고리가 되므로, URL에서 얻은 카테고리를 우선 사용
+        if place_id not in places or not item.strip().isdigit():
+            places[place_id] = processed_info["category"]
+
+    if not places:
+        raise HTTPException(status_code=400, detail="유효한 URL 또는 placeId가 없습니다.")
+
+    try:
+        job = sync_job_queue.submit(list(places.items()), force=request.force)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return {
+        "message": "일괄 동기화 작업이 등록되었습니다.",
+        "job_id": job.job_id,
+        "accepted": len(places),
+        "duplicates": len(request.items) - len(invalid) - len(places),
+        "invalid": invalid,
+    }
 
-    return {"message": "데이터 동기화 작업이 시작되었습니다.", "place_id": place_id}
+@router.get("/places/sync/jobs/{job_id}", response_model=SyncJobResponse)
+async def get_sync_job(job_id: str):
+    """
+    일괄 동기화 작업의 장소별 진행 상황을 조회합니다.
+    """
+    job = sync_job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 ID의 동기화 작업을 찾을 수 없습니다.")
+    return job.to_dict()
 
 # app/api/v1/places.py
-@router.get("/places/{place_id}", response_model=PlaceResponse)
-def get_place_by_id(
+@router.get("/places/{place_id}", response_model=PlaceResponse, response_model_exclude_unset=True)
+async def get_place_by_id(
     place_id: str,
+    projection: PlaceProjection = Query("full", description="조회할 필드 묶음 (full, profile, hours, menu, congestion)"),
     repo: PlaceRepository = Depends(get_place_repository)
 ):
     """
-    DB에 저장된 특정 장소의 모든 정보를 조회합니다.
+    DB에 저장된 특정 장소의 정보를 조회합니다.
+    projection을 지정하면 해당 필드만 조회하여 반환합니다.
     """
-    place_data = repo.get_by_id(place_id)
+    place_data = await repo.get_by_id(place_id, projection=projection)
     if not place_data:
         raise HTTPException(status_code=404, detail="해당 ID의 장소를 찾을 수 없습니다.")
+    refresh_scheduler.record_query(place_id)
     
     # ObjectId를 str으로 변환하여 FastAPI 유효성 검사 오류를 해결
     if '_id' in place_data:
@@ -92,5 +150,14 @@ async def extract_data(
             raise HTTPException(status_code=404, detail="Could not scrape data or generate llms.txt from the URL.")
 
         return {"scraped_data": scraped_data, "llms_txt": llms_txt_data}
+    except HTTPException:
+        raise
+    except FirecrawlUnavailableException as e:
+        # 업스트림 장애 중에는 기다리지 않고 즉시 503 반환
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, int(e.retry_after)))},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
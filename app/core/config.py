@@ -0,0 +1,141 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+class Settings:
+    """
+    환경 변수 기반 애플리케이션 설정.
+    값이 없으면 기본값을 사용합니다.
+    """
+    def __init__(self):
+        # MongoDB(Motor) 커넥션 풀
+        self.MONGO_MAX_POOL_SIZE = _env_int("MONGO_MAX_POOL_SIZE", 100)
+        self.MONGO_MIN_POOL_SIZE = _env_int("MONGO_MIN_POOL_SIZE", 0)
+        self.MONGO_MAX_IDLE_TIME_MS = _env_int("MONGO_MAX_IDLE_TIME_MS", 60000)
+        self.MONGO_SERVER_SELECTION_TIMEOUT_MS = _env_int("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000)
+        # 시작 시 places/polices 인덱스 생성
+        self.MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true"
+
+        # 장소 문서 read-through 캐시 (TTL 단위: 초)
+        self.PLACE_CACHE_ENABLED = os.getenv("PLACE_CACHE_ENABLED", "true").lower() == "true"
+        self.PLACE_CACHE_MAX_ENTRIES = _env_int("PLACE_CACHE_MAX_ENTRIES", 1000)
+        self.PLACE_CACHE_TTL = _env_float("PLACE_CACHE_TTL", 60.0)
+
+        # Firecrawl API 주소 (로컬 대체 서버로 바꿀 수 있음)
+        self.FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev").rstrip("/")
+
+        # Firecrawl HTTP 커넥션 풀
+        self.FIRECRAWL_POOL_LIMIT = _env_int("FIRECRAWL_POOL_LIMIT", 100)
+        self.FIRECRAWL_POOL_LIMIT_PER_HOST = _env_int("FIRECRAWL_POOL_LIMIT_PER_HOST", 20)
+        self.FIRECRAWL_KEEPALIVE_TIMEOUT = _env_float("FIRECRAWL_KEEPALIVE_TIMEOUT", 30.0)
+        self.FIRECRAWL_DNS_CACHE_TTL = _env_int("FIRECRAWL_DNS_CACHE_TTL", 300)
+
+        # Firecrawl 요청 속도 제한 및 재시도
+        self.FIRECRAWL_RATE_LIMIT_PER_MINUTE = _env_float("FIRECRAWL_RATE_LIMIT_PER_MINUTE", 100.0)
+        self.FIRECRAWL_RATE_BURST = _env_int("FIRECRAWL_RATE_BURST", 10)
+        self.FIRECRAWL_MAX_RETRIES = _env_int("FIRECRAWL_MAX_RETRIES", 3)
+        self.FIRECRAWL_BACKOFF_BASE = _env_float("FIRECRAWL_BACKOFF_BASE", 0.5)
+        self.FIRECRAWL_BACKOFF_MAX = _env_float("FIRECRAWL_BACKOFF_MAX", 30.0)
+        # Retry-After가 이보다 길면 기다리지 않고 바로 실패 처리
+        self.FIRECRAWL_RETRY_AFTER_MAX = _env_float("FIRECRAWL_RETRY_AFTER_MAX", 60.0)
+
+        # Firecrawl 요청 타임아웃(초)과 서킷 브레이커
+        self.FIRECRAWL_CONNECT_TIMEOUT = _env_float("FIRECRAWL_CONNECT_TIMEOUT", 5.0)
+        self.FIRECRAWL_SCRAPE_TIMEOUT = _env_float("FIRECRAWL_SCRAPE_TIMEOUT", 45.0)
+        self.FIRECRAWL_SEARCH_TIMEOUT = _env_float("FIRECRAWL_SEARCH_TIMEOUT", 30.0)
+        self.FIRECRAWL_LLMSTXT_TIMEOUT = _env_float("FIRECRAWL_LLMSTXT_TIMEOUT", 120.0)
+        self.FIRECRAWL_BREAKER_FAILURE_THRESHOLD = _env_int("FIRECRAWL_BREAKER_FAILURE_THRESHOLD", 5)
+        self.FIRECRAWL_BREAKER_RECOVERY_TIMEOUT = _env_float("FIRECRAWL_BREAKER_RECOVERY_TIMEOUT", 30.0)
+        self.FIRECRAWL_BREAKER_HALF_OPEN_CALLS = _env_int("FIRECRAWL_BREAKER_HALF_OPEN_CALLS", 1)
+
+        # Firecrawl 호출 모드: live(실서버), record(실서버 응답을 fixture로 저장), replay(fixture로 응답)
+        self.FIRECRAWL_MODE = os.getenv("FIRECRAWL_MODE", "live").lower()
+        self.FIRECRAWL_FIXTURES_DIR = os.getenv("FIRECRAWL_FIXTURES_DIR", os.path.join("app", "results", "fixtures"))
+        self.FIRECRAWL_REPLAY_LATENCY = _env_float("FIRECRAWL_REPLAY_LATENCY", 0.0)
+        self.FIRECRAWL_REPLAY_ERROR_RATE = _env_float("FIRECRAWL_REPLAY_ERROR_RATE", 0.0)
+
+        # Firecrawl 응답 캐시 (TTL 단위: 초, 0이면 캐시하지 않음)
+        self.SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+        self.SCRAPE_CACHE_MAX_ENTRIES = _env_int("SCRAPE_CACHE_MAX_ENTRIES", 1000)
+        self.SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", os.path.join("app", "results", "cache"))
+        # 디스크 계층의 최대 파일 수와 정리 주기 (이 횟수만큼 쓸 때마다 만료/초과 파일 삭제)
+        self.SCRAPE_CACHE_DISK_MAX_ENTRIES = _env_int("SCRAPE_CACHE_DISK_MAX_ENTRIES", 10000)
+        self.SCRAPE_CACHE_DISK_SWEEP_EVERY = _env_int("SCRAPE_CACHE_DISK_SWEEP_EVERY", 100)
+        self.SCRAPE_CACHE_TTLS = {
+            "home": _env_float("SCRAPE_CACHE_TTL_HOME", 300),
+            "menu": _env_float("SCRAPE_CACHE_TTL_MENU", 3600),
+            "info": _env_float("SCRAPE_CACHE_TTL_INFO", 3600),
+            "review": _env_float("SCRAPE_CACHE_TTL_REVIEW", 1800),
+            "llmstxt": _env_float("SCRAPE_CACHE_TTL_LLMSTXT", 86400),
+            "default": _env_float("SCRAPE_CACHE_TTL_DEFAULT", 300),
+        }
+
+        # 장소별 산출물(llms.txt 등) 저장소. 압축 방식: zstd(없으면 gzip), gzip, none
+        self.ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", os.path.join("app", "results", "artifacts"))
+        self.ARTIFACT_COMPRESSION = os.getenv("ARTIFACT_COMPRESSION", "zstd")
+
+        # llms-full.txt 등 산출물의 섹션 단위 검색 인덱스 (장소별 BM25)
+        self.RETRIEVAL_INDEX_DIR = os.getenv("RETRIEVAL_INDEX_DIR", os.path.join("app", "results", "retrieval"))
+        self.RETRIEVAL_TOP_K = _env_int("RETRIEVAL_TOP_K", 3)
+        # 메모리에 올려 둘 장소 인덱스 수 (넘으면 가장 오래 쓰지 않은 것부터 내림)
+        self.RETRIEVAL_INDEX_MAX_PLACES = _env_int("RETRIEVAL_INDEX_MAX_PLACES", 256)
+        # 한 청크의 최대 글자 수 (긴 섹션은 문단 단위로 나눔)
+        self.RETRIEVAL_CHUNK_MAX_CHARS = _env_int("RETRIEVAL_CHUNK_MAX_CHARS", 1200)
+
+        # 동기화 파이프라인
+        self.SYNC_PAGE_CONCURRENCY = _env_int("SYNC_PAGE_CONCURRENCY", 4)
+        # 마지막 fetch 이후 이 시간(초) 안에는 다시 크롤링하지 않음
+        self.SYNC_MIN_REFRESH_INTERVAL = _env_int("SYNC_MIN_REFRESH_INTERVAL", 600)
+        # source.changeHistory에 보관할 최근 변경 기록 수
+        self.SYNC_CHANGE_HISTORY_SIZE = _env_int("SYNC_CHANGE_HISTORY_SIZE", 20)
+
+        # 일괄 동기화 작업 큐
+        self.SYNC_WORKER_COUNT = _env_int("SYNC_WORKER_COUNT", 8)
+        self.SYNC_MAX_ATTEMPTS = _env_int("SYNC_MAX_ATTEMPTS", 3)
+        self.SYNC_RETRY_BACKOFF = _env_float("SYNC_RETRY_BACKOFF", 2.0)
+        self.SYNC_JOB_RETENTION = _env_int("SYNC_JOB_RETENTION", 100)
+        self.SYNC_BATCH_MAX_ITEMS = _env_int("SYNC_BATCH_MAX_ITEMS", 10000)
+        # 워커들의 DB 쓰기를 묶어 보내는 bulk_write 크기와 최대 대기 시간(초)
+        self.SYNC_WRITE_BATCH_SIZE = _env_int("SYNC_WRITE_BATCH_SIZE", 100)
+        self.SYNC_WRITE_BATCH_DELAY = _env_float("SYNC_WRITE_BATCH_DELAY", 0.05)
+
+        # 에이전트(ChatOpenAI + LangGraph)를 워커 시작 시 미리 생성할지 여부. 기본은 첫 요청 때 생성
+        self.AGENT_PRELOAD = os.getenv("AGENT_PRELOAD", "false").lower() == "true"
+
+        # 영업시간/메뉴/혼잡도 질문을 LLM 없이 템플릿으로 답하는 빠른 경로
+        self.AGENT_FAST_PATH_ENABLED = os.getenv("AGENT_FAST_PATH_ENABLED", "true").lower() == "true"
+        self.AGENT_FAST_PATH_MIN_CONFIDENCE = _env_float("AGENT_FAST_PATH_MIN_CONFIDENCE", 0.8)
+
+        # LLM 에이전트 답변 캐시 (장소 문서가 바뀌면 자동으로 새 답변 생성)
+        self.ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+        self.ANSWER_CACHE_MAX_ENTRIES = _env_int("ANSWER_CACHE_MAX_ENTRIES", 1000)
+        self.ANSWER_CACHE_TTL = _env_float("ANSWER_CACHE_TTL", 600.0)
+
+        # LLM에 넣는 도구 결과의 최대 토큰 수 (넘으면 긴 목록의 뒷부분을 잘라냄)
+        self.TOOL_OUTPUT_TOKEN_BUDGET = _env_int("TOOL_OUTPUT_TOKEN_BUDGET", 1500)
+        # 토큰 수 계산에 사용할 tiktoken 인코딩 (gpt-4o 기준)
+        self.TOOL_OUTPUT_TOKENIZER = os.getenv("TOOL_OUTPUT_TOKENIZER", "o200k_base")
+
+        # 오래된 장소 자동 갱신 스케줄러
+        # 워커 프로세스마다 따로 실행되므로(예산도 워커별로 적용됨) 기본값은 꺼 두고,
+        # 한 프로세스(전용 워커 또는 워커 1개 배포)에서만 켬
+        self.REFRESH_SCHEDULER_ENABLED = os.getenv("REFRESH_SCHEDULER_ENABLED", "false").lower() == "true"
+        # 스케줄러를 켠 프로세스 하나의 분당 Firecrawl 요청 예산
+        self.REFRESH_BUDGET_PER_MINUTE = _env_int("REFRESH_BUDGET_PER_MINUTE", 60)
+        self.REFRESH_TICK_SECONDS = _env_float("REFRESH_TICK_SECONDS", 60.0)
+        self.REFRESH_SCAN_LIMIT = _env_int("REFRESH_SCAN_LIMIT", 500)
+
+
+settings = Settings()
@@ -1,7 +1,7 @@
-from pymongo import MongoClient
-from pymongo.database import Database
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 import os
 from dotenv import load_dotenv
+from ..core.config import settings
 
 load_dotenv()
 
@@ -10,16 +10,24 @@ class MongoDBConnection:
     _db = None
 
     @classmethod
-    def get_client(cls) -> MongoClient:
+    def get_client(cls) -> AsyncIOMotorClient:
+        # 임포트 시점이 아니라 처음 사용할 때 생성 (uvicorn 워커가 fork된 뒤 각자 커넥션 풀을 가짐)
         if cls._client is None:
             mongo_uri = os.getenv("MONGO_URI")
             if not mongo_uri:
                 raise ValueError("MONGO_URI 환경 변수가 설정되지 않았습니다.")
-            cls._client = MongoClient(mongo_uri)
+            # Motor 클라이언트는 첫 요청 시점의 이벤트 루프에서 연결을 맺음
+            cls._client = AsyncIOMotorClient(
+                mongo_uri,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            )
         return cls._client
 
     @classmethod
-    def get_db(cls) -> Database:
+    def get_db(cls) -> AsyncIOMotorDatabase:
         if cls._db is None:
             client = cls.get_client()
             # 데이터베이스 이름을 환경 변수에서 가져오거나 기본값을 사용
@@ -27,8 +35,17 @@ class MongoDBConnection:
             cls._db = client[db_name]
         return cls._db
 
-def get_database() -> Database:
+    @classmethod
+    def close(cls) -> None:
+        """커넥션 풀을 닫습니다. (FastAPI lifespan 종료 시 호출)"""
+        if cls._client is not None:
+            cls._client.close()
+        cls._client = None
+        cls._db = None
+
+def get_database() -> AsyncIOMotorDatabase:
     """애플리케이션 전체에서 사용할 DB 인스턴스를 반환하는 의존성 주입용 함수"""
     return MongoDBConnection.get_db()
 
-print(MongoDBConnection.get_db())
\ No newline at end of file
+def close_database() -> None:
+    MongoDBConnection.close()
@@ -0,0 +1,90 @@
+"""
+places / polices 컬렉션의 인덱스를 관리합니다.
+
+애플리케이션 시작 시 ensure_indexes()가 호출되며, 이미 있는 인덱스는 그대로 둡니다.
+인덱스 사용 통계는 다음 명령으로 확인할 수 있습니다.
+
+    python -m app.db.indexes --stats
+"""
+import argparse
+import asyncio
+import logging
+from typing import Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    "places": [
+        # get_by_id 조회와 upsert 대상. 동시 upsert로 같은 장소 문서가 중복 생성되지 않도록 unique
+        IndexModel([("source.placeId", ASCENDING)], name="source_placeId_unique", unique=True),
+        # 갱신 스케줄러의 오래된 장소 조회
+        IndexModel([("source.lastFetchedAt", ASCENDING)], name="source_lastFetchedAt"),
+        IndexModel([("profile.category", ASCENDING)], name="profile_category"),
+    ],
+    "polices": [
+        IndexModel([("restaurant_id", ASCENDING), ("priority", DESCENDING)], name="restaurant_id_priority"),
+    ],
+}
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+    """
+    INDEX_SPECS의 인덱스를 생성합니다. 같은 이름과 정의의 인덱스가 이미 있으면 아무 일도 하지 않습니다.
+    한 컬렉션에서 실패해도(예: 기존 중복 문서로 unique 인덱스 생성 실패) 나머지 컬렉션은 계속 진행합니다.
+
+    Returns:
+        {컬렉션 이름: [생성(또는 확인)된 인덱스 이름]}
+    """
+    created: Dict[str, List[str]] = {}
+    for collection_name, indexes in INDEX_SPECS.items():
+        try:
+            created[collection_name] = await db[collection_name].create_indexes(indexes)
+        except OperationFailure as e:
+            logger.warning("'%s' 컬렉션 인덱스 생성 실패: %s", collection_name, e)
+            created[collection_name] = []
+    return created
+
+async def index_stats(db: AsyncIOMotorDatabase) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    $indexStats로 컬렉션별 인덱스 사용 횟수를 조회합니다.
+
+    Returns:
+        {컬렉션 이름: [{"name", "key", "ops", "since"}, ...]}
+    """
+    stats: Dict[str, List[Dict[str, Any]]] = {}
+    for collection_name in INDEX_SPECS:
+        cursor = db[collection_name].aggregate([{"$indexStats": {}}])
+        stats[collection_name] = [
+            {
+                "name": entry["name"],
+                "key": dict(entry["key"]),
+                "ops": entry["accesses"]["ops"],
+                "since": entry["accesses"]["since"],
+            }
+            for entry in await cursor.to_list(length=None)
+        ]
+    return stats
+
+async def _main(args: argparse.Namespace) -> None:
+    from .connection import get_database
+
+    db = get_database()
+    if args.ensure:
+        for collection_name, names in (await ensure_indexes(db)).items():
+            print(f"{collection_name}: {', '.join(names) or '-'}")
+    if args.stats:
+        for collection_name, entries in (await index_stats(db)).items():
+            print(f"[{collection_name}]")
+            for entry in sorted(entries, key=lambda e: e["ops"], reverse=True):
+                print(f"  {entry['name']:<28} ops={entry['ops']:<10} since={entry['since']:%Y-%m-%d %H:%M}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MongoDB 인덱스 관리")
+    parser.add_argument("--ensure", action="store_true", help="정의된 인덱스를 생성합니다.")
+    parser.add_argument("--stats", action="store_true", help="인덱스 사용 통계를 출력합니다.")
+    parsed = parser.parse_args()
+    if not (parsed.ensure or parsed.stats):
+        parser.error("--ensure 또는 --stats 중 하나 이상을 지정하세요.")
+    asyncio.run(_main(parsed))
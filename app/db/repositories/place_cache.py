@@ -0,0 +1,115 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Set, Callable, Awaitable
+from ...core.config import settings
+from ...services.monitoring.metrics import metrics
+
+class PlaceCache:
+    """
+    장소 문서의 프로세스 내부 read-through 캐시.
+    최대 max_entries개까지 LRU로 보관하고 ttl초가 지나면 다시 조회합니다.
+    항목은 (place_id, projection) 단위로 보관하며, 무효화는 장소의 모든 projection에 적용됩니다.
+    같은 장소를 동시에 조회하면 DB 조회는 한 번만 하고 나머지는 그 결과를 기다립니다.
+    호출자가 결과를 수정해도 캐시가 바뀌지 않도록 항상 복사본을 반환합니다.
+    """
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or settings.PLACE_CACHE_MAX_ENTRIES
+        self.ttl = settings.PLACE_CACHE_TTL if ttl is None else ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # place_id -> 캐시된 projection 이름들
+        self._projections: Dict[str, Set[str]] = {}
+        # (place_id, projection) -> [lock, 사용 중인 코루틴 수]
+        self._locks: Dict[Tuple[str, str], list] = {}
+        # 조회 중에 무효화된 결과를 저장하지 않기 위한 장소별 버전
+        self._versions: Dict[str, int] = {}
+
+    async def get_or_load(
+        self,
+        place_id: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        projection: str = "full",
+    ) -> Optional[Dict[str, Any]]:
+        key = (place_id, projection)
+        doc = self._lookup(key)
+        if doc is not None:
+            metrics.increment("place_cache.hits")
+            return copy.deepcopy(doc)
+
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                doc = self._lookup(key)
+                if doc is not None:
+                    # 먼저 조회한 코루틴이 채워 넣은 결과
+                    metrics.increment("place_cache.hits")
+                    metrics.increment("place_cache.coalesced")
+                    return copy.deepcopy(doc)
+
+                metrics.increment("place_cache.misses")
+                version = self._versions.get(place_id, 0)
+                doc = await loader()
+                if doc is not None and self._versions.get(place_id, 0) == version:
+                    self._store(key, doc)
+                return copy.deepcopy(doc)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._locks.pop(key, None)
+
+    def invalidate(self, place_id: str) -> None:
+        """장소 문서가 바뀌었을 때 호출합니다. 진행 중인 조회 결과도 저장되지 않습니다."""
+        self._versions[place_id] = self._versions.get(place_id, 0) + 1
+        for projection in self._projections.pop(place_id, set()):
+            if self._entries.pop((place_id, projection), None) is not None:
+                metrics.increment("place_cache.invalidations")
+        if not any(key[0] == place_id for key in self._locks):
+            self._versions.pop(place_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._projections.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        counters = metrics.snapshot("place_cache.")
+        hits = counters.get("place_cache.hits", 0)
+        lookups = hits + counters.get("place_cache.misses", 0)
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "counters": counters,
+        }
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, doc = entry
+        if expires_at <= time.monotonic():
+            self._forget(key)
+            return None
+        self._entries.move_to_end(key)
+        return doc
+
+    def _store(self, key: Tuple[str, str], doc: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(doc))
+        self._entries.move_to_end(key)
+        self._projections.setdefault(key[0], set()).add(key[1])
+        while len(self._entries) > self.max_entries:
+            self._forget(next(iter(self._entries)))
+            metrics.increment("place_cache.evictions")
+
+    def _forget(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        projections = self._projections.get(key[0])
+        if projections is not None:
+            projections.discard(key[1])
+            if not projections:
+                del self._projections[key[0]]
+
+# 싱글턴 인스턴스 생성
+place_cache = PlaceCache()
@@ -1,18 +1,109 @@
-from pymongo.database import Database
-from typing import Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from ...core.config import settings
 from ...models.place import Place
+from .place_cache import PlaceCache, place_cache
+
+_MISSING = object()
+
+def _get_path(doc: Optional[Dict[str, Any]], path: str) -> Any:
+    """점(.)으로 구분된 경로의 값을 문서에서 찾습니다. 없으면 _MISSING."""
+    value: Any = doc
+    for key in path.split("."):
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return _MISSING
+    return value
+
+def _diff(path: str, old: Any, new: Any, changes: List[Dict[str, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in new:
+            _diff(f"{path}.{key}", old.get(key, _MISSING), new[key], changes)
+        for key in old:
+            if key not in new:
+                changes.append({"op": "unset", "path": f"{path}.{key}", "old": old[key], "new": None})
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        # 길이가 같으면 항목별로 비교하여 바뀐 위치만 갱신
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff(f"{path}.{index}", old_item, new_item, changes)
+    elif old is _MISSING or old != new:
+        changes.append({"op": "set", "path": path, "old": None if old is _MISSING else old, "new": new})
+
+def build_changeset(current: Optional[Dict[str, Any]], update_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    저장된 문서와 정규화된 동기화 결과를 비교하여 실제로 바뀐 경로만 반환합니다.
+    예: 메뉴 하나의 가격만 바뀌면 'restaurant.menu.3.price' 하나만 포함됩니다.
+
+    Returns:
+        [{"op": "set" | "unset", "path": str, "old": Any, "new": Any}, ...]
+    """
+    changes: List[Dict[str, Any]] = []
+    for path, new_value in update_data.items():
+        _diff(path, _get_path(current, path), new_value, changes)
+    return changes
+
+def _overlaps(path: str, other: str) -> bool:
+    """두 경로가 같거나 한쪽이 다른 쪽의 상위 경로인지 확인합니다. (같은 update에 함께 쓰면 충돌)"""
+    return path == other or path.startswith(other + ".") or other.startswith(path + ".")
+
+def _skeleton(category: str) -> Dict[str, Any]:
+    """
+    새 장소 문서의 기본 필드를 점 경로로 반환합니다.
+    source.placeId는 upsert 필터의 값이 그대로 들어가므로 포함하지 않습니다.
+    """
+    return {
+        "source.platform": "naver",
+        "profile.category": [category],
+    }
+
+# 질문 종류별로 필요한 필드만 조회하기 위한 이름 있는 projection (full은 문서 전체)
+PROJECTIONS: Dict[str, Optional[Dict[str, int]]] = {
+    "full": None,
+    "profile": {"source.placeId": 1, "source.lastFetchedAt": 1, "profile": 1},
+    "hours": {"source.placeId": 1, "source.lastFetchedAt": 1, "profile.name": 1, "hours": 1},
+    "menu": {"source.placeId": 1, "source.lastFetchedAt": 1, "profile.name": 1, "restaurant.menu": 1},
+    "congestion": {"source.placeId": 1, "source.lastFetchedAt": 1, "profile.name": 1, "popularTimes": 1},
+    # 답변 캐시의 버전 확인용 (내용이 바뀔 때만 lastChangedAt이 갱신됨)
+    "version": {"source.placeId": 1, "source.lastChangedAt": 1},
+}
+# 서버 내부에서만 쓰는 projection (API와 에이전트 도구에는 노출하지 않음)
+INTERNAL_PROJECTIONS = {"version"}
 
 class PlaceRepository:
-    def __init__(self, db: Database):
+    def __init__(self, db: AsyncIOMotorDatabase, cache: Optional[PlaceCache] = None):
         self.db = db
         self.collection = self.db["places"]
+        # 장소 문서 read-through 캐시. 이 저장소로 쓰는 모든 장소는 쓰기 후 캐시에서 제거됨
+        self.cache = cache or (place_cache if settings.PLACE_CACHE_ENABLED else None)
+
+    async def get_by_id(self, place_id: str, projection: str = "full", use_cache: bool = True) -> Dict[str, Any]:
+        """
+        ID로 장소 정보를 조회합니다.
+        projection을 지정하면 PROJECTIONS에 정의된 필드만 가져옵니다. (예: "hours", "menu")
+        use_cache가 False이면 캐시를 거치지 않고 DB에서 직접 조회합니다. (동기화 비교용)
+        """
+        if projection not in PROJECTIONS:
+            raise ValueError(f"알 수 없는 projection입니다: {projection} (가능한 값: {', '.join(PROJECTIONS)})")
 
-    def get_by_id(self, place_id: str) -> Dict[str, Any]:
-        """ID로 장소 정보를 조회합니다."""
-        return self.collection.find_one({"source.placeId": place_id})
+        def load():
+            return self.collection.find_one({"source.placeId": place_id}, PROJECTIONS[projection])
 
-    def create_or_update_place(self, place_id: str, category: str) -> Dict[str, Any]:
+        if self.cache is None or not use_cache:
+            return await load()
+        return await self.cache.get_or_load(place_id, load, projection=projection)
+
+    def invalidate(self, place_id: str) -> None:
+        """장소 문서가 바뀌었으므로 캐시된 문서를 버립니다."""
+        if self.cache is not None:
+            self.cache.invalidate(place_id)
+
+    async def create_or_update_place(self, place_id: str, category: str) -> Dict[str, Any]:
         """
         초기 동기화를 위해 장소 문서를 생성하거나, 이미 존재하면 업데이트하지 않습니다.
         """
@@ -27,22 +118,157 @@ class PlaceRepository:
             }
         }
         # $setOnInsert는 문서가 새로 생성될 때만 값을 설정합니다.
-        self.collection.update_one(
+        await self.collection.update_one(
             {"source.placeId": place_id},
             {"$setOnInsert": place_doc},
             upsert=True
         )
-        return self.get_by_id(place_id)
+        self.invalidate(place_id)
+        return await self.get_by_id(place_id)
+
+    async def find_refresh_candidates(self, fetched_before: datetime, limit: int) -> List[Dict[str, Any]]:
+        """
+        마지막 fetch 시간이 fetched_before 이전인 장소를 오래된 순으로 조회합니다.
+        스케줄러 우선순위 계산에 필요한 필드만 가져옵니다.
+        """
+        cursor = self.collection.find(
+            {"source.lastFetchedAt": {"$lt": fetched_before}},
+            {"source.placeId": 1, "source.lastFetchedAt": 1, "source.changeHistory": 1, "profile.category": 1},
+        ).sort("source.lastFetchedAt", 1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def touch_last_fetched(self, place_id: str) -> int:
+        """
+        내용 변경이 없을 때 마지막 fetch 시간만 갱신합니다.
+        """
+        result = await self.collection.update_one(
+            {"source.placeId": place_id},
+            {"$set": {"source.lastFetchedAt": datetime.utcnow()}}
+        )
+        self.invalidate(place_id)
+        return result.modified_count
 
-    def update_synced_data(self, place_id: str, update_data: Dict[str, Any]) -> int:
+    async def update_synced_data(self, place_id: str, update_data: Dict[str, Any]) -> int:
         """
         동기화 파이프라인을 통해 수집된 정규화된 데이터로 장소 문서를 업데이트합니다.
         """
         # 마지막 fetch 시간을 현재로 갱신
         update_data["source.lastFetchedAt"] = datetime.utcnow()
 
-        result = self.collection.update_one(
+        result = await self.collection.update_one(
             {"source.placeId": place_id},
             {"$set": update_data}
         )
-        return result.modified_count
\ No newline at end of file
+        self.invalidate(place_id)
+        return result.modified_count
+
+    def _delta_update(
+        self,
+        update_data: Dict[str, Any],
+        current: Optional[Dict[str, Any]],
+        changed_pages: Optional[List[str]],
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """저장된 문서와 비교하여 (update 문서, 변경 내역)을 만듭니다."""
+        changes = build_changeset(current, update_data)
+        update: Dict[str, Any] = {"$set": {"source.lastFetchedAt": datetime.utcnow()}}
+        for change in changes:
+            if change["op"] == "unset":
+                update.setdefault("$unset", {})[change["path"]] = ""
+            else:
+                update["$set"][change["path"]] = change["new"]
+        if changed_pages:
+            update["$push"] = {"source.changeHistory": {
+                "$each": [{"at": update["$set"]["source.lastFetchedAt"], "pages": sorted(changed_pages)}],
+                "$slice": -settings.SYNC_CHANGE_HISTORY_SIZE,
+            }}
+        return update, changes
+
+    def build_sync_upsert(
+        self,
+        place_id: str,
+        category: str,
+        update_data: Dict[str, Any],
+        current: Optional[Dict[str, Any]] = None,
+        changed_pages: Optional[List[str]] = None,
+    ) -> Tuple[UpdateOne, List[Dict[str, Any]]]:
+        """
+        문서가 없으면 기본 필드와 함께 생성하고, 있으면 바뀐 경로만 갱신하는 upsert 연산을 만듭니다.
+        $set/$unset 경로와 겹치는 기본 필드는 $setOnInsert에서 제외합니다.
+
+        Returns:
+            (bulk_write에 그대로 넣을 수 있는 UpdateOne 연산, 변경 내역)
+        """
+        update, changes = self._delta_update(update_data, current, changed_pages)
+        written = [path for operator in update.values() for path in operator]
+        set_on_insert = {
+            path: value for path, value in _skeleton(category).items()
+            if not any(_overlaps(path, other) for other in written)
+        }
+        if set_on_insert:
+            update["$setOnInsert"] = set_on_insert
+        return UpdateOne({"source.placeId": place_id}, update, upsert=True), changes
+
+    def build_touch(self, place_id: str) -> UpdateOne:
+        """내용 변경이 없을 때 마지막 fetch 시간만 갱신하는 연산을 만듭니다."""
+        return UpdateOne({"source.placeId": place_id}, {"$set": {"source.lastFetchedAt": datetime.utcnow()}})
+
+    async def update_synced_delta(
+        self,
+        place_id: str,
+        update_data: Dict[str, Any],
+        current: Optional[Dict[str, Any]] = None,
+        changed_pages: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        저장된 문서와 비교하여 바뀐 필드 경로만 $set/$unset 합니다.
+        배열 전체를 다시 쓰지 않으므로 oplog 크기가 줄어듭니다.
+
+        Args:
+            place_id: 네이버 플레이스 ID
+            update_data: 정규화된 동기화 결과 ({경로: 값})
+            current: 이미 조회한 현재 문서. 없으면 DB에서 조회합니다.
+            changed_pages: 내용이 바뀐 페이지 목록. 있으면 source.changeHistory에 기록합니다.
+
+        Returns:
+            {"modified_count": int, "changes": [...]} 형태의 변경 내역
+        """
+        if current is None:
+            current = await self.get_by_id(place_id, use_cache=False) or {}
+
+        update, changes = self._delta_update(update_data, current, changed_pages)
+        result = await self.collection.update_one({"source.placeId": place_id}, update)
+        self.invalidate(place_id)
+        return {"modified_count": result.modified_count, "changes": changes}
+
+    async def upsert_synced_delta(
+        self,
+        place_id: str,
+        category: str,
+        update_data: Dict[str, Any],
+        current: Optional[Dict[str, Any]] = None,
+        changed_pages: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        문서 생성과 동기화 결과 반영을 한 번의 upsert로 처리합니다.
+        current는 동기화 시작 시 조회한 문서이며, 새 장소라면 None입니다.
+
+        Returns:
+            {"modified_count": int, "upserted": bool, "changes": [...]}
+        """
+        operation, changes = self.build_sync_upsert(place_id, category, update_data, current, changed_pages)
+        # 연산 하나짜리 bulk_write도 update_one과 같은 한 번의 왕복
+        result = await self.collection.bulk_write([operation])
+        self.invalidate(place_id)
+        return {
+            "modified_count": result.modified_count,
+            "upserted": bool(result.upserted_count),
+            "changes": changes,
+        }
+
+    async def bulk_write(self, operations: List[Any]) -> BulkWriteResult:
+        """
+        여러 장소의 갱신을 한 번의 비순차(unordered) bulk_write로 반영합니다.
+        한 연산이 실패해도 나머지 연산은 계속 적용됩니다.
+        캐시 무효화는 호출자가 장소별로 invalidate()를 호출해야 합니다.
+        """
+        return await self.collection.bulk_write(operations, ordered=False)
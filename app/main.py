@@ -1,18 +1,68 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .api.v1 import agents, places, chat, policies
+from .api.v1 import agents, places, chat, policies, monitoring
+from .services.crawler.client import get_shared_client, close_shared_client
+from .services.sync.job_queue import sync_job_queue
+from .services.sync.scheduler import refresh_scheduler
+from .services.sync.write_batcher import place_write_batcher
+from .core.config import settings
+from .db.connection import get_database, close_database
+from .db.indexes import ensure_indexes
+from .db.repositories.place_repository import PlaceRepository
+from pymongo.errors import PyMongoError
 from fastapi.staticfiles import StaticFiles
+import asyncio
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+def _firecrawl_available() -> bool:
+    """Firecrawl 호출이 가능한지 확인합니다. (API 키가 있거나 replay 모드)"""
+    return bool(os.getenv("FIRECRAWL_API_KEY")) or settings.FIRECRAWL_MODE == "replay"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 공유 리소스를 열고 닫습니다."""
+    # 조회/upsert에 필요한 인덱스 생성 (이미 있으면 그대로 둠)
+    if settings.MONGO_ENSURE_INDEXES and os.getenv("MONGO_URI"):
+        try:
+            await ensure_indexes(get_database())
+        except PyMongoError as e:
+            logger.warning("인덱스 생성을 건너뜁니다: %s", e)
+    # Firecrawl 공유 세션(커넥션 풀) 생성
+    if _firecrawl_available():
+        await get_shared_client().start()
+    # 워커들의 DB 쓰기를 bulk_write로 묶어서 전송
+    await place_write_batcher.start(lambda: PlaceRepository(get_database()))
+    # 일괄 동기화 워커 풀 시작
+    await sync_job_queue.start(lambda: places.get_sync_pipeline(get_database()))
+    # 오래된 장소 자동 갱신
+    if settings.REFRESH_SCHEDULER_ENABLED and _firecrawl_available():
+        await refresh_scheduler.start(lambda: PlaceRepository(get_database()))
+    # 첫 질문의 지연을 없애고 싶으면 워커가 fork된 뒤 여기서 에이전트를 미리 생성
+    if settings.AGENT_PRELOAD and os.getenv("OPENAI_API_KEY"):
+        from .services.agent.graph import get_agent
+        await asyncio.to_thread(get_agent)
+    yield
+    await refresh_scheduler.stop()
+    await sync_job_queue.stop()
+    await place_write_batcher.stop()
+    await close_shared_client()
+    close_database()
+
 app = FastAPI(
     title="AI Agent Service",
     description="가게 정보를 수집하고 고객 문의에 응답하는 AI 에이전트 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # API V1 라우터 포함
 app.include_router(places.router, prefix="/api/v1", tags=["Places"])
 app.include_router(agents.router, prefix="/api/v1", tags=["AI Agent"])
 app.include_router(policies.router, prefix="/api/v1/policies", tags=["Policies"])
+app.include_router(monitoring.router, prefix="/api/v1", tags=["Monitoring"])
 app.include_router(chat.router, tags=["Chat UI"]) # chat 라우터 추가
 app.mount("/static",     StaticFiles(directory=os.path.join("app", "static")), name="static")
 
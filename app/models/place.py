@@ -8,6 +8,11 @@ class Source(BaseModel):
     placeId: str
     lastFetchedAt: datetime = Field(default_factory=datetime.utcnow)
     sourceUrl: Optional[HttpUrl] = None
+    # 페이지별(home, menu, ...) 마지막으로 크롤링한 content의 해시
+    contentHashes: Dict[str, str] = {}
+    lastChangedAt: Optional[datetime] = None
+    # 최근 내용 변경 기록 ({"at": datetime, "pages": [...]})
+    changeHistory: List[Dict[str, Any]] = []
 
 class Coordinates(BaseModel):
     lat: float
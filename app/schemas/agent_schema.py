@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel
 
 class AgentQueryRequest(BaseModel):
@@ -11,3 +12,4 @@ class AgentQueryResponse(BaseModel):
     place_id: str
     query: str
     answer: str
+    route: Optional[str] = None  # 답변 경로: fast_path(템플릿), cache(답변 캐시), llm
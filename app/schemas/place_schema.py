@@ -1,15 +1,53 @@
 from pydantic import BaseModel, HttpUrl
-from typing import List, Optional
+from typing import List, Optional, Dict, Literal
+from datetime import datetime
 from app.models.place import Place # DB 모델을 직접 재사용하거나 API용 모델을 따로 정의할 수 있습니다.
 
+# PlaceRepository.PROJECTIONS에서 INTERNAL_PROJECTIONS를 뺀 이름과 같아야 함
+PlaceProjection = Literal["full", "profile", "hours", "menu", "congestion"]
+
 class PlaceSyncRequest(BaseModel):
     """장소 데이터 동기화 요청 스키마"""
     url: HttpUrl
+    force: bool = False  # True이면 최소 갱신 간격을 무시하고 다시 크롤링
 
 class PlaceSyncResponse(BaseModel):
     """장소 데이터 동기화 응답 스키마"""
     message: str
     place_id: str
+    job_id: Optional[str] = None
+
+class PlaceBatchSyncRequest(BaseModel):
+    """여러 장소 일괄 동기화 요청 스키마 (URL 또는 placeId 목록)"""
+    items: List[str]
+    force: bool = False
+
+class PlaceBatchSyncResponse(BaseModel):
+    """일괄 동기화 요청 응답 스키마"""
+    message: str
+    job_id: str
+    accepted: int
+    duplicates: int
+    invalid: List[str] = []
+
+class PlaceSyncProgress(BaseModel):
+    """작업 내 장소별 동기화 진행 상태"""
+    place_id: str
+    category: str
+    status: str
+    attempts: int
+    error: Optional[str] = None
+    deduplicated: bool = False  # 이미 진행 중인 동기화를 공유한 경우
+    updated_at: datetime
+
+class SyncJobResponse(BaseModel):
+    """동기화 작업 상태 조회 응답 스키마"""
+    job_id: str
+    status: str
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    counts: Dict[str, int]
+    places: List[PlaceSyncProgress]
 
 class PlaceResponse(Place):
     """
@@ -0,0 +1,82 @@
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+
+# 뜻이 같은 질문을 같은 키로 묶기 위해 제거하는 문장 끝 표현 (긴 것부터 검사)
+_POLITE_SUFFIXES = ("알려주세요", "알려줘요", "알려줘", "주세요", "줘요", "줘", "인가요", "나요", "요")
+
+AnswerKey = Tuple[str, str, str]
+
+def normalize_query(query: str) -> str:
+    """
+    질문을 캐시 키로 쓰기 위해 정규화합니다.
+    대소문자, 공백, 문장 부호, 끝맺음 표현의 차이를 무시합니다.
+    예: "영업시간 알려줘", "영업 시간 알려주세요?" -> "영업시간"
+    """
+    text = re.sub(r"[\W_]+", "", query.lower())
+    for suffix in _POLITE_SUFFIXES:
+        if text.endswith(suffix) and len(text) > len(suffix):
+            text = text[: -len(suffix)]
+            break
+    return text
+
+def _version_stamp(version: Any) -> str:
+    if isinstance(version, datetime):
+        return version.isoformat()
+    return "" if version is None else str(version)
+
+class AnswerCache:
+    """
+    에이전트 답변 캐시.
+    키는 (place_id, 정규화된 질문, 장소 문서 버전)이므로 동기화로 문서 내용이 바뀌면
+    (source.lastChangedAt 갱신) 이전 답변은 더 이상 조회되지 않고 LRU에서 밀려납니다.
+    최대 max_entries개까지 보관하며 ttl초가 지나면 다시 생성합니다.
+    """
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or settings.ANSWER_CACHE_MAX_ENTRIES
+        self.ttl = settings.ANSWER_CACHE_TTL if ttl is None else ttl
+        self._entries: "OrderedDict[AnswerKey, Tuple[float, str]]" = OrderedDict()
+
+    def make_key(self, place_id: str, query: str, version: Any) -> AnswerKey:
+        return (place_id, normalize_query(query), _version_stamp(version))
+
+    def get(self, key: AnswerKey) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            metrics.increment("answer_cache.misses")
+            return None
+        self._entries.move_to_end(key)
+        metrics.increment("answer_cache.hits")
+        return entry[1]
+
+    def set(self, key: AnswerKey, answer: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            metrics.increment("answer_cache.evictions")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        counters = metrics.snapshot("answer_cache.")
+        hits = counters.get("answer_cache.hits", 0)
+        lookups = hits + counters.get("answer_cache.misses", 0)
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "counters": counters,
+        }
+
+# 싱글턴 인스턴스 생성
+answer_cache = AnswerCache()
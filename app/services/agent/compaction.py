@@ -0,0 +1,183 @@
+import copy
+import json
+import math
+from typing import Dict, Any, Optional, Tuple
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+from .intent_classifier import intent_classifier
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 글자 수로 토큰 수를 추정
+    tiktoken = None
+
+# LLM이 답변에 쓰지 않는 내부 필드 (동기화/캐시용)
+INTERNAL_FIELDS = [
+    "_id",
+    "source.contentHashes",
+    "source.changeHistory",
+    "source.lastChangedAt",
+    "popularTimes.sources",
+    "popularTimes.lastComputedAt",
+]
+
+# 예산을 넘을 때 줄여 나갈 목록 (앞의 것부터)
+TRUNCATABLE_LISTS = ["popularTimes.hourly", "restaurant.menu", "hours"]
+
+# 의도별로 마지막까지 남길 목록 (projection이 full일 때 질문과 관계있는 목록을 가장 나중에 자름)
+INTENT_LISTS = {
+    "hours": "hours",
+    "menu": "restaurant.menu",
+    "congestion": "popularTimes.hourly",
+}
+
+_encoding = None
+_encoding_failed = False
+
+def count_tokens(text: str) -> int:
+    """
+    text의 토큰 수를 셉니다. tiktoken 인코딩을 쓸 수 없으면
+    UTF-8 바이트 수로 넉넉하게 추정합니다. (한글 한 글자 ≈ 1토큰)
+    """
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed and tiktoken is not None:
+        try:
+            _encoding = tiktoken.get_encoding(settings.TOOL_OUTPUT_TOKENIZER)
+        except Exception:
+            # 인코딩 파일을 받을 수 없는 환경에서는 매번 다시 시도하지 않음
+            _encoding_failed = True
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+def truncate_text(text: str, budget: int) -> str:
+    """text를 budget 토큰 이하가 되도록 뒷부분을 잘라냅니다. (글자 수가 아니라 토큰 수 기준)"""
+    tokens = count_tokens(text)
+    if tokens <= budget:
+        return text
+    if _encoding is not None:
+        return _encoding.decode(_encoding.encode(text)[:budget])
+    while tokens > budget and text:
+        text = text[: int(len(text) * budget / tokens)]
+        tokens = count_tokens(text)
+    return text
+
+def dumps_compact(value: Any) -> str:
+    """공백 없는 JSON으로 직렬화합니다. 한글은 이스케이프하지 않습니다. (\\uXXXX는 토큰을 몇 배로 씀)"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+def _get(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+def _pop(doc: Dict[str, Any], path: str) -> None:
+    *parents, last = path.split(".")
+    for key in parents:
+        doc = doc.get(key) if isinstance(doc, dict) else None
+        if doc is None:
+            return
+    if isinstance(doc, dict):
+        doc.pop(last, None)
+
+def _is_empty(value: Any) -> bool:
+    # 0은 의미 있는 값(점수, 가격)이므로 남김
+    return value is None or value is False or (isinstance(value, (str, list, dict)) and not value)
+
+def _drop_empty(value: Any) -> Any:
+    """None, 빈 문자열/목록/객체와 False 플래그를 제거합니다."""
+    if isinstance(value, dict):
+        cleaned = {key: _drop_empty(item) for key, item in value.items()}
+        return {key: item for key, item in cleaned.items() if not _is_empty(item)}
+    if isinstance(value, list):
+        return [_drop_empty(item) for item in value]
+    return value
+
+def prune_place(place_doc: Dict[str, Any], projection: str = "full") -> Dict[str, Any]:
+    """
+    장소 문서에서 답변에 필요 없는 필드를 제거합니다.
+    질문과 관계없어 보이는 섹션도 지우지 않습니다. (의도를 잘못 판단하면 LLM이 답할 정보가 사라짐)
+    """
+    doc = copy.deepcopy(place_doc)
+    for path in INTERNAL_FIELDS:
+        _pop(doc, path)
+    if projection != "congestion":
+        # 시간대별 혼잡도는 혼잡도 질문에서만 사용
+        _pop(doc, "popularTimes.hourly")
+    return _drop_empty(doc)
+
+def _keep_last(projection: str, query: str) -> Optional[str]:
+    """projection이 full이고 질문의 의도가 분명하면 그 의도의 목록을 반환합니다."""
+    if projection != "full" or not query:
+        return None
+    result = intent_classifier.classify(query)
+    if result["intent"] in INTENT_LISTS and result["confidence"] >= settings.AGENT_FAST_PATH_MIN_CONFIDENCE:
+        return INTENT_LISTS[result["intent"]]
+    return None
+
+def truncate_to_budget(doc: Dict[str, Any], budget: int, keep_last: Optional[str] = None) -> Tuple[str, int, bool]:
+    """
+    직렬화한 결과가 budget 토큰 안에 들어오도록 긴 목록의 뒷부분을 잘라냅니다.
+    keep_last로 지정한 목록은 다른 목록을 모두 줄인 뒤에 자릅니다.
+    잘라낸 항목 수는 "_truncated"에 기록하여 LLM이 정보가 더 있음을 알 수 있게 합니다.
+
+    Returns:
+        (직렬화된 문자열, 토큰 수, 잘렸는지 여부)
+    """
+    text = dumps_compact(doc)
+    tokens = count_tokens(text)
+    if tokens <= budget:
+        return text, tokens, False
+
+    doc = copy.deepcopy(doc)
+    omitted: Dict[str, int] = {}
+    order = [path for path in TRUNCATABLE_LISTS if path != keep_last]
+    if keep_last in TRUNCATABLE_LISTS:
+        order.append(keep_last)
+    for path in order:
+        items = _get(doc, path)
+        if not isinstance(items, list):
+            continue
+        original = len(items) + omitted.get(path, 0)
+        while items and tokens > budget:
+            # 넘친 비율만큼 한 번에 줄여서 토큰 계산 횟수를 줄임
+            keep = min(len(items) - 1, int(len(items) * budget / tokens))
+            del items[max(keep, 0):]
+            omitted[path] = original - len(items)
+            doc["_truncated"] = omitted
+            text = dumps_compact(doc)
+            tokens = count_tokens(text)
+        if tokens <= budget:
+            return text, tokens, True
+
+    # 목록을 모두 비워도 넘치면 문자열을 자름
+    text = truncate_text(text, budget)
+    return text, count_tokens(text), True
+
+def compact_tool_output(
+    place_doc: Dict[str, Any],
+    projection: str = "full",
+    query: str = "",
+    budget: Optional[int] = None,
+) -> str:
+    """
+    get_place_information 결과를 LLM에 넣기 좋게 압축합니다.
+    불필요한 필드 제거 -> 공백 없는 JSON -> 토큰 예산에 맞게 자르기 순서로 처리하고,
+    토큰 수를 agent.tool_output.* 지표로 기록합니다.
+    query는 예산을 넘을 때 질문과 관계있는 목록을 가장 나중에 자르는 데만 사용합니다.
+    """
+    budget = settings.TOOL_OUTPUT_TOKEN_BUDGET if budget is None else budget
+    raw_tokens = count_tokens(dumps_compact(place_doc))
+    text, tokens, truncated = truncate_to_budget(
+        prune_place(place_doc, projection), budget, keep_last=_keep_last(projection, query)
+    )
+
+    metrics.increment("agent.tool_output.calls")
+    metrics.increment("agent.tool_output.raw_tokens", raw_tokens)
+    metrics.increment("agent.tool_output.tokens", tokens)
+    if truncated:
+        metrics.increment("agent.tool_output.truncated")
+    return text
@@ -1,13 +1,15 @@
 import os
-from typing import TypedDict, Annotated, Optional
+import asyncio
+from typing import TypedDict, Annotated, Optional, AsyncIterator, Dict, Any
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, ToolMessage
-from langchain_core.pydantic_v1 import BaseModel
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 
-from .tools import get_place_information, generate_llms_txt_for_place
+from .tools import get_place_information, generate_llms_txt_for_place, search_place_documents
+from .compaction import count_tokens
+from ..monitoring.metrics import metrics
 from ...models.place import Place
 
 # LangChain이 Pydantic V1을 사용하므로, V2 모델을 V1으로 변환하는 설정
@@ -22,7 +24,7 @@ class AgentState(TypedDict):
 class Agent:
     def __init__(self):
         llm = ChatOpenAI(model="gpt-4o")
-        self.tools = [get_place_information, generate_llms_txt_for_place]
+        self.tools = [get_place_information, generate_llms_txt_for_place, search_place_documents]
         self.model = llm.bind_tools(self.tools)
         self.graph = self._build_graph()
 
@@ -39,28 +41,90 @@ class Agent:
         workflow.add_edge("tools", "llm")
         return workflow.compile()
 
-    def call_llm(self, state: AgentState):
+    async def call_llm(self, state: AgentState):
         messages = state["messages"]
-        response = self.model.invoke(messages)
+        response = await self.model.ainvoke(messages)
+        self._record_usage(messages, response)
         return {"messages": [response]}
 
+    @staticmethod
+    def _record_usage(messages: list, response: BaseMessage) -> None:
+        """LLM 호출마다 프롬프트/응답 토큰 수를 agent.tokens.* 지표로 기록합니다."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        # 응답에 사용량이 없으면(일부 모델/모의 객체) 메시지 내용으로 추정
+        input_tokens = usage.get("input_tokens") or sum(count_tokens(str(m.content)) for m in messages)
+        metrics.increment("agent.llm_calls")
+        metrics.increment("agent.tokens.input", input_tokens)
+        metrics.increment("agent.tokens.output", usage.get("output_tokens") or count_tokens(str(response.content)))
+
     def should_continue(self, state: AgentState):
         last_message = state["messages"][-1]
         if last_message.tool_calls:
             return "continue"
         return "end"
 
-    def run(self, place_id: str, query: str, category: str):
-        """에이전트를 실행합니다."""
+    def _initial_state(self, place_id: str, query: str, category: str) -> AgentState:
         initial_query = f"장소 ID '{place_id}' (카테고리: {category})에 대한 요청: {query}"
         
-        initial_state = AgentState(
+        return AgentState(
             messages=[("user", initial_query)],
             place_id=place_id,
             category=category, # 초기 상태에 카테고리 설정
             tool_outputs={}
         )
-        final_state = self.graph.invoke(initial_state)
+
+    async def arun(self, place_id: str, query: str, category: str):
+        """에이전트를 비동기로 실행합니다. 도구의 DB 조회도 이벤트 루프를 막지 않습니다."""
+        metrics.increment("agent.turns")
+        final_state = await self.graph.ainvoke(self._initial_state(place_id, query, category))
         return final_state['messages'][-1].content
 
-agent = Agent()
+    async def astream(self, place_id: str, query: str, category: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        에이전트를 실행하면서 진행 상황을 이벤트로 내보냅니다.
+
+        Yields:
+            {"type": "token", "content": str}: LLM 답변 토큰
+            {"type": "tool_start", "name": str, "args": dict}: 도구 호출 시작
+            {"type": "tool_end", "name": str}: 도구 호출 완료
+            {"type": "done", "answer": str}: 최종 답변
+        """
+        metrics.increment("agent.turns")
+        answer = ""
+        async for mode, chunk in self.graph.astream(
+            self._initial_state(place_id, query, category),
+            stream_mode=["messages", "updates"],
+        ):
+            if mode == "messages":
+                message, metadata = chunk
+                # 도구 결과(ToolMessage)는 제외하고 LLM이 생성 중인 텍스트만 전달
+                if metadata.get("langgraph_node") == "llm" and isinstance(message.content, str) and message.content:
+                    yield {"type": "token", "content": message.content}
+                continue
+
+            for node, update in chunk.items():
+                for message in (update or {}).get("messages", []):
+                    if node == "llm":
+                        for call in message.tool_calls:
+                            yield {"type": "tool_start", "name": call["name"], "args": call["args"]}
+                        if not message.tool_calls:
+                            answer = message.content
+                    elif node == "tools" and isinstance(message, ToolMessage):
+                        yield {"type": "tool_end", "name": message.name}
+        yield {"type": "done", "answer": answer}
+
+    def run(self, place_id: str, query: str, category: str):
+        """이벤트 루프 밖(스크립트 등)에서 에이전트를 실행합니다."""
+        return asyncio.run(self.arun(place_id, query, category))
+
+_agent: Optional[Agent] = None
+
+def get_agent() -> Agent:
+    """
+    애플리케이션 전체에서 공유하는 Agent 인스턴스를 반환합니다.
+    ChatOpenAI 생성과 그래프 컴파일은 처음 호출될 때 한 번만 수행됩니다.
+    """
+    global _agent
+    if _agent is None:
+        _agent = Agent()
+    return _agent
@@ -0,0 +1,106 @@
+import re
+from typing import Dict, Any, List
+
+# 의도별 키워드. 질문에 포함되면 해당 의도로 분류합니다.
+INTENT_KEYWORDS: Dict[str, List[str]] = {
+    "hours": [
+        "영업시간", "영업 시간", "운영시간", "운영 시간", "몇 시", "몇시", "언제 열", "언제 닫",
+        "문 열", "문 닫", "오픈 시간", "오픈시간", "마감 시간", "마감시간", "브레이크",
+        "라스트오더", "라스트 오더", "휴무", "쉬는 날",
+    ],
+    "menu": [
+        "메뉴", "얼마", "뭐 팔", "뭘 팔", "뭐가 있",
+    ],
+    "congestion": [
+        "혼잡", "붐비", "사람 많", "사람이 많", "북적", "웨이팅", "대기 시간", "대기시간", "줄 서", "줄서", "한산",
+    ],
+}
+
+# 다른 뜻으로도 자주 쓰이는 일반 단어 (예: "대기업", "오픈 이벤트", "판매자")
+# 단어 단위로만 일치시키며, 질문 표현이 함께 있어야 높은 confidence를 줌
+WEAK_KEYWORDS: Dict[str, List[str]] = {
+    "hours": ["오픈", "마감"],
+    "menu": ["가격", "판매"],
+    "congestion": ["대기"],
+}
+
+# 일반 단어 뒤에 붙어도 같은 단어로 보는 조사
+PARTICLES = ("", "은", "는", "이", "가", "을", "를", "도", "만", "요", "은요", "는요", "이요")
+
+# 일반 단어만 일치했을 때 의도를 확신할 수 있는 질문 표현 (예: "오픈 언제 해요?")
+QUESTION_WORDS = ["언제", "몇", "얼마", "어때", "어떤가"]
+
+# 템플릿 답변으로는 부족한 질문의 표현 (LLM이 판단해야 함)
+COMPLEX_MARKERS = [
+    "추천", "비교", "왜", "어떤 게", "어떤게", "맛있", "어울리", "예약", "주차", "알레르기",
+    "할인", "쿠폰", "리뷰", "후기", "배달", "포장",
+]
+
+# 이 길이를 넘는 질문은 여러 조건이 섞여 있을 가능성이 높음
+LONG_QUERY_LENGTH = 40
+
+_WORD = re.compile(r"\w+")
+
+def _normalize(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+def _has_word(words: List[str], keyword: str) -> bool:
+    """keyword가 단어 전체(조사 포함)로 쓰였는지 확인합니다. "대기업"의 "대기"는 일치하지 않음"""
+    return any(word.startswith(keyword) and word[len(keyword):] in PARTICLES for word in words)
+
+class IntentClassifier:
+    """
+    키워드 규칙으로 질문의 의도(영업시간/메뉴/혼잡도)를 분류합니다.
+    LLM을 호출하지 않으므로 수 마이크로초 안에 끝나며,
+    confidence가 낮은 질문은 LLM 에이전트가 처리하도록 넘깁니다.
+    """
+    def __init__(
+        self,
+        keywords: Dict[str, List[str]] = None,
+        complex_markers: List[str] = None,
+        weak_keywords: Dict[str, List[str]] = None,
+    ):
+        self.keywords = keywords or INTENT_KEYWORDS
+        self.complex_markers = complex_markers or COMPLEX_MARKERS
+        self.weak_keywords = WEAK_KEYWORDS if weak_keywords is None else weak_keywords
+
+    def classify(self, query: str) -> Dict[str, Any]:
+        """
+        Returns:
+            {"intent": "hours" | "menu" | "congestion" | None, "confidence": float, "matched": [키워드, ...]}
+        """
+        text = _normalize(query)
+        words = _WORD.findall(text)
+        strong = {
+            intent: [keyword for keyword in keywords if keyword in text]
+            for intent, keywords in self.keywords.items()
+        }
+        weak = {
+            intent: [keyword for keyword in keywords if _has_word(words, keyword)]
+            for intent, keywords in self.weak_keywords.items()
+        }
+        matches = {
+            intent: strong.get(intent, []) + weak.get(intent, [])
+            for intent in {**strong, **weak}
+        }
+        matches = {intent: found for intent, found in matches.items() if found}
+        if not matches:
+            return {"intent": None, "confidence": 0.0, "matched": []}
+
+        intent = max(matches, key=lambda name: len(matches[name]))
+        # 키워드 하나로 0.85, 같은 의도의 키워드가 더 있으면 조금씩 올라감
+        confidence = min(1.0, 0.85 + 0.05 * (len(matches[intent]) - 1))
+        if not strong.get(intent) and not any(word in text for word in QUESTION_WORDS):
+            # 일반 단어 하나만으로는 의도를 확신할 수 없음 (예: "오픈 이벤트 있어?")
+            confidence = 0.6
+        if len(matches) > 1:
+            # 여러 의도가 섞인 질문 (예: "메뉴랑 영업시간 알려줘")
+            confidence *= 0.5
+        if any(marker in text for marker in self.complex_markers):
+            confidence *= 0.5
+        if len(text) > LONG_QUERY_LENGTH:
+            confidence *= 0.8
+        return {"intent": intent, "confidence": round(confidence, 2), "matched": matches[intent]}
+
+# 싱글턴 인스턴스 생성
+intent_classifier = IntentClassifier()
@@ -0,0 +1,71 @@
+import re
+from typing import Dict, Any, Optional, List
+from ...models.place import Hour, MenuItem, PopularTimeNow
+
+# 의도별로 장소 문서에서 조회할 projection (PlaceRepository.PROJECTIONS)
+INTENT_PROJECTIONS = {
+    "hours": "hours",
+    "menu": "menu",
+    "congestion": "congestion",
+}
+
+def _format_price(price: str) -> str:
+    digits = re.sub(r"[^\d]", "", price or "")
+    return f"{int(digits):,}원" if digits else price
+
+class TemplateResponder:
+    """
+    장소 문서만으로 답할 수 있는 질문에 템플릿 답변을 만듭니다.
+    필요한 정보가 문서에 없으면 None을 반환하여 LLM 에이전트가 처리하도록 합니다.
+    """
+    def respond(self, intent: str, place_doc: Dict[str, Any], query: str = "") -> Optional[str]:
+        handler = getattr(self, f"_respond_{intent}", None)
+        if handler is None or not place_doc:
+            return None
+        return handler(place_doc, query)
+
+    def _respond_hours(self, place_doc: Dict[str, Any], query: str) -> Optional[str]:
+        hours = [Hour.model_validate(h) for h in place_doc.get("hours") or []]
+        if not hours:
+            return None
+
+        response_lines = [f"{self._name(place_doc)}영업시간 정보입니다:"]
+        for h in hours:
+            time_str = f"{h.open} - {h.close}"
+            if h.break_time:
+                time_str += f" (브레이크타임: {h.break_time})"
+            if h.last_order:
+                time_str += f" (라스트오더: {h.last_order})"
+            response_lines.append(f"- {h.day}: {time_str}")
+        return "\n".join(response_lines)
+
+    def _respond_menu(self, place_doc: Dict[str, Any], query: str) -> Optional[str]:
+        menu = [MenuItem.model_validate(item) for item in (place_doc.get("restaurant") or {}).get("menu") or []]
+        if not menu:
+            return None
+
+        # 특정 메뉴를 물어본 경우 ("치즈버거 얼마예요?") 해당 메뉴만 답변
+        asked = self._mentioned_items(menu, query)
+        response_lines = [f"{self._name(place_doc)}메뉴 정보입니다:"]
+        for item in asked or menu:
+            response_lines.append(f"- {item.name}: {_format_price(item.price)}")
+        return "\n".join(response_lines)
+
+    def _respond_congestion(self, place_doc: Dict[str, Any], query: str) -> Optional[str]:
+        now = PopularTimeNow.model_validate((place_doc.get("popularTimes") or {}).get("now") or {})
+        if now.source == "absent" or not now.label:
+            return None
+        return f"{self._name(place_doc)}현재 혼잡도는 '{now.label}' 상태입니다. (점수: {now.score}/100, 출처: {now.source})"
+
+    @staticmethod
+    def _name(place_doc: Dict[str, Any]) -> str:
+        name = (place_doc.get("profile") or {}).get("name")
+        return f"{name} " if name else ""
+
+    @staticmethod
+    def _mentioned_items(menu: List[MenuItem], query: str) -> List[MenuItem]:
+        compact = query.replace(" ", "")
+        return [item for item in menu if item.name and item.name.replace(" ", "") in compact]
+
+# 싱글턴 인스턴스 생성
+template_responder = TemplateResponder()
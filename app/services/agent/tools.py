@@ -1,55 +1,46 @@
-import subprocess
-import json
-import os
-import shutil
-import re
 from langchain_core.tools import tool
+from ...core.config import settings
 from ...db.connection import get_database
-from ...db.repositories.place_repository import PlaceRepository
+from ...db.repositories.place_repository import PlaceRepository, PROJECTIONS, INTERNAL_PROJECTIONS
 from ..url_processor.mobile_url_builder import generate_mobile_urls
-
-def _resolve_gemini_command() -> list[str]:
-    """
-    gemini 실행 경로를 해석.
-    1) PATH에서 찾기
-    2) 고정 경로(APPDATA\npm\gemini.cmd) 시도
-    3) npx 대체 경로 사용
-    """
-    exe = shutil.which("gemini")
-    if exe:
-        return [exe]
-    appdata = os.environ.get("APPDATA")
-    if appdata:
-        guess = os.path.join(appdata, "npm", "gemini.cmd")
-        if os.path.exists(guess):
-            return [guess]
-    return ["npx", "-y", "@google/gemini-cli"]
+from ..crawler.client import get_shared_client, FirecrawlException
+from .compaction import compact_tool_output, dumps_compact, truncate_text
+from ..retrieval.index import retrieval_index
 
 @tool
-def get_place_information(place_id: str) -> dict:
+async def get_place_information(place_id: str, projection: str = "full", query: str = "") -> str:
     """
-    주어진 place_id에 해당하는 장소의 모든 정보를 데이터베이스에서 조회합니다.
+    주어진 place_id에 해당하는 장소 정보를 데이터베이스에서 조회합니다.
+    질문에 필요한 정보만 가져오도록 projection을 지정하세요.
+    - hours: 영업시간
+    - menu: 메뉴와 가격
+    - congestion: 현재/시간대별 혼잡도
+    - profile: 이름, 전화번호, 주소, 업종
+    - full: 모든 정보 (여러 종류의 정보가 필요할 때만 사용)
+    query에는 사용자의 질문을 그대로 넣으세요. 정보가 많으면 질문과 관계있는 정보를 가장 나중에 생략합니다.
+    결과는 JSON 문자열이며, 정보가 많아 일부가 생략되면 "_truncated"에 생략된 항목 수가 표시됩니다.
     """
+    if projection not in PROJECTIONS or projection in INTERNAL_PROJECTIONS:
+        available = [name for name in PROJECTIONS if name not in INTERNAL_PROJECTIONS]
+        return dumps_compact({"error": f"알 수 없는 projection입니다: {projection} (가능한 값: {', '.join(available)})"})
     try:
         db = get_database()
         repo = PlaceRepository(db)
-        place_data = repo.get_by_id(place_id)
+        place_data = await repo.get_by_id(place_id, projection=projection)
         
         if not place_data:
-            return {"error": "해당 ID의 장소를 찾을 수 없습니다."}
-        
-        if '_id' in place_data:
-            place_data['_id'] = str(place_data['_id'])
+            return dumps_compact({"error": "해당 ID의 장소를 찾을 수 없습니다."})
             
-        return place_data
+        # 메뉴/영업시간 전체를 그대로 넣지 않도록 필요한 필드만 토큰 예산 안에서 전달
+        return compact_tool_output(place_data, projection=projection, query=query)
     except Exception as e:
-        return {"error": f"데이터베이스 조회 중 오류 발생: {e}"}
+        return dumps_compact({"error": f"데이터베이스 조회 중 오류 발생: {e}"})
 
 @tool
-def generate_llms_txt_for_place(place_id: str, category: str) -> dict:
+async def generate_llms_txt_for_place(place_id: str, category: str) -> dict:
     """
     주어진 place_id와 category로 네이버 모바일 지도 페이지를 크롤링하여 llms.txt를 생성하고,
-    그 내용을 app/results/txt/{place_id}.txt 파일로 저장합니다.
+    그 내용을 장소별 산출물 저장소에 저장합니다.
     """
     try:
         urls = generate_mobile_urls(place_id, category)
@@ -57,60 +48,53 @@ def generate_llms_txt_for_place(place_id: str, category: str) -> dict:
         if not home_url:
             return {"error": "해당 장소의 홈 URL을 생성할 수 없습니다."}
 
-        prompt = f'firecrawl.generate_llmstxt(url="{home_url}", showFullText=True)'
-        
-        env = os.environ.copy()
-        # -p 플래그를 제거하고, prompt를 stdin으로 전달하도록 변경
-        cmd = _resolve_gemini_command() + [
-            "--allowed-mcp-server-names", "firecrawl"
-        ]
-
-        print(f"Executing command: {" ".join(cmd)}")
-        print(f"With stdin: {prompt}")
-        
-        # prompt를 'input' 인자로 전달
-        result = subprocess.run(
-            cmd,
-            input=prompt,
-            capture_output=True,
-            text=True,
-            check=True,
-            env=env,
-        )
-        
-        stdout = result.stdout.strip()
-        
-        llms_txt_match = re.search(r'-- llms\.txt --\s*```\s*(.*?)\s*```', stdout, re.DOTALL)
-        llms_full_txt_match = re.search(r'-- llms-full\.txt --\s*```\s*(.*?)\s*```', stdout, re.DOTALL)
+        # 공유 FirecrawlClient로 직접 호출 (커넥션 풀, 재시도, 캐시, 산출물 저장을 그대로 사용)
+        client = get_shared_client()
+        data = await client.generate_llms_txt(home_url, params={"showFullText": True}, place_id=place_id)
 
-        llms_txt_content = llms_txt_match.group(1).strip() if llms_txt_match else ""
-        llms_full_txt_content = llms_full_txt_match.group(1).strip() if llms_full_txt_match else ""
+        llms_txt_content = (data.get("llms.txt") or "").strip()
+        llms_full_txt_content = (data.get("llms-full.txt") or "").strip()
 
         if not llms_txt_content and not llms_full_txt_content:
-            return {"error": f"llms.txt 내용을 추출하지 못했습니다. 원본 출력: {stdout}"}
+            return {"error": f"llms.txt 내용을 받지 못했습니다. 응답: {data}"}
+
+        # 전체 내용은 섹션 단위로 색인하고, 응답에는 요약(llms.txt)만 담음
+        indexed = await retrieval_index.arefresh(place_id)
+        summary = llms_txt_content or llms_full_txt_content
+        truncated = truncate_text(summary, settings.TOOL_OUTPUT_TOKEN_BUDGET)
+        if truncated != summary:
+            summary = truncated + " ...(생략)"
 
-        full_content = f"-- llms.txt --\n{llms_txt_content}\n\n-- llms-full.txt --\n{llms_full_txt_content}"
-        
-        output_dir = os.path.join("app", "results", "txt")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        file_path = os.path.join(output_dir, f"{place_id}.txt")
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(full_content)
-            
         return {
             "status": "success",
-            "message": f"llms.txt 파일이 '{file_path}' 경로에 성공적으로 저장되었습니다.",
-            "content": full_content
+            "message": (
+                f"llms.txt가 장소 {place_id}의 산출물로 저장되었습니다. "
+                "세부 내용은 search_place_documents 도구로 질문과 관련된 부분만 검색하세요."
+            ),
+            "artifacts": {name: entry["hash"] for name, entry in (await client.artifacts.list(place_id)).items()},
+            "indexed_chunks": indexed,
+            "summary": summary
         }
 
-    except subprocess.CalledProcessError as e:
-        print("---" + " Subprocess Error" + "---")
-        print(f"Exit Code: {e.returncode}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        print("------------------------")
-        return {"error": f"llms.txt 생성 실패. STDERR: {e.stderr}"}
+    except (FirecrawlException, ValueError) as e:
+        return {"error": f"llms.txt 생성 실패: {e}"}
+    except Exception as e:
+        return {"error": f"llms.txt 생성 또는 저장 중 오류 발생: {e}"}
+
+@tool
+async def search_place_documents(place_id: str, query: str, k: int = 3) -> str:
+    """
+    generate_llms_txt_for_place로 수집한 장소의 페이지 내용(llms-full.txt)에서
+    질문과 관련 있는 섹션만 최대 k개 검색합니다.
+    데이터베이스(get_place_information)에 없는 세부 정보(시설, 공지, 메뉴 설명 등)를 찾을 때 사용하세요.
+    결과가 비어 있으면 먼저 generate_llms_txt_for_place로 내용을 수집해야 합니다.
+    """
+    try:
+        results = await retrieval_index.asearch(place_id, query, k=max(1, min(k, 10)))
     except Exception as e:
-        return {"error": f"llms.txt 생성 또는 저장 중 오류 발생: {e}"}
\ No newline at end of file
+        return dumps_compact({"error": f"문서 검색 중 오류 발생: {e}"})
+    if not results:
+        return dumps_compact({"results": [], "message": "검색 결과가 없습니다. 수집된 문서가 없거나 관련 내용이 없습니다."})
+    return dumps_compact({"results": [
+        {"heading": result["heading"], "text": result["text"], "score": result["score"]} for result in results
+    ]})
@@ -1,51 +1,102 @@
+from typing import Dict, Any, Optional, Callable, Tuple
+from ..core.config import settings
 from ..db.repositories.place_repository import PlaceRepository
-from ..models.place import Place
+from .agent.intent_classifier import IntentClassifier, intent_classifier
+from .agent.responder import TemplateResponder, template_responder, INTENT_PROJECTIONS
+from .agent.answer_cache import AnswerCache, AnswerKey, answer_cache
+from .monitoring.metrics import metrics
+
+def _default_agent():
+    # langchain/LangGraph는 LLM 경로가 처음 필요할 때 불러옴
+    from .agent.graph import get_agent
+    return get_agent()
 
 class AgentService:
-    def __init__(self, place_repo: PlaceRepository):
+    """
+    LangGraph 에이전트 앞단의 라우터.
+    영업시간/메뉴/혼잡도처럼 자주 묻는 질문은 규칙으로 분류하여 장소 문서로 바로 답하고,
+    애매한 질문만 LLM 에이전트로 넘깁니다.
+    LLM 답변은 장소 문서 버전과 함께 캐시하여 같은 질문에 모델을 다시 호출하지 않습니다.
+    """
+    def __init__(
+        self,
+        place_repo: PlaceRepository,
+        classifier: Optional[IntentClassifier] = None,
+        responder: Optional[TemplateResponder] = None,
+        agent_factory: Optional[Callable[[], Any]] = None,
+        min_confidence: Optional[float] = None,
+        cache: Optional[AnswerCache] = None,
+    ):
         self.place_repo = place_repo
+        self.classifier = classifier or intent_classifier
+        self.responder = responder or template_responder
+        self.agent_factory = agent_factory or _default_agent
+        self.min_confidence = settings.AGENT_FAST_PATH_MIN_CONFIDENCE if min_confidence is None else min_confidence
+        self.cache = cache or (answer_cache if settings.ANSWER_CACHE_ENABLED else None)
+
+    async def generate_response(self, place_id: str, query: str) -> Dict[str, Any]:
+        """
+        DB에서 장소 정보를 조회하고, 규칙 기반으로 답할 수 있으면 템플릿 답변을 생성합니다.
+
+        Returns:
+            {"answer": str | None, "intent": str | None, "confidence": float}
+            answer가 None이면 LLM 에이전트가 처리해야 하는 질문입니다.
+        """
+        result = self.classifier.classify(query)
+        intent = result["intent"]
+        response = {"answer": None, "intent": intent, "confidence": result["confidence"]}
+        if not settings.AGENT_FAST_PATH_ENABLED or intent is None or result["confidence"] < self.min_confidence:
+            return response
+
+        # 의도에 필요한 필드만 조회 (캐시 적중 시 DB 왕복도 없음)
+        place_data = await self.place_repo.get_by_id(place_id, projection=INTENT_PROJECTIONS[intent])
+        if place_data:
+            response["answer"] = self.responder.respond(intent, place_data, query)
+        return response
 
-    def generate_response(self, place_id: str, query: str) -> str:
+    async def answer(self, place_id: str, query: str, category: str) -> Dict[str, Any]:
         """
-        DB에서 장소 정보를 조회하고, 사용자의 질문에 대한 답변을 생성합니다.
-        (초기 버전: 간단한 규칙 기반 응답)
+        질문에 답변합니다. 빠른 경로로 답하지 못하면 LLM 에이전트를 실행합니다.
+
+        Returns:
+            {"answer": str, "route": "fast_path" | "cache" | "llm", "intent": str | None}
         """
-        place_data = self.place_repo.get_by_id(place_id)
-        if not place_data:
-            return "해당 장소 정보를 찾을 수 없습니다."
-
-        # Pydantic 모델로 변환하여 데이터에 쉽게 접근
-        place = Place.parse_obj(place_data)
-
-        if "영업시간" in query or "언제 열어" in query:
-            if not place.hours:
-                return "죄송합니다, 영업시간 정보가 등록되어 있지 않습니다."
-            
-            response_lines = ["영업시간 정보입니다:"]
-            for h in place.hours:
-                day_str = h.day
-                time_str = f"{h.open} - {h.close}"
-                if h.break_time:
-                    time_str += f" (브레이크타임: {h.break_time})")
-                response_lines.append(f"- {day_str}: {time_str}")
-            return "\n".join(response_lines)
-
-        elif "메뉴" in query or "가격" in query:
-            if not place.restaurant or not place.restaurant.menu:
-                return "죄송합니다, 메뉴 정보가 등록되어 있지 않습니다."
-            
-            response_lines = ["메뉴 정보입니다:"]
-            for item in place.restaurant.menu:
-                price = f"{int(item.price):,}원" # 가격 포맷팅
-                response_lines.append(f"- {item.name}: {price}")
-            return "\n".join(response_lines)
-        
-        elif "혼잡" in query or "사람 많아" in query:
-            now_popularity = place.popularTimes.now
-            if now_popularity.source == 'absent':
-                return "죄송합니다, 현재 혼잡도 정보가 없습니다."
-            
-            return f"현재 혼잡도는 '{now_popularity.label}' 상태입니다. (점수: {now_popularity.score}/100, 출처: {now_popularity.source})"
-
-        else:
-            return "죄송합니다, 아직 답변할 수 없는 질문입니다. (영업시간, 메뉴, 혼잡도에 대해 질문해주세요)"
+        fast = await self.generate_response(place_id, query)
+        if fast["answer"] is not None:
+            self.record_route("fast_path", fast["intent"])
+            return {"answer": fast["answer"], "route": "fast_path", "intent": fast["intent"]}
+
+        key, cached = await self.lookup_cached(place_id, query)
+        if cached is not None:
+            self.record_route("cache", fast["intent"])
+            return {"answer": cached, "route": "cache", "intent": fast["intent"]}
+
+        self.record_route("llm", fast["intent"])
+        answer = await self.agent_factory().arun(place_id=place_id, query=query, category=category)
+        self.store_cached(key, answer)
+        return {"answer": answer, "route": "llm", "intent": fast["intent"]}
+
+    async def lookup_cached(self, place_id: str, query: str) -> Tuple[Optional[AnswerKey], Optional[str]]:
+        """
+        캐시된 LLM 답변을 찾습니다. 키에 장소 문서의 lastChangedAt이 포함되므로
+        동기화로 내용이 바뀐 뒤에는 이전 답변이 조회되지 않습니다.
+
+        Returns:
+            (캐시 키, 캐시된 답변 또는 None). 캐시를 쓰지 않으면 키도 None입니다.
+        """
+        if self.cache is None:
+            return None, None
+        # 버전 확인은 장소 문서 캐시를 거치므로 대부분 DB 왕복이 없음
+        doc = await self.place_repo.get_by_id(place_id, projection="version")
+        version = ((doc or {}).get("source") or {}).get("lastChangedAt")
+        key = self.cache.make_key(place_id, query, version)
+        return key, self.cache.get(key)
+
+    def store_cached(self, key: Optional[AnswerKey], answer: str) -> None:
+        if self.cache is not None and key is not None and answer:
+            self.cache.set(key, answer)
+
+    @staticmethod
+    def record_route(route: str, intent: Optional[str]) -> None:
+        metrics.increment(f"agent.route.{route}")
+        metrics.increment(f"agent.route.{route}.{intent or 'unknown'}")
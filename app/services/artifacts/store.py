@@ -0,0 +1,194 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterator
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip으로 대체
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows에서는 프로세스 간 파일 잠금 없이 동작
+    fcntl = None
+
+_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+def validate_place_id(place_id: str) -> None:
+    """place_id는 경로에 그대로 쓰이므로 숫자로 된 네이버 플레이스 ID만 허용합니다. (예: '../..' 차단)"""
+    if not isinstance(place_id, str) or not (place_id.isascii() and place_id.isdigit()):
+        raise ValueError(f"잘못된 place_id입니다: {place_id!r}")
+
+class ArtifactStore:
+    """
+    장소별 산출물(llms.txt 등) 저장소.
+    내용은 {root}/{place_id}/{sha256}{확장자} 파일로 저장되며, 같은 내용은 한 번만 기록합니다.
+    어떤 산출물이 어느 파일인지는 장소별 {root}/{place_id}/index.json에 기록하므로
+    조회할 때 디렉토리를 탐색하지 않고, 저장 비용도 장소 수와 무관합니다.
+    index.json은 매번 디스크에서 다시 읽고 파일 잠금 안에서 갱신하므로
+    여러 uvicorn 워커가 같은 장소를 저장해도 서로의 기록을 덮어쓰지 않습니다.
+    파일은 임시 파일에 쓴 뒤 rename하므로 동시에 저장해도 깨진 파일이 남지 않습니다.
+    """
+    INDEX_FILE = "index.json"
+
+    def __init__(self, root_dir: Optional[str] = None, compression: Optional[str] = None):
+        self.root_dir = root_dir or settings.ARTIFACT_DIR
+        compression = (compression or settings.ARTIFACT_COMPRESSION).lower()
+        if compression not in _EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if compression == "zstd" and zstandard is None:
+            compression = "gzip"
+        self.compression = compression
+        # 장소별 스레드 잠금 (다른 장소끼리는 서로 기다리지 않음). 쓰지 않는 잠금은 자동으로 사라짐
+        self._place_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+        self._place_locks_guard = threading.Lock()
+
+    # --- 비동기 인터페이스 (파일 I/O는 이벤트 루프 밖에서 실행) ---
+
+    async def put(self, place_id: str, name: str, content: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.save, place_id, name, content)
+
+    async def get(self, place_id: str, name: str) -> Optional[str]:
+        return await asyncio.to_thread(self.load, place_id, name)
+
+    async def list(self, place_id: str) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self.entries, place_id)
+
+    # --- 동기 인터페이스 ---
+
+    def save(self, place_id: str, name: str, content: str) -> Dict[str, Any]:
+        """
+        산출물을 저장하고 메타데이터를 반환합니다.
+        직전에 저장된 내용과 같으면 파일을 다시 쓰지 않습니다.
+        """
+        validate_place_id(place_id)
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._locked(place_id):
+            entries = self._load_index(place_id)
+            previous = entries.get(name)
+            if previous and previous["hash"] == digest:
+                metrics.increment("artifacts.deduplicated")
+                return previous
+
+            path = os.path.join(place_id, f"{digest}{_EXTENSIONS[self.compression]}")
+            full_path = os.path.join(self.root_dir, path)
+            if os.path.exists(full_path):
+                # 다른 이름으로 이미 저장된 같은 내용
+                metrics.increment("artifacts.deduplicated")
+            else:
+                self._atomic_write(full_path, self._compress(data))
+                metrics.increment("artifacts.writes")
+
+            entries[name] = {
+                "hash": digest,
+                "path": path,
+                "size": len(data),
+                "compression": self.compression,
+                "updatedAt": datetime.utcnow().isoformat(),
+            }
+            self._write_index(place_id, entries)
+            if previous and not self._is_referenced(entries, previous["path"]):
+                self._remove(previous["path"])
+            return entries[name]
+
+    def load(self, place_id: str, name: str) -> Optional[str]:
+        validate_place_id(place_id)
+        entry = self._load_index(place_id).get(name)
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.root_dir, entry["path"]), "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        return self._decompress(raw, entry["compression"]).decode("utf-8")
+
+    def entries(self, place_id: str) -> Dict[str, Dict[str, Any]]:
+        validate_place_id(place_id)
+        return self._load_index(place_id)
+
+    # --- 내부 구현 ---
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().compress(data)
+        if self.compression == "gzip":
+            return gzip.compress(data)
+        return data
+
+    @staticmethod
+    def _decompress(raw: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd로 압축된 산출물을 읽으려면 zstandard 패키지가 필요합니다.")
+            return zstandard.ZstdDecompressor().decompress(raw)
+        if compression == "gzip":
+            return gzip.decompress(raw)
+        return raw
+
+    def _index_path(self, place_id: str) -> str:
+        return os.path.join(self.root_dir, place_id, self.INDEX_FILE)
+
+    def _load_index(self, place_id: str) -> Dict[str, Dict[str, Any]]:
+        # 다른 워커가 저장한 산출물도 보이도록 캐시하지 않고 매번 읽음 (장소 하나 분량이라 작음)
+        try:
+            with open(self._index_path(place_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, place_id: str, entries: Dict[str, Any]) -> None:
+        data = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+        self._atomic_write(self._index_path(place_id), data)
+
+    @contextmanager
+    def _locked(self, place_id: str) -> Iterator[None]:
+        """같은 프로세스의 스레드와 다른 워커 프로세스 모두에 대해 장소 단위로 잠급니다."""
+        with self._place_locks_guard:
+            lock = self._place_locks.get(place_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._place_locks[place_id] = lock
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = os.path.join(self.root_dir, place_id, ".lock")
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _is_referenced(entries: Dict[str, Dict[str, Any]], path: str) -> bool:
+        return any(entry["path"] == path for entry in entries.values())
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(os.path.join(self.root_dir, path))
+        except OSError:
+            pass
+
+# 싱글턴 인스턴스 생성
+artifact_store = ArtifactStore()
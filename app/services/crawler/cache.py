@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+
+def normalize_url(url: str) -> str:
+    """scheme/host 소문자화, 끝 슬래시와 fragment 제거, 쿼리 정렬로 같은 페이지를 같은 URL로 만듭니다."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+class ScrapeCache:
+    """
+    Firecrawl 응답 캐시.
+    URL과 요청 파라미터로 만든 키를 사용하며, 메모리 LRU 계층과
+    gzip으로 압축한 디스크 계층으로 구성됩니다. 페이지 종류별로 TTL이 다릅니다.
+    디스크 파일의 수정 시각은 만료 시각으로 맞춰 두며, sweep_every번 쓸 때마다
+    만료된 파일과 disk_max_entries를 넘는 파일(만료가 가까운 것부터)을 삭제합니다.
+    """
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        disk_max_entries: Optional[int] = None,
+        sweep_every: Optional[int] = None,
+    ):
+        self.max_entries = max_entries or settings.SCRAPE_CACHE_MAX_ENTRIES
+        # cache_dir이 빈 문자열이면 디스크 계층을 사용하지 않음
+        self.cache_dir = settings.SCRAPE_CACHE_DIR if cache_dir is None else cache_dir
+        self.ttls = ttls or settings.SCRAPE_CACHE_TTLS
+        self.disk_max_entries = disk_max_entries or settings.SCRAPE_CACHE_DISK_MAX_ENTRIES
+        self.sweep_every = sweep_every or settings.SCRAPE_CACHE_DISK_SWEEP_EVERY
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._disk_writes = 0
+
+    @staticmethod
+    def make_key(kind: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        raw = json.dumps({"kind": kind, "url": normalize_url(url), "params": params or {}}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def page_type(kind: str, url: str) -> str:
+        """TTL 결정을 위한 페이지 종류 (home, menu, info, review, llmstxt, default)"""
+        if kind == "llmstxt":
+            return "llmstxt"
+        segments = urlsplit(url).path.strip("/").split("/")
+        for page in ("menu", "info", "review", "home"):
+            if page in segments[2:]:
+                return page
+        return "default"
+
+    def ttl_for(self, page_type: str) -> float:
+        return self.ttls.get(page_type, self.ttls.get("default", 0))
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                metrics.increment("scrape_cache.hits.memory")
+                return value
+            del self._memory[key]
+
+        if self.cache_dir:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None and entry[0] > now:
+                self._remember(key, *entry)
+                metrics.increment("scrape_cache.hits.disk")
+                return entry[1]
+
+        metrics.increment("scrape_cache.misses")
+        return None
+
+    async def set(self, key: str, page_type: str, value: Dict[str, Any]) -> None:
+        ttl = self.ttl_for(page_type)
+        if ttl <= 0 or not value:
+            return
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, value)
+        if self.cache_dir:
+            await asyncio.to_thread(self._write_disk, key, expires_at, value)
+        metrics.increment("scrape_cache.stores")
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        counters = metrics.snapshot("scrape_cache.")
+        hits = counters.get("scrape_cache.hits.memory", 0) + counters.get("scrape_cache.hits.disk", 0)
+        lookups = hits + counters.get("scrape_cache.misses", 0)
+        return {
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "counters": counters,
+        }
+
+    def _remember(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            metrics.increment("scrape_cache.evictions")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry["expires_at"] <= time.time():
+            # 만료된 파일은 읽는 시점에 정리
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry["expires_at"], entry["value"]
+
+    def _write_disk(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"expires_at": expires_at, "value": value}, f, ensure_ascii=False)
+        # 파일을 열지 않고 stat만으로 정리할 수 있도록 수정 시각을 만료 시각으로 맞춤
+        os.utime(tmp_path, (expires_at, expires_at))
+        os.replace(tmp_path, path)
+        self._disk_writes += 1
+        if self._disk_writes % self.sweep_every == 0:
+            self._sweep_disk()
+
+    def _sweep_disk(self) -> int:
+        """만료된 파일과 최대 파일 수를 넘는 파일을 삭제하고, 삭제한 파일 수를 반환합니다."""
+        now = time.time()
+        files = []
+        try:
+            shards = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return 0
+        for shard in shards:
+            try:
+                for entry in os.scandir(shard):
+                    if entry.name.endswith(".json.gz"):
+                        files.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+        files.sort()
+        expired = sum(1 for expires_at, _ in files if expires_at <= now)
+        excess = max(expired, len(files) - self.disk_max_entries)
+        removed = 0
+        for _, path in files[:excess]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                # 다른 워커가 먼저 지운 경우
+                pass
+        metrics.increment("scrape_cache.disk_evictions", removed)
+        return removed
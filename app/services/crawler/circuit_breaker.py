@@ -0,0 +1,85 @@
+import time
+from typing import Dict, Any, Optional
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 발생하면 회로를 열어(open) 요청을 즉시 거부합니다.
+    recovery_timeout이 지나면 half-open 상태로 전환하여 소수의 시험 요청만 허용하고,
+    시험 요청이 성공하면 다시 닫고(closed) 실패하면 다시 엽니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> str:
+        # open 상태에서 회복 대기 시간이 지나면 half-open으로 전환
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. half-open에서는 시험 요청 수를 제한합니다."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._release_probe()
+        if self._state == self.HALF_OPEN:
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        self._release_probe()
+        if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """결과 없이 끝난(취소된) 요청의 시험 요청 자리를 반납합니다."""
+        self._release_probe()
+
+    def reset(self) -> None:
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probes_in_flight = 0
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+
+    def _release_probe(self) -> None:
+        if self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def retry_after(self) -> float:
+        """open 상태일 때 half-open으로 전환되기까지 남은 시간(초)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "retry_after": round(self.retry_after(), 3),
+        }
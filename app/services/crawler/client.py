@@ -1,107 +1,338 @@
 import os
+import asyncio
+import random
 import aiohttp
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+from .rate_limiter import TokenBucket
+from .circuit_breaker import CircuitBreaker
+from .cache import ScrapeCache
+from .replay import FixtureStore, FirecrawlReplayer
+from ..artifacts.store import ArtifactStore, artifact_store
+from ..url_processor.placeid_extractor import extract_place_id
 
 class FirecrawlException(Exception):
     """Firecrawl 클라이언트 관련 예외"""
     pass
 
+class FirecrawlUnavailableException(FirecrawlException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않고 즉시 실패한 경우"""
+    def __init__(self, retry_after: float):
+        super().__init__(f"Firecrawl 장애로 요청을 일시 중단했습니다. {retry_after:.0f}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+class _RetryableError(FirecrawlException):
+    """재시도 후에도 실패한, 서킷 브레이커에 실패로 집계할 오류"""
+    pass
+
 class FirecrawlClient:
 
-    BASE_URL = "https://api.firecrawl.dev"
-    LLMSTXT_PATH = "/llmstxt"
+    SCRAPE_PATH = "/v0/scrape"
+    SEARCH_PATH = "/v0/search"
+    LLMSTXT_PATH = "/v0/llmstxt"
+    # 재시도할 HTTP 상태 코드 (요청 한도 초과, 일시적 서버 오류)
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
     
     """
     Firecrawl API를 직접 호출하는 HTTP 클라이언트.
+    하나의 aiohttp 세션(커넥션 풀)을 계속 재사용하여 매 요청마다
+    TCP/TLS 핸드셰이크가 발생하지 않도록 합니다.
+    모든 요청은 토큰 버킷으로 속도를 제한하며, 429/5xx 응답은
+    Retry-After 또는 지터가 적용된 지수 백오프 후 재시도합니다.
+    재시도 후에도 연속으로 실패하면 서킷 브레이커가 열려 이후 요청은 즉시 실패합니다.
+
+    mode가 "record"이면 성공한 응답을 fixture로 저장하고, "replay"이면 네트워크 없이
+    저장된 fixture로 응답합니다. (replay 모드에서는 API 키와 속도 제한이 필요 없음)
     """
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.firecrawl.dev/v0/scrape"):
-        self.api_key = api_key or os.getenv("FIRECRAWL_API_KEY")
+    MODES = ("live", "record", "replay")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        api_url: Optional[str] = None,
+        pool_limit: Optional[int] = None,
+        pool_limit_per_host: Optional[int] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        retry_after_max: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ScrapeCache] = None,
+        mode: Optional[str] = None,
+        fixtures: Optional[FixtureStore] = None,
+        replayer: Optional[FirecrawlReplayer] = None,
+        artifacts: Optional[ArtifactStore] = None,
+    ):
+        self.mode = (mode or settings.FIRECRAWL_MODE).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 FIRECRAWL_MODE입니다: {self.mode}")
+        self.api_key = api_key or os.getenv("FIRECRAWL_API_KEY") or ("replay" if self.mode == "replay" else None)
         if not self.api_key:
             raise ValueError("FIRECRAWL_API_KEY가 .env 파일에 설정되지 않았습니다.")
-        self.base_url = base_url
+        # api_url로 모든 엔드포인트 주소를 만들고, base_url은 스크랩 엔드포인트만 직접 지정할 때 사용
+        self.api_url = (api_url or settings.FIRECRAWL_API_URL).rstrip("/")
+        self.base_url = base_url or f"{self.api_url}{self.SCRAPE_PATH}"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self.pool_limit = pool_limit or settings.FIRECRAWL_POOL_LIMIT
+        self.pool_limit_per_host = pool_limit_per_host or settings.FIRECRAWL_POOL_LIMIT_PER_HOST
+        self.rate_limiter = rate_limiter or TokenBucket(
+            rate=settings.FIRECRAWL_RATE_LIMIT_PER_MINUTE / 60,
+            burst=settings.FIRECRAWL_RATE_BURST,
+        )
+        self.max_retries = settings.FIRECRAWL_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = settings.FIRECRAWL_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.retry_after_max = settings.FIRECRAWL_RETRY_AFTER_MAX if retry_after_max is None else retry_after_max
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=settings.FIRECRAWL_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.FIRECRAWL_BREAKER_RECOVERY_TIMEOUT,
+            half_open_max_calls=settings.FIRECRAWL_BREAKER_HALF_OPEN_CALLS,
+        )
+        self.cache = cache
+        self.artifacts = artifacts or artifact_store
+        self.fixtures = fixtures or (FixtureStore() if self.mode != "live" else None)
+        self.replayer = replayer or (FirecrawlReplayer(self.fixtures) if self.mode == "replay" else None)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """공유 세션을 미리 생성합니다. (FastAPI lifespan 시작 시 호출)"""
+        self._get_session()
+
+    async def close(self) -> None:
+        """공유 세션과 커넥션 풀을 닫습니다. (FastAPI lifespan 종료 시 호출)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "FirecrawlClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        공유 세션을 반환합니다. 아직 없거나 닫혔다면 새로 생성합니다.
+        반드시 이벤트 루프 안에서 호출되어야 합니다.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=settings.FIRECRAWL_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=settings.FIRECRAWL_DNS_CACHE_TTL,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self._session
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        재시도 전 대기 시간을 계산합니다.
+        Retry-After 헤더(초 또는 HTTP 날짜)가 있으면 그 값을 그대로 따르고,
+        없으면 지터가 적용된 지수 백오프를 사용합니다.
+        """
+        backoff = min(settings.FIRECRAWL_BACKOFF_MAX, self.backoff_base * (2 ** (attempt - 1)))
+        jitter = random.uniform(0, backoff)
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    return jitter
+            # 동시에 깨어나는 요청이 몰리지 않도록 약간의 지터를 더함
+            return max(delay, 0.0) + random.uniform(0, self.backoff_base)
+        return jitter
+
+    async def _post(self, endpoint: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        공유 세션으로 POST 요청을 보내고 응답 JSON을 반환합니다.
+        서킷 브레이커가 열려 있으면 요청을 보내지 않고 즉시 실패합니다.
+        """
+        if not self.circuit_breaker.allow_request():
+            metrics.increment("firecrawl.short_circuited")
+            raise FirecrawlUnavailableException(self.circuit_breaker.retry_after())
+        try:
+            result = await self._post_with_retries(endpoint, payload, timeout)
+        except _RetryableError:
+            self.circuit_breaker.record_failure()
+            raise
+        except FirecrawlException:
+            # 4xx 등 요청 자체의 오류는 Firecrawl이 정상 응답한 것으로 간주
+            self.circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+        return result
+
+    async def _send(self, endpoint: str, payload: Dict[str, Any], timeout: aiohttp.ClientTimeout) -> Tuple[int, Any, Any]:
+        """
+        요청 한 번을 보내고 (상태 코드, 본문, 헤더)를 반환합니다.
+        200이면 본문은 JSON, 그 외에는 오류 메시지 문자열입니다.
+        """
+        if self.replayer is not None:
+            return await self.replayer.respond(endpoint, payload)
+        async with self._get_session().post(endpoint, json=payload, timeout=timeout) as response:
+            if response.status == 200:
+                body = await response.json()
+                if self.mode == "record":
+                    key = self.fixtures.make_key(endpoint, payload)
+                    await asyncio.to_thread(self.fixtures.save, key, endpoint, payload, body)
+                return response.status, body, response.headers
+            return response.status, await response.text(), response.headers
+
+    async def _post_with_retries(self, endpoint: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        429/5xx 응답과 네트워크 오류, 타임아웃은 max_retries까지 재시도합니다.
+        """
+        request_timeout = aiohttp.ClientTimeout(total=timeout, connect=settings.FIRECRAWL_CONNECT_TIMEOUT)
+        attempt = 0
+        while True:
+            attempt += 1
+            # replay 모드는 외부 API를 호출하지 않으므로 속도 제한을 적용하지 않음
+            if self.replayer is None and await self.rate_limiter.acquire() > 0:
+                metrics.increment("firecrawl.throttled")
+            metrics.increment("firecrawl.requests")
+            try:
+                status, body, headers = await self._send(endpoint, payload, request_timeout)
+                if status == 200:
+                    return body
+                if status == 429:
+                    metrics.increment("firecrawl.rate_limited")
+                if status not in self.RETRYABLE_STATUSES:
+                    metrics.increment("firecrawl.failed")
+                    raise FirecrawlException(f"API 오류: {status} - {body}")
+                if attempt > self.max_retries:
+                    metrics.increment("firecrawl.failed")
+                    raise _RetryableError(f"API 오류: {status} - {body}")
+                retry_after = headers.get("Retry-After")
+                delay = self._retry_delay(attempt, retry_after)
+                if retry_after and delay > self.retry_after_max:
+                    # 서버가 요구한 대기 시간이 재시도 예산보다 길면 줄여서 다시 보내지 않고 실패
+                    metrics.increment("firecrawl.failed")
+                    raise _RetryableError(f"API 오류: {status} - Retry-After {delay:.0f}초가 허용 범위를 넘었습니다.")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    metrics.increment("firecrawl.timeouts")
+                if attempt > self.max_retries:
+                    metrics.increment("firecrawl.failed")
+                    raise _RetryableError(f"네트워크 오류: {e!r}") from e
+                delay = self._retry_delay(attempt)
 
-    async def scrape_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            metrics.increment("firecrawl.retried")
+            await asyncio.sleep(delay)
+
+    async def _cached(self, kind: str, url: str, params: Optional[Dict[str, Any]], use_cache: bool, fetch) -> Dict[str, Any]:
+        """캐시에 신선한 응답이 있으면 반환하고, 없으면 fetch()로 가져와 캐시에 저장합니다."""
+        if self.cache is None or not use_cache:
+            return await fetch()
+        key = self.cache.make_key(kind, url, params)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        data = await fetch()
+        await self.cache.set(key, self.cache.page_type(kind, url), data)
+        return data
+
+    async def scrape_url(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
         """
         주어진 URL과 파라미터로 Firecrawl 스크랩 API를 비동기적으로 호출합니다.
+        캐시가 설정되어 있고 use_cache가 True이면 신선한 캐시 응답을 먼저 사용합니다.
         """
         payload = {"url": url}
         if params:
             payload.update(params)
-            
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                async with session.post(self.base_url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise FirecrawlException(f"API 오류: {response.status} - {error_text}")
-                    result = await response.json()
-                    # API 응답 형식에 따라 'data' 키를 반환
-                    return result.get('data', {})
-            except aiohttp.ClientError as e:
-                raise FirecrawlException(f"네트워크 오류: {e}") from e
-
-    async def search(self, query: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+
+        async def fetch() -> Dict[str, Any]:
+            result = await self._post(self.base_url, payload, timeout or settings.FIRECRAWL_SCRAPE_TIMEOUT)
+            # API 응답 형식에 따라 'data' 키를 반환
+            return result.get('data', {})
+
+        return await self._cached("scrape", url, params, use_cache, fetch)
+
+    async def search(self, query: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         주어진 쿼리로 Firecrawl 검색 API를 비동기적으로 호출합니다.
         """
-        search_url = "https://api.firecrawl.dev/v0/search"
+        search_url = f"{self.api_url}{self.SEARCH_PATH}"
         payload = {"query": query}
         if params:
             payload.update(params)
-            
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                async with session.post(search_url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise FirecrawlException(f"API 오류: {response.status} - {error_text}")
-                    result = await response.json()
-                    return result.get('data', {})
-            except aiohttp.ClientError as e:
-                raise FirecrawlException(f"네트워크 오류: {e}") from e
 
-    async def generate_llms_txt(self, url: str, params: Optional[Dict[str, Any]] = None, output_dir: str = "app/results/txt") -> Dict[str, Any]:
+        result = await self._post(search_url, payload, timeout or settings.FIRECRAWL_SEARCH_TIMEOUT)
+        return result.get('data', {})
+
+    async def generate_llms_txt(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        place_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
         """
         주어진 URL로 Firecrawl llms.txt 생성 API를 비동기적으로 호출하고,
-        결과를 파일로 저장합니다.
+        결과를 장소별 산출물 저장소에 저장합니다.
+        place_id를 지정하지 않으면 URL에서 추출하며, 추출할 수 없으면 저장하지 않습니다.
         """
-        llms_txt_url = "https://api.firecrawl.dev/v0/llmstxt"
+        llms_txt_url = f"{self.api_url}{self.LLMSTXT_PATH}"
         payload = {"url": url}
         if params:
             payload.update(params)
 
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                async with session.post(llms_txt_url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise FirecrawlException(f"API 오류: {response.status} - {error_text}")
-                    
-                    result = await response.json()
-                    data = result.get('data', {})
-
-                    if data:
-                        # 디렉토리가 없으면 생성
-                        os.makedirs(output_dir, exist_ok=True)
-
-                        # llms.txt 파일 저장
-                        llms_txt_content = data.get("llms.txt")
-                        if llms_txt_content:
-                            with open(os.path.join(output_dir, "llms.txt"), "w", encoding="utf-8") as f:
-                                f.write(llms_txt_content)
-                            print(f"'llms.txt' 파일이 {output_dir}에 저장되었습니다.")
-
-                        # llms-full.txt 파일 저장
-                        llms_full_txt_content = data.get("llms-full.txt")
-                        if llms_full_txt_content:
-                            with open(os.path.join(output_dir, "llms-full.txt"), "w", encoding="utf-8") as f:
-                                f.write(llms_full_txt_content)
-                            print(f"'llms-full.txt' 파일이 {output_dir}에 저장되었습니다.")
-                    
-                    return data
-            except aiohttp.ClientError as e:
-                raise FirecrawlException(f"네트워크 오류: {e}") from e
+        async def fetch() -> Dict[str, Any]:
+            result = await self._post(llms_txt_url, payload, timeout or settings.FIRECRAWL_LLMSTXT_TIMEOUT)
+            return result.get('data', {})
+
+        data = await self._cached("llmstxt", url, params, use_cache, fetch)
+
+        # 산출물 저장소는 장소 단위로만 보관하므로 place_id를 알 수 없는 URL은 저장하지 않음
+        owner = place_id or extract_place_id(url)
+        if data and owner:
+            for name in ("llms.txt", "llms-full.txt"):
+                if data.get(name):
+                    await self.artifacts.put(owner, name, data[name])
+
+        return data
+
+
+_shared_client: Optional[FirecrawlClient] = None
+
+
+def get_shared_client() -> FirecrawlClient:
+    """
+    애플리케이션 전체에서 공유하는 FirecrawlClient 인스턴스를 반환합니다.
+    처음 호출될 때 생성됩니다.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = FirecrawlClient(
+            cache=ScrapeCache() if settings.SCRAPE_CACHE_ENABLED else None,
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """공유 FirecrawlClient의 세션을 닫습니다."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
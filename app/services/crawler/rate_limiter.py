@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 레이트 리미터.
+    초당 rate개의 토큰이 채워지고, 최대 burst개까지 쌓입니다.
+    """
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate는 0보다 크고 burst는 1 이상이어야 합니다.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        토큰을 얻을 때까지 기다립니다. 대기 순서는 요청 순서를 따릅니다.
+
+        Returns:
+            토큰을 얻기 위해 기다린 시간(초)
+        """
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
@@ -0,0 +1,77 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
+from ...core.config import settings
+from ..monitoring.metrics import metrics
+
+class FixtureStore:
+    """
+    Firecrawl 원본 응답을 gzip 압축 JSON 파일로 저장하는 fixture 저장소.
+    키는 엔드포인트 경로와 요청 payload로 만들기 때문에 호스트(실서버/로컬 서버)와 무관합니다.
+    """
+    def __init__(self, fixtures_dir: Optional[str] = None):
+        self.fixtures_dir = fixtures_dir or settings.FIRECRAWL_FIXTURES_DIR
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict[str, Any]) -> str:
+        raw = json.dumps({"path": urlsplit(endpoint).path, "payload": payload}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.fixtures_dir, f"{key}.json.gz")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, endpoint: str, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        os.makedirs(self.fixtures_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fixture = {"path": urlsplit(endpoint).path, "request": payload, "response": response}
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+class FirecrawlReplayer:
+    """
+    저장된 fixture로 Firecrawl 응답을 재현합니다.
+    지정한 지연 시간만큼 기다린 뒤 응답하며, error_rate 비율로 503 오류를 주입하여
+    재시도와 서킷 브레이커 경로도 실서버 없이 실행할 수 있습니다.
+    fixture가 없는 요청은 404로 응답합니다.
+    """
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.store = store
+        self.latency = settings.FIRECRAWL_REPLAY_LATENCY if latency is None else latency
+        self.error_rate = settings.FIRECRAWL_REPLAY_ERROR_RATE if error_rate is None else error_rate
+        self._random = random.Random(seed)
+
+    async def respond(self, endpoint: str, payload: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        """(상태 코드, 본문, 헤더)를 반환합니다. 200이면 본문은 JSON, 그 외에는 문자열입니다."""
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            metrics.increment("firecrawl.replay.injected_errors")
+            return 503, "injected error", {}
+
+        key = self.store.make_key(endpoint, payload)
+        fixture = await asyncio.to_thread(self.store.load, key)
+        if fixture is None:
+            metrics.increment("firecrawl.replay.misses")
+            return 404, f"fixture not found: {key}", {}
+        metrics.increment("firecrawl.replay.hits")
+        return 200, fixture["response"], {}
@@ -0,0 +1,32 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+class Metrics:
+    """
+    프로세스 내부 카운터 모음.
+    'firecrawl.retried'처럼 점(.)으로 구분된 이름을 사용합니다.
+    """
+    def __init__(self):
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, float]:
+        """prefix로 시작하는 카운터의 현재 값을 반환합니다."""
+        with self._lock:
+            return {name: value for name, value in self._counters.items() if name.startswith(prefix)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+# 싱글턴 인스턴스 생성
+metrics = Metrics()
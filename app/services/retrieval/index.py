@@ -0,0 +1,291 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Optional, List
+from ...core.config import settings
+from ..artifacts.store import ArtifactStore, artifact_store, validate_place_id
+from ..monitoring.metrics import metrics
+
+# 검색 대상 산출물. llms-full.txt가 있으면 llms.txt(요약)는 내용이 겹치므로 색인하지 않음
+INDEXED_ARTIFACTS = ["llms-full.txt", "llms.txt"]
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+_WORD = re.compile(r"\w+")
+_HANGUL = re.compile(r"[가-힣]")
+
+# BM25 파라미터
+K1 = 1.5
+B = 0.75
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰으로 나눕니다.
+    한글은 조사가 붙어도 일치하도록 글자 2-gram으로, 나머지는 소문자 단어로 나눕니다.
+    예: "영업시간은" -> ["영업", "업시", "시간", "간은"]
+    """
+    tokens: List[str] = []
+    for word in _WORD.findall(text.lower()):
+        if _HANGUL.search(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """max_chars보다 긴 섹션을 문단 경계에서 나눕니다. 한 문단이 너무 길면 글자 수로 자릅니다."""
+    parts: List[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        while len(paragraph) > max_chars:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if current and len(current) + len(paragraph) + 2 > max_chars:
+            parts.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current.strip():
+        parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+def chunk_markdown(text: str, source: str = "", max_chars: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    마크다운을 제목(#) 단위 섹션으로 나눕니다.
+    각 청크에는 상위 제목 경로(예: "메뉴 > 버거")가 함께 기록되며,
+    청크 id는 내용의 해시이므로 내용이 같은 청크는 다시 색인하지 않습니다.
+    """
+    max_chars = max_chars or settings.RETRIEVAL_CHUNK_MAX_CHARS
+    sections: List[tuple] = []
+    path: List[tuple] = []
+    lines: List[str] = []
+
+    def flush():
+        body = "\n".join(lines).strip()
+        if body:
+            sections.append((" > ".join(title for _, title in path), body))
+        lines.clear()
+
+    for line in text.splitlines():
+        match = _HEADING.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            path[:] = [item for item in path if item[0] < level] + [(level, match.group(2))]
+        else:
+            lines.append(line)
+    flush()
+
+    chunks = []
+    for heading, body in sections:
+        for part in _split_long(body, max_chars):
+            chunk_id = hashlib.sha256(f"{source}\0{heading}\0{part}".encode("utf-8")).hexdigest()[:16]
+            chunks.append({"id": chunk_id, "source": source, "heading": heading, "text": part})
+    return chunks
+
+class PlaceIndex:
+    """
+    한 장소의 산출물 청크에 대한 역색인(BM25).
+    청크마다 단어 빈도를 보관하므로 청크 단위로 추가/삭제할 수 있습니다.
+    """
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        # 산출물 이름 -> 색인한 내용의 sha256 (ArtifactStore의 hash와 같음)
+        self.sources: Dict[str, str] = data.get("sources", {})
+        self.chunks: Dict[str, Dict[str, Any]] = data.get("chunks", {})
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        for chunk_id, chunk in self.chunks.items():
+            self._add_postings(chunk_id, chunk)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"sources": self.sources, "chunks": self.chunks}
+
+    def update_source(self, source: str, digest: str, content: str) -> Dict[str, int]:
+        """
+        산출물 하나의 내용을 다시 색인합니다. 바뀐 청크만 추가/삭제합니다.
+
+        Returns:
+            {"added": int, "removed": int}
+        """
+        new_chunks = {chunk["id"]: chunk for chunk in chunk_markdown(content, source)}
+        old_ids = {chunk_id for chunk_id, chunk in self.chunks.items() if chunk["source"] == source}
+
+        removed = old_ids - new_chunks.keys()
+        added = new_chunks.keys() - old_ids
+        for chunk_id in removed:
+            self._remove_postings(chunk_id, self.chunks.pop(chunk_id))
+        for chunk_id in added:
+            chunk = new_chunks[chunk_id]
+            chunk["terms"] = dict(Counter(tokenize(f"{chunk['heading']}\n{chunk['text']}")))
+            chunk["length"] = sum(chunk["terms"].values())
+            self.chunks[chunk_id] = chunk
+            self._add_postings(chunk_id, chunk)
+        self.sources[source] = digest
+        return {"added": len(added), "removed": len(removed)}
+
+    def remove_source(self, source: str) -> int:
+        removed = [chunk_id for chunk_id, chunk in self.chunks.items() if chunk["source"] == source]
+        for chunk_id in removed:
+            self._remove_postings(chunk_id, self.chunks.pop(chunk_id))
+        self.sources.pop(source, None)
+        return len(removed)
+
+    def search(self, query: str, k: int) -> List[Dict[str, Any]]:
+        """BM25 점수가 높은 순으로 최대 k개의 청크를 반환합니다."""
+        if not self.chunks:
+            return []
+        count = len(self.chunks)
+        avg_length = self._total_length / count or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for chunk_id, tf in postings.items():
+                length = self.chunks[chunk_id]["length"]
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (K1 + 1) / (
+                    tf + K1 * (1 - B + B * length / avg_length)
+                )
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [
+            {
+                "source": self.chunks[chunk_id]["source"],
+                "heading": self.chunks[chunk_id]["heading"],
+                "text": self.chunks[chunk_id]["text"],
+                "score": round(score, 3),
+            }
+            for chunk_id, score in ranked
+        ]
+
+    def _add_postings(self, chunk_id: str, chunk: Dict[str, Any]) -> None:
+        for term, tf in chunk["terms"].items():
+            self._postings.setdefault(term, {})[chunk_id] = tf
+        self._total_length += chunk["length"]
+
+    def _remove_postings(self, chunk_id: str, chunk: Dict[str, Any]) -> None:
+        for term in chunk["terms"]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(chunk_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= chunk["length"]
+
+class RetrievalIndex:
+    """
+    장소별 산출물(llms-full.txt 등) 검색 인덱스.
+    인덱스는 {root}/{place_id}.json에 저장되며, 검색할 때 산출물 저장소의 hash와 비교하여
+    내용이 바뀐 산출물만 다시 색인합니다. (바뀌지 않은 청크는 그대로 유지)
+    메모리에는 최근에 검색한 max_places개 장소의 인덱스만 LRU로 보관합니다.
+    """
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        artifacts: Optional[ArtifactStore] = None,
+        max_places: Optional[int] = None,
+    ):
+        self.root_dir = root_dir or settings.RETRIEVAL_INDEX_DIR
+        self.artifacts = artifacts or artifact_store
+        self.max_places = max_places or settings.RETRIEVAL_INDEX_MAX_PLACES
+        self._indexes: "OrderedDict[str, PlaceIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # --- 비동기 인터페이스 (파일 I/O와 색인은 이벤트 루프 밖에서 실행) ---
+
+    async def arefresh(self, place_id: str) -> Dict[str, int]:
+        return await asyncio.to_thread(self.refresh, place_id)
+
+    async def asearch(self, place_id: str, query: str, k: Optional[int] = None) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.search, place_id, query, k)
+
+    # --- 동기 인터페이스 ---
+
+    def refresh(self, place_id: str) -> Dict[str, int]:
+        """
+        산출물 저장소와 비교하여 바뀐 산출물만 다시 색인하고 디스크에 저장합니다.
+
+        Returns:
+            {"added": int, "removed": int} 이번에 바뀐 청크 수
+        """
+        entries = self.artifacts.entries(place_id)
+        # llms-full.txt가 있으면 그것만, 없으면 llms.txt를 색인
+        wanted = next(([name] for name in INDEXED_ARTIFACTS if name in entries), [])
+        stats = {"added": 0, "removed": 0}
+        with self._lock:
+            index = self._load(place_id)
+            changed = False
+            for name in list(index.sources):
+                if name not in wanted:
+                    stats["removed"] += index.remove_source(name)
+                    changed = True
+            for name in wanted:
+                digest = entries[name]["hash"]
+                if index.sources.get(name) == digest:
+                    continue
+                content = self.artifacts.load(place_id, name)
+                if content is None:
+                    continue
+                result = index.update_source(name, digest, content)
+                stats["added"] += result["added"]
+                stats["removed"] += result["removed"]
+                changed = True
+            if changed:
+                self._save(place_id, index)
+                metrics.increment("retrieval.reindexed")
+                metrics.increment("retrieval.chunks_added", stats["added"])
+                metrics.increment("retrieval.chunks_removed", stats["removed"])
+        return stats
+
+    def search(self, place_id: str, query: str, k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """인덱스를 최신 상태로 맞춘 뒤 질문과 관련 있는 청크를 최대 k개 반환합니다."""
+        self.refresh(place_id)
+        with self._lock:
+            results = self._load(place_id).search(query, k or settings.RETRIEVAL_TOP_K)
+        metrics.increment("retrieval.searches")
+        if not results:
+            metrics.increment("retrieval.empty_results")
+        return results
+
+    # --- 내부 구현 ---
+
+    def _path(self, place_id: str) -> str:
+        validate_place_id(place_id)
+        return os.path.join(self.root_dir, f"{place_id}.json")
+
+    def _load(self, place_id: str) -> PlaceIndex:
+        index = self._indexes.get(place_id)
+        if index is None:
+            try:
+                with open(self._path(place_id), "r", encoding="utf-8") as f:
+                    index = PlaceIndex(json.load(f))
+            except (OSError, ValueError):
+                index = PlaceIndex()
+            self._indexes[place_id] = index
+            # 디스크에 저장되어 있으므로 내린 인덱스는 다음 검색 때 다시 읽음
+            while len(self._indexes) > self.max_places:
+                self._indexes.popitem(last=False)
+                metrics.increment("retrieval.evictions")
+        self._indexes.move_to_end(place_id)
+        return index
+
+    def _save(self, place_id: str, index: PlaceIndex) -> None:
+        data = json.dumps(index.to_dict(), ensure_ascii=False).encode("utf-8")
+        path = self._path(place_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 rename하여 읽는 쪽이 깨진 파일을 보지 않도록 함
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+# 싱글턴 인스턴스 생성
+retrieval_index = RetrievalIndex()
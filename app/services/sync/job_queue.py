@@ -0,0 +1,227 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from ...core.config import settings
+from ..crawler.client import FirecrawlUnavailableException
+from .sync_pipeline import SyncPipeline
+
+class SyncJob:
+    """
+    여러 장소의 동기화 진행 상황을 추적하는 작업 단위.
+    """
+    def __init__(self, places: List[Tuple[str, str]]):
+        self.job_id = uuid.uuid4().hex
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.places: Dict[str, Dict[str, Any]] = {
+            place_id: {
+                "place_id": place_id,
+                "category": category,
+                "status": "queued",
+                "attempts": 0,
+                "error": None,
+                "deduplicated": False,
+                "updated_at": self.created_at,
+            }
+            for place_id, category in places
+        }
+
+    def update(self, place_id: str, status: str, **fields) -> None:
+        """장소별 진행 상태를 갱신합니다."""
+        entry = self.places[place_id]
+        entry.update(fields, status=status, updated_at=datetime.utcnow())
+        if self.finished_at is None and self.is_finished:
+            self.finished_at = entry["updated_at"]
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in self.places.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+    @property
+    def is_finished(self) -> bool:
+        return all(entry["status"] in SyncJobQueue.FINAL_STATUSES for entry in self.places.values())
+
+    @property
+    def status(self) -> str:
+        if self.is_finished:
+            return "completed"
+        if any(entry["status"] != "queued" for entry in self.places.values()):
+            return "running"
+        return "queued"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "counts": self.counts,
+            "places": list(self.places.values()),
+        }
+
+class SyncJobQueue:
+    """
+    프로세스 내부 작업 큐와 고정 크기 워커 풀로 장소 동기화를 처리합니다.
+    실패한 장소는 지수 백오프 후 최대 max_attempts까지 재시도합니다.
+    같은 장소가 이미 진행 중이면 새로 크롤링하지 않고 진행 중인 실행을 공유합니다.
+    """
+    FINAL_STATUSES = ("succeeded", "skipped", "failed")
+
+    def __init__(
+        self,
+        worker_count: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        job_retention: Optional[int] = None,
+    ):
+        self.worker_count = worker_count or settings.SYNC_WORKER_COUNT
+        self.max_attempts = max_attempts or settings.SYNC_MAX_ATTEMPTS
+        self.retry_backoff = settings.SYNC_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.job_retention = job_retention or settings.SYNC_JOB_RETENTION
+        self._jobs: "OrderedDict[str, SyncJob]" = OrderedDict()
+        # place_id -> {"category", "force", "attempts", "jobs"}: 진행 중인 장소 레지스트리
+        self._inflight: Dict[str, Dict[str, Any]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._retry_tasks: set = set()
+        self._pipeline_factory: Optional[Callable[[], SyncPipeline]] = None
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self, pipeline_factory: Callable[[], SyncPipeline]) -> None:
+        """워커 풀을 시작합니다. (FastAPI lifespan 시작 시 호출)"""
+        if self.is_running:
+            return
+        self._pipeline_factory = pipeline_factory
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"sync-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """워커 풀과 대기 중인 재시도를 중단합니다."""
+        for task in [*self._workers, *self._retry_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retry_tasks, return_exceptions=True)
+        self._workers = []
+        self._retry_tasks.clear()
+        self._inflight.clear()
+        self._queue = None
+
+    async def join(self) -> None:
+        """큐에 들어간 모든 작업과 재시도가 끝날 때까지 기다립니다."""
+        while self._queue is not None:
+            await self._queue.join()
+            if not self._retry_tasks:
+                break
+            await asyncio.gather(*list(self._retry_tasks), return_exceptions=True)
+
+    def submit(self, places: List[Tuple[str, str]], force: bool = False) -> SyncJob:
+        """
+        (place_id, category) 목록을 하나의 작업으로 등록하고 큐에 넣습니다.
+        이미 진행 중인 장소는 큐에 다시 넣지 않고 진행 중인 실행의 결과를 공유합니다.
+
+        Args:
+            places: 동기화할 (place_id, category) 목록
+            force: True이면 최소 갱신 간격과 상관없이 다시 크롤링합니다.
+        """
+        if not self.is_running:
+            raise RuntimeError("동기화 워커 풀이 시작되지 않았습니다.")
+
+        job = SyncJob(places)
+        self._remember(job)
+        for place_id, entry in job.places.items():
+            inflight = self._inflight.get(place_id)
+            if inflight:
+                inflight["jobs"].append(job)
+                inflight["force"] = inflight["force"] or force
+                status = "running" if inflight["attempts"] else "queued"
+                job.update(place_id, status, attempts=inflight["attempts"], deduplicated=True)
+                continue
+            self._inflight[place_id] = {
+                "category": entry["category"],
+                "force": force,
+                "attempts": 0,
+                "jobs": [job],
+            }
+            self._queue.put_nowait(place_id)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[SyncJob]:
+        return self._jobs.get(job_id)
+
+    def find_inflight_job(self, place_id: str) -> Optional[SyncJob]:
+        """해당 장소를 처음 요청한, 아직 진행 중인 작업을 반환합니다."""
+        inflight = self._inflight.get(place_id)
+        return inflight["jobs"][0] if inflight else None
+
+    def _remember(self, job: SyncJob) -> None:
+        """최근 작업만 보관하고, 오래된 완료 작업부터 정리합니다."""
+        self._jobs[job.job_id] = job
+        for old_id in list(self._jobs):
+            if len(self._jobs) <= self.job_retention:
+                break
+            if self._jobs[old_id].is_finished:
+                del self._jobs[old_id]
+
+    def _update_jobs(self, place_id: str, status: str, **fields) -> None:
+        """장소를 기다리는 모든 작업의 상태를 갱신합니다."""
+        for job in self._inflight[place_id]["jobs"]:
+            job.update(place_id, status, **fields)
+
+    async def _worker(self) -> None:
+        while True:
+            place_id = await self._queue.get()
+            try:
+                await self._process(place_id)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, place_id: str) -> None:
+        inflight = self._inflight[place_id]
+        inflight["attempts"] += 1
+        attempts = inflight["attempts"]
+        self._update_jobs(place_id, "running", attempts=attempts)
+        try:
+            pipeline = self._pipeline_factory()
+            result = await pipeline.run_sync(place_id, inflight["category"], force=inflight["force"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if attempts < self.max_attempts:
+                delay = self.retry_backoff * (2 ** (attempts - 1))
+                if isinstance(e, FirecrawlUnavailableException):
+                    # 서킷이 열려 있는 동안에는 재시도해도 즉시 실패하므로 회복 시점까지 대기
+                    delay = max(delay, e.retry_after)
+                self._update_jobs(place_id, "retrying", error=str(e))
+                self._schedule_retry(place_id, delay)
+            else:
+                self._update_jobs(place_id, "failed", error=str(e))
+                del self._inflight[place_id]
+            return
+
+        status = "skipped" if result.get("skipped") else "succeeded"
+        self._update_jobs(place_id, status, error=None, modified_count=result.get("modified_count"))
+        del self._inflight[place_id]
+
+    def _schedule_retry(self, place_id: str, delay: float) -> None:
+        """워커를 점유하지 않도록 지연 후 큐에 다시 넣습니다."""
+        async def requeue():
+            await asyncio.sleep(delay)
+            if self._queue is not None:
+                self._queue.put_nowait(place_id)
+
+        task = asyncio.create_task(requeue())
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+# 싱글턴 인스턴스 생성
+sync_job_queue = SyncJobQueue()
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from ...core.config import settings
+from ...core.constants import DEFAULT_CATEGORY
+from ...db.repositories.place_repository import PlaceRepository
+from ..url_processor.mobile_url_builder import generate_mobile_urls
+from .job_queue import SyncJobQueue, sync_job_queue
+
+logger = logging.getLogger(__name__)
+
+class RefreshScheduler:
+    """
+    마지막 fetch 시간이 오래된 장소를 주기적으로 찾아 동기화 작업 큐에 넣습니다.
+    실제로 내용이 자주 바뀌는 장소와 자주 조회되는 장소를 우선하며,
+    분당 Firecrawl 요청 예산을 넘지 않도록 한 번에 넣는 장소 수를 제한합니다.
+    """
+    # 한 번의 tick마다 조회 수를 줄여, 최근 조회가 더 큰 비중을 갖도록 함
+    QUERY_DECAY = 0.5
+
+    def __init__(
+        self,
+        job_queue: SyncJobQueue,
+        budget_per_minute: Optional[int] = None,
+        tick_seconds: Optional[float] = None,
+        scan_limit: Optional[int] = None,
+        min_refresh_interval: Optional[int] = None,
+    ):
+        self.place_repo_factory: Optional[Callable[[], PlaceRepository]] = None
+        self.job_queue = job_queue
+        self.budget_per_minute = budget_per_minute or settings.REFRESH_BUDGET_PER_MINUTE
+        self.tick_seconds = tick_seconds or settings.REFRESH_TICK_SECONDS
+        self.scan_limit = scan_limit or settings.REFRESH_SCAN_LIMIT
+        self.min_refresh_interval = (
+            settings.SYNC_MIN_REFRESH_INTERVAL if min_refresh_interval is None else min_refresh_interval
+        )
+        self._query_counts: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record_query(self, place_id: str) -> None:
+        """사용자 조회(챗봇 질문, 장소 조회)를 기록합니다."""
+        self._query_counts[place_id] = self._query_counts.get(place_id, 0.0) + 1.0
+
+    async def start(self, place_repo_factory: Callable[[], PlaceRepository]) -> None:
+        """주기적인 갱신 루프를 시작합니다. (FastAPI lifespan 시작 시 호출)"""
+        self.place_repo_factory = place_repo_factory
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="refresh-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("갱신 대상 선정 실패: %s", e)
+            await asyncio.sleep(self.tick_seconds)
+
+    def priority(self, place_doc: Dict[str, Any], now: datetime) -> float:
+        """
+        갱신 우선순위 점수를 계산합니다.
+        경과 시간(시간) x (1 + 하루 평균 변경 횟수) x (1 + log(1 + 조회 수))
+        """
+        source = place_doc.get("source", {})
+        age_hours = (now - source["lastFetchedAt"]).total_seconds() / 3600
+
+        history = source.get("changeHistory") or []
+        change_rate = 0.0
+        if history:
+            span_days = max((now - history[0]["at"]).total_seconds() / 86400, 1.0)
+            change_rate = len(history) / span_days
+
+        queries = self._query_counts.get(source.get("placeId"), 0.0)
+        return age_hours * (1 + change_rate) * (1 + math.log1p(queries))
+
+    async def run_once(self, now: Optional[datetime] = None) -> List[Tuple[str, str]]:
+        """
+        한 번의 tick 동안 갱신할 장소를 선정하여 작업 큐에 넣고, 그 목록을 반환합니다.
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(seconds=self.min_refresh_interval)
+        candidates = await self.place_repo_factory().find_refresh_candidates(cutoff, self.scan_limit)
+        candidates.sort(key=lambda doc: self.priority(doc, now), reverse=True)
+
+        # tick 길이에 해당하는 만큼의 요청 예산 (장소당 비용 = 크롤링할 페이지 수)
+        budget = self.budget_per_minute * self.tick_seconds / 60
+        selected: List[Tuple[str, str]] = []
+        for doc in candidates:
+            place_id = doc["source"]["placeId"]
+            if self.job_queue.find_inflight_job(place_id):
+                continue
+            categories = doc.get("profile", {}).get("category") or []
+            category = categories[0] if categories else DEFAULT_CATEGORY
+            cost = len(generate_mobile_urls(place_id, category))
+            if cost > budget:
+                break
+            budget -= cost
+            selected.append((place_id, category))
+
+        for place_id in list(self._query_counts):
+            self._query_counts[place_id] *= self.QUERY_DECAY
+            if self._query_counts[place_id] < 0.01:
+                del self._query_counts[place_id]
+
+        if selected:
+            self.job_queue.submit(selected)
+        return selected
+
+# 싱글턴 인스턴스 생성
+refresh_scheduler = RefreshScheduler(sync_job_queue)
@@ -1,4 +1,8 @@
+import asyncio
+import hashlib
 from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from ...core.config import settings
 from ...db.repositories.place_repository import PlaceRepository
 from ..crawler.client import FirecrawlClient
 from ..normalizer.data_normalizer import DataNormalizer
@@ -6,6 +10,10 @@ from ..congestion.predictor import CongestionPredictor
 from ..url_processor import mobile_url_builder
 from ...models.place import Place, Source, Profile
 
+def content_hash(content: Optional[str]) -> str:
+    """페이지 content의 변경 여부를 판단하기 위한 해시를 계산합니다."""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
 class SyncPipeline:
     def __init__(
         self,
@@ -13,50 +21,131 @@ class SyncPipeline:
         crawler: FirecrawlClient,
         normalizer: DataNormalizer,
         predictor: CongestionPredictor,
+        page_concurrency: Optional[int] = None,
+        min_refresh_interval: Optional[int] = None,
+        writer: Optional[Any] = None,
     ):
         self.place_repo = place_repo
+        # 쓰기 연산(upsert_synced_delta, touch_last_fetched)을 처리할 객체.
+        # PlaceWriteBatcher를 넘기면 여러 장소의 쓰기를 bulk_write로 묶어서 보냄
+        self.writer = writer or place_repo
         self.crawler = crawler
         self.normalizer = normalizer
         self.predictor = predictor
+        self.page_concurrency = page_concurrency or settings.SYNC_PAGE_CONCURRENCY
+        self.min_refresh_interval = (
+            settings.SYNC_MIN_REFRESH_INTERVAL if min_refresh_interval is None else min_refresh_interval
+        )
+
+    async def _fetch_page(
+        self, page: str, url: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[str, Optional[str]]:
+        """한 페이지를 크롤링하여 (페이지 이름, content)를 반환합니다."""
+        async with semaphore:
+            # 동기화는 항상 원본을 가져옴. 캐시된 응답(TTL이 최소 갱신 간격보다 김)을 쓰면
+            # 해시가 그대로라 변경이 없다고 잘못 판단하고 lastFetchedAt만 갱신하게 됨
+            result = await self.crawler.scrape_url(url, use_cache=False)
+        return page, (result or {}).get("content")
+
+    def _is_fresh(self, place_doc: Dict[str, Any]) -> bool:
+        """이미 동기화된 적이 있고, 최소 갱신 간격이 지나지 않았는지 확인합니다."""
+        source = place_doc.get("source", {})
+        last_fetched_at = source.get("lastFetchedAt")
+        if not source.get("contentHashes") or not last_fetched_at:
+            return False
+        return (datetime.utcnow() - last_fetched_at).total_seconds() < self.min_refresh_interval
 
-    async def run_sync(self, place_id: str, category: str):
+    async def run_sync(self, place_id: str, category: str, force: bool = False):
         """
         지정된 장소에 대한 전체 동기화 파이프라인을 실행합니다.
+        force가 False이면 최소 갱신 간격 안에 있는 장소는 크롤링하지 않습니다.
         """
-        # 1. DB에 기본 문서 생성 또는 확인
-        self.place_repo.create_or_update_place(place_id, category)
+        # 1. 저장된 문서 조회 (이전 content 해시 확인용). 새 장소는 마지막 upsert에서 생성
+        existing_doc = await self.place_repo.get_by_id(place_id, use_cache=False)
+        place_doc = existing_doc or {}
+        stored_hashes = place_doc.get("source", {}).get("contentHashes", {})
 
-        # 2. 모든 소스 페이지 크롤링
-        urls = mobile_url_builder.generate_mobile_urls(place_id, category)
-        home_content = (await self.crawler.scrape_url(urls.get("home"))).get("content")
-        menu_content = (await self.crawler.scrape_url(urls.get("menu"))).get("content")
-        # info 페이지는 home과 내용이 중복될 수 있으므로 home_content 재사용
-        info_content = home_content 
+        if not force and self._is_fresh(place_doc):
+            return {
+                "place_id": place_id,
+                "modified_count": 0,
+                "skipped": True,
+                "last_fetched_at": place_doc["source"]["lastFetchedAt"],
+                "synced_data": {}
+            }
 
-        # 3. 데이터 정규화
-        normalized_menu = self.normalizer.normalize_menu(menu_content)
-        normalized_hours = self.normalizer.normalize_hours(info_content)
+        # 2. 카테고리에 존재하는 페이지만 동시에 크롤링
+        urls = mobile_url_builder.generate_mobile_urls(place_id, category)
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+        tasks = [
+            asyncio.create_task(self._fetch_page(page, url, semaphore))
+            for page, url in urls.items() if url
+        ]
 
-        # 4. 혼잡도 예측
         place_for_prediction = Place(
             _id=f"place_{place_id}",
             source=Source(placeId=place_id),
             profile=Profile(category=[category])
         )
-        predicted_congestion = self.predictor.predict(home_content, place_for_prediction)
 
-        # 5. DB 업데이트를 위한 데이터 구조화
-        update_data = {
-            "restaurant.menu": [item.dict() for item in normalized_menu],
-            "hours": [hour.dict() for hour in normalized_hours],
-            "popularTimes.now": predicted_congestion.dict()
-        }
+        # 3. 페이지가 도착하는 대로 정규화 / 혼잡도 예측
+        #    이전 동기화와 content 해시가 같은 페이지는 정규화를 생략
+        update_data: Dict[str, Any] = {}
+        contents: Dict[str, Optional[str]] = {}
+        hashes: Dict[str, str] = {}
+        changed_pages = set()
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page, content = await next_page
+                contents[page] = content
+                hashes[page] = content_hash(content)
+                if stored_hashes.get(page) == hashes[page]:
+                    continue
+                changed_pages.add(page)
+
+                if page == "menu":
+                    normalized_menu = self.normalizer.normalize_menu(content)
+                    update_data["restaurant.menu"] = [item.dict() for item in normalized_menu]
+                elif page == "info" and content:
+                    normalized_hours = self.normalizer.normalize_hours(content)
+                    update_data["hours"] = [hour.dict() for hour in normalized_hours]
+                elif page == "home":
+                    predicted_congestion = self.predictor.predict(content, place_for_prediction)
+                    update_data["popularTimes.now"] = predicted_congestion.dict()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # 4. 모든 페이지가 그대로라면 마지막 fetch 시간만 갱신
+        if not changed_pages:
+            await self.writer.touch_last_fetched(place_id)
+            return {
+                "place_id": place_id,
+                "modified_count": 0,
+                "unchanged": True,
+                "synced_data": {}
+            }
+
+        # info 페이지가 비어 있으면 home 페이지에서 영업시간을 추출
+        if not contents.get("info") and changed_pages & {"home", "info"}:
+            normalized_hours = self.normalizer.normalize_hours(contents.get("home"))
+            update_data["hours"] = [hour.dict() for hour in normalized_hours]
+
+        update_data["source.contentHashes"] = hashes
+        update_data["source.lastChangedAt"] = datetime.utcnow()
+
+        # 5. 저장된 문서와 비교하여 바뀐 필드만 한 번의 upsert로 반영
+        #    (첫 동기화는 변경 이력에 남기지 않음)
+        changeset = await self.writer.upsert_synced_delta(
+            place_id, category, update_data, current=existing_doc,
+            changed_pages=sorted(changed_pages) if stored_hashes else None
+        )
 
-        # 6. DB에 최종 데이터 업데이트
-        modified_count = self.place_repo.update_synced_data(place_id, update_data)
-        
         return {
             "place_id": place_id,
-            "modified_count": modified_count,
+            "modified_count": changeset["modified_count"],
+            "unchanged": False,
+            "changes": changeset["changes"],
             "synced_data": update_data
         }
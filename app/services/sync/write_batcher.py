@@ -0,0 +1,110 @@
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from ...core.config import settings
+from ...db.repositories.place_repository import PlaceRepository
+from ..monitoring.metrics import metrics
+
+class PlaceWriteBatcher:
+    """
+    여러 워커의 장소 갱신을 모아 한 번의 비순차 bulk_write로 반영합니다.
+    max_batch_size개가 모이거나 첫 연산 후 max_delay초가 지나면 전송하며,
+    각 호출자는 자신의 연산 결과가 나올 때까지 기다립니다.
+    SyncPipeline의 writer로 쓸 수 있도록 PlaceRepository와 같은 쓰기 메서드를 제공합니다.
+    """
+    def __init__(self, max_batch_size: Optional[int] = None, max_delay: Optional[float] = None):
+        self.max_batch_size = max_batch_size or settings.SYNC_WRITE_BATCH_SIZE
+        self.max_delay = settings.SYNC_WRITE_BATCH_DELAY if max_delay is None else max_delay
+        self.place_repo_factory: Optional[Callable[[], PlaceRepository]] = None
+        self._pending: List[Tuple[str, UpdateOne, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self.place_repo_factory is not None
+
+    async def start(self, place_repo_factory: Callable[[], PlaceRepository]) -> None:
+        """(FastAPI lifespan 시작 시 호출)"""
+        self.place_repo_factory = place_repo_factory
+
+    async def stop(self) -> None:
+        """대기 중인 연산을 모두 전송한 뒤 중단합니다."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self._spawn_flush()
+        await asyncio.gather(*list(self._flushes), return_exceptions=True)
+        self.place_repo_factory = None
+
+    async def upsert_synced_delta(
+        self,
+        place_id: str,
+        category: str,
+        update_data: Dict[str, Any],
+        current: Optional[Dict[str, Any]] = None,
+        changed_pages: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        repo = self.place_repo_factory()
+        operation, changes = repo.build_sync_upsert(place_id, category, update_data, current, changed_pages)
+        await self._submit(place_id, operation)
+        # bulk_write 결과는 연산별 수정 여부를 알려주지 않으므로 변경 내역으로 판단
+        return {"modified_count": 1 if changes else 0, "upserted": current is None, "changes": changes}
+
+    async def touch_last_fetched(self, place_id: str) -> int:
+        await self._submit(place_id, self.place_repo_factory().build_touch(place_id))
+        return 1
+
+    async def _submit(self, place_id: str, operation: UpdateOne) -> None:
+        if not self.is_running:
+            raise RuntimeError("장소 쓰기 배처가 시작되지 않았습니다.")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((place_id, operation, future))
+        if len(self._pending) >= self.max_batch_size:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._spawn_flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        self._spawn_flush()
+
+    def _spawn_flush(self) -> None:
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[str, UpdateOne, asyncio.Future]]) -> None:
+        metrics.increment("sync.write_batches")
+        metrics.increment("sync.write_operations", len(batch))
+        repo = self.place_repo_factory()
+        failed: Dict[int, Exception] = {}
+        try:
+            await repo.bulk_write([operation for _, operation, _ in batch])
+        except BulkWriteError as e:
+            # 비순차 실행이므로 실패한 연산만 호출자에게 오류로 전달
+            for error in e.details.get("writeErrors", []):
+                failed[error["index"]] = RuntimeError(f"장소 갱신 실패: {error.get('errmsg')}")
+        except Exception as e:
+            failed = {index: e for index in range(len(batch))}
+
+        for index, (place_id, _, future) in enumerate(batch):
+            # 실패한 연산도 일부 반영되었을 수 있으므로 캐시는 항상 무효화
+            repo.invalidate(place_id)
+            if future.done():
+                continue
+            if index in failed:
+                future.set_exception(failed[index])
+            else:
+                future.set_result(None)
+
+# 싱글턴 인스턴스 생성
+place_write_batcher = PlaceWriteBatcher()
@@ -0,0 +1,469 @@
+import unittest
+import asyncio
+import json
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from app.api.v1 import agents
+from app.services.agent.graph import Agent
+from app.services.agent.intent_classifier import IntentClassifier
+from app.services.agent.responder import TemplateResponder
+from app.services.agent import tools
+from app.services.agent.compaction import compact_tool_output, count_tokens, prune_place
+from app.services.crawler.client import FirecrawlUnavailableException
+from app.services.agent.answer_cache import AnswerCache, normalize_query
+from app.services.agent_service import AgentService
+from app.services.monitoring.metrics import metrics
+
+PLACE_ID = "1690334952"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class FakeGraph:
+    """LangGraph의 astream(stream_mode=["messages", "updates"]) 출력을 흉내 내는 가짜 그래프"""
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.stream_mode = None
+
+    async def astream(self, state, stream_mode=None):
+        self.stream_mode = stream_mode
+        for chunk in self.chunks:
+            yield chunk
+
+def tool_call_turn():
+    """도구를 한 번 호출한 뒤 답변하는 대화 흐름"""
+    call = {"name": "get_place_information", "args": {"place_id": PLACE_ID, "projection": "hours"}, "id": "call-1"}
+    return [
+        ("updates", {"llm": {"messages": [AIMessage(content="", tool_calls=[call])]}}),
+        ("messages", (ToolMessage(content="{}", name="get_place_information", tool_call_id="call-1"), {"langgraph_node": "tools"})),
+        ("updates", {"tools": {"messages": [ToolMessage(content="{}", name="get_place_information", tool_call_id="call-1")]}}),
+        ("messages", (AIMessageChunk(content="오전 "), {"langgraph_node": "llm"})),
+        ("messages", (AIMessageChunk(content="11시에 엽니다."), {"langgraph_node": "llm"})),
+        ("updates", {"llm": {"messages": [AIMessage(content="오전 11시에 엽니다.")]}}),
+    ]
+
+PLACE_DOCS = {
+    "hours": {"profile": {"name": "파이브가이즈 강남"},
+              "hours": [{"day": "월", "open": "11:00", "close": "22:00", "break": "15:00-17:00"}]},
+    "menu": {"profile": {"name": "파이브가이즈 강남"},
+             "restaurant": {"menu": [{"name": "치즈버거", "price": "15900"}, {"name": "감자튀김", "price": "6,900원"}]}},
+    "congestion": {"profile": {"name": "파이브가이즈 강남"},
+                   "popularTimes": {"now": {"label": "보통", "score": 55, "source": "inference"}}},
+    "version": {"source": {"placeId": PLACE_ID, "lastChangedAt": datetime(2025, 8, 12, 12, 0)}},
+}
+
+def make_repo(docs=None):
+    repo = AsyncMock()
+    docs = PLACE_DOCS if docs is None else docs
+    repo.get_by_id.side_effect = lambda place_id, projection="full", use_cache=True: docs.get(projection)
+    return repo
+
+def make_agent(chunks):
+    # ChatOpenAI를 만들지 않도록 __init__을 건너뛰고 그래프만 교체
+    agent = Agent.__new__(Agent)
+    agent.graph = FakeGraph(chunks)
+    return agent
+
+class TestAgentStream(unittest.TestCase):
+
+    @async_test
+    async def test_astream_yields_tokens_and_tool_progress(self):
+        """astream이 도구 호출 진행 상황, 답변 토큰, 최종 답변 순서로 이벤트를 내보내는지 테스트합니다."""
+        agent = make_agent(tool_call_turn())
+
+        events = [event async for event in agent.astream(PLACE_ID, "몇 시에 열어요?", "restaurant")]
+
+        self.assertEqual([event["type"] for event in events],
+                         ["tool_start", "tool_end", "token", "token", "done"])
+        self.assertEqual(events[0]["args"]["projection"], "hours")
+        self.assertEqual("".join(e["content"] for e in events if e["type"] == "token"), "오전 11시에 엽니다.")
+        self.assertEqual(events[-1]["answer"], "오전 11시에 엽니다.")
+        self.assertEqual(agent.graph.stream_mode, ["messages", "updates"])
+
+    @async_test
+    async def test_astream_skips_tool_message_content(self):
+        """도구 결과 메시지의 내용은 토큰으로 전달되지 않는지 테스트합니다."""
+        agent = make_agent(tool_call_turn())
+
+        tokens = [event["content"] async for event in agent.astream(PLACE_ID, "몇 시에 열어요?", "restaurant")
+                  if event["type"] == "token"]
+
+        self.assertNotIn("{}", tokens)
+
+class TestIntentClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = IntentClassifier()
+
+    def test_common_questions_are_confident(self):
+        """자주 묻는 질문이 높은 confidence로 분류되는지 테스트합니다."""
+        cases = {
+            "영업시간 알려주세요": "hours",
+            "몇 시에 문 닫아요?": "hours",
+            "치즈버거 얼마예요?": "menu",
+            "메뉴 뭐 있어요": "menu",
+            "지금 사람 많아요?": "congestion",
+        }
+        for query, intent in cases.items():
+            with self.subTest(query=query):
+                result = self.classifier.classify(query)
+                self.assertEqual(result["intent"], intent)
+                self.assertGreaterEqual(result["confidence"], 0.8)
+
+    def test_ambiguous_questions_have_low_confidence(self):
+        """여러 의도가 섞이거나 판단이 필요한 질문은 confidence가 낮은지 테스트합니다."""
+        for query in ["메뉴랑 영업시간 알려줘", "메뉴 추천해 주세요", "주차 가능한가요?"]:
+            with self.subTest(query=query):
+                self.assertLess(self.classifier.classify(query)["confidence"], 0.8)
+
+    def test_generic_words_alone_are_not_confident(self):
+        """다른 뜻으로도 쓰이는 일반 단어만 들어간 질문은 빠른 경로로 답하지 않는지 테스트합니다."""
+        for query in ["대기업 프랜차이즈야?", "오픈 이벤트 있어?", "마감 세일 해?", "판매자 연락처 알려줘"]:
+            with self.subTest(query=query):
+                self.assertLess(self.classifier.classify(query)["confidence"], 0.8)
+
+    def test_generic_word_with_question_is_confident(self):
+        """일반 단어라도 질문 표현과 함께 쓰이면 해당 의도로 분류하는지 테스트합니다."""
+        cases = {"오픈 언제 해요?": "hours", "대기는 어때요?": "congestion", "가격이 어떤가요?": "menu"}
+        for query, intent in cases.items():
+            with self.subTest(query=query):
+                result = self.classifier.classify(query)
+                self.assertEqual(result["intent"], intent)
+                self.assertGreaterEqual(result["confidence"], 0.8)
+
+class TestTemplateResponder(unittest.TestCase):
+
+    def setUp(self):
+        self.responder = TemplateResponder()
+
+    def test_menu_answer_filters_mentioned_item(self):
+        """특정 메뉴를 물으면 해당 메뉴의 가격만 답하는지 테스트합니다."""
+        answer = self.responder.respond("menu", PLACE_DOCS["menu"], "치즈버거 얼마예요?")
+        self.assertIn("치즈버거: 15,900원", answer)
+        self.assertNotIn("감자튀김", answer)
+
+    def test_hours_answer_includes_break_time(self):
+        """영업시간 답변에 브레이크타임이 포함되는지 테스트합니다."""
+        answer = self.responder.respond("hours", PLACE_DOCS["hours"])
+        self.assertIn("- 월: 11:00 - 22:00 (브레이크타임: 15:00-17:00)", answer)
+
+    def test_missing_data_returns_none(self):
+        """문서에 정보가 없으면 None을 반환하는지 테스트합니다."""
+        self.assertIsNone(self.responder.respond("congestion", {"popularTimes": {"now": {"source": "absent"}}}))
+        self.assertIsNone(self.responder.respond("hours", {"hours": []}))
+
+class TestAgentServiceRouting(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.agent = AsyncMock()
+        self.agent.arun.return_value = "LLM 답변"
+
+    def _service(self, docs=None):
+        self.repo = make_repo(docs)
+        return AgentService(place_repo=self.repo, agent_factory=lambda: self.agent, cache=AnswerCache())
+
+    @async_test
+    async def test_fast_path_answers_without_llm(self):
+        """자주 묻는 질문은 LLM 호출 없이 필요한 projection만 조회하여 답하는지 테스트합니다."""
+        result = await self._service().answer(PLACE_ID, "영업시간 알려주세요", "restaurant")
+
+        self.assertEqual(result["route"], "fast_path")
+        self.assertIn("영업시간", result["answer"])
+        self.repo.get_by_id.assert_awaited_once_with(PLACE_ID, projection="hours")
+        self.agent.arun.assert_not_awaited()
+        self.assertEqual(metrics.get("agent.route.fast_path.hours"), 1)
+
+    @async_test
+    async def test_ambiguous_query_falls_through_to_llm(self):
+        """애매한 질문은 장소 정보 조회 없이 LLM 에이전트로 넘기는지 테스트합니다."""
+        result = await self._service().answer(PLACE_ID, "주차 가능한가요?", "restaurant")
+
+        self.assertEqual(result, {"answer": "LLM 답변", "route": "llm", "intent": None})
+        # 답변 캐시의 버전 확인만 조회
+        self.repo.get_by_id.assert_awaited_once_with(PLACE_ID, projection="version")
+        self.assertEqual(metrics.get("agent.route.llm"), 1)
+
+    @async_test
+    async def test_missing_data_falls_through_to_llm(self):
+        """장소 문서에 필요한 정보가 없으면 LLM 에이전트로 넘기는지 테스트합니다."""
+        result = await self._service(docs={}).answer(PLACE_ID, "지금 사람 많아요?", "restaurant")
+
+        self.assertEqual(result["route"], "llm")
+        self.assertEqual(metrics.get("agent.route.llm.congestion"), 1)
+
+class TestAnswerCache(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.agent = AsyncMock()
+        self.agent.arun.return_value = "주차는 건물 지하 주차장을 이용하시면 됩니다."
+
+    def _service(self, docs=None, cache=None):
+        self.repo = make_repo(docs)
+        return AgentService(place_repo=self.repo, agent_factory=lambda: self.agent, cache=cache or AnswerCache())
+
+    def test_normalize_query(self):
+        """표현만 다른 같은 질문이 같은 키로 정규화되는지 테스트합니다."""
+        self.assertEqual(normalize_query("영업시간 알려줘"), normalize_query("영업 시간 알려주세요?"))
+        self.assertEqual(normalize_query("주차 가능한가요?"), normalize_query("주차 가능한가요"))
+        self.assertNotEqual(normalize_query("주차 가능한가요?"), normalize_query("포장 가능한가요?"))
+
+    @async_test
+    async def test_repeated_question_skips_llm(self):
+        """같은 장소의 같은 질문은 두 번째부터 LLM을 호출하지 않는지 테스트합니다."""
+        service = self._service()
+
+        first = await service.answer(PLACE_ID, "주차 가능한가요?", "restaurant")
+        second = await service.answer(PLACE_ID, "주차  가능한가요", "restaurant")
+
+        self.assertEqual(first["route"], "llm")
+        self.assertEqual(second, {"answer": first["answer"], "route": "cache", "intent": None})
+        self.agent.arun.assert_awaited_once()
+        self.assertEqual(service.cache.stats()["hit_rate"], 0.5)
+
+    @async_test
+    async def test_sync_change_invalidates_answer(self):
+        """동기화로 장소 문서의 lastChangedAt이 바뀌면 답변을 새로 생성하는지 테스트합니다."""
+        cache = AnswerCache()
+        docs = dict(PLACE_DOCS)
+        await self._service(docs, cache).answer(PLACE_ID, "주차 가능한가요?", "restaurant")
+
+        docs["version"] = {"source": {"placeId": PLACE_ID, "lastChangedAt": datetime(2025, 8, 13, 9, 0)}}
+        result = await self._service(docs, cache).answer(PLACE_ID, "주차 가능한가요?", "restaurant")
+
+        self.assertEqual(result["route"], "llm")
+        self.assertEqual(self.agent.arun.await_count, 2)
+
+    def test_lru_and_ttl(self):
+        """최대 항목 수를 넘으면 오래된 답변부터 제거하고, TTL이 지나면 조회되지 않는지 테스트합니다."""
+        cache = AnswerCache(max_entries=2, ttl=60)
+        keys = [cache.make_key(PLACE_ID, query, None) for query in ("주차", "포장", "예약")]
+        cache.set(keys[0], "a")
+        cache.set(keys[1], "b")
+        cache.get(keys[0])
+        cache.set(keys[2], "c")
+
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[0]), "a")
+        self.assertEqual(metrics.get("answer_cache.evictions"), 1)
+
+        expired = AnswerCache(ttl=0.01)
+        expired.set(keys[0], "a")
+        time.sleep(0.02)
+        self.assertIsNone(expired.get(keys[0]))
+
+class TestLlmsTxtTool(unittest.TestCase):
+
+    def _client(self):
+        client = MagicMock()
+        client.generate_llms_txt = AsyncMock(return_value={"llms.txt": "# 파이브가이즈", "llms-full.txt": "전체 내용"})
+        client.artifacts.list = AsyncMock(return_value={"llms.txt": {"hash": "abc"}, "llms-full.txt": {"hash": "def"}})
+        return client
+
+    @async_test
+    async def test_generates_in_process_with_shared_client(self):
+        """하위 프로세스 없이 공유 FirecrawlClient로 llms.txt를 생성하는지 테스트합니다."""
+        client = self._client()
+        with patch.object(tools, "get_shared_client", return_value=client), \
+             patch.object(tools.retrieval_index, "arefresh", AsyncMock(return_value={"added": 4, "removed": 0})):
+            result = await tools.generate_llms_txt_for_place.ainvoke({"place_id": PLACE_ID, "category": "restaurant"})
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["artifacts"], {"llms.txt": "abc", "llms-full.txt": "def"})
+        # 전체 내용은 검색 인덱스로 보내고 응답에는 요약만 포함
+        self.assertEqual(result["summary"], "# 파이브가이즈")
+        self.assertNotIn("전체 내용", json.dumps(result, ensure_ascii=False))
+        self.assertEqual(result["indexed_chunks"]["added"], 4)
+        url = client.generate_llms_txt.await_args.args[0]
+        self.assertIn(PLACE_ID, url)
+        self.assertEqual(client.generate_llms_txt.await_args.kwargs["place_id"], PLACE_ID)
+
+    @async_test
+    async def test_long_summary_is_truncated_by_tokens(self):
+        """요약이 토큰 예산을 넘으면 글자 수가 아니라 토큰 수 기준으로 잘라내는지 테스트합니다."""
+        client = self._client()
+        client.generate_llms_txt.return_value = {"llms.txt": "파이브가이즈 강남점 메뉴 안내 " * 500}
+        with patch.object(tools, "get_shared_client", return_value=client), \
+             patch.object(tools.retrieval_index, "arefresh", AsyncMock(return_value={"added": 1, "removed": 0})), \
+             patch.object(tools.settings, "TOOL_OUTPUT_TOKEN_BUDGET", 100):
+            result = await tools.generate_llms_txt_for_place.ainvoke({"place_id": PLACE_ID, "category": "restaurant"})
+
+        self.assertTrue(result["summary"].endswith(" ...(생략)"))
+        self.assertLessEqual(count_tokens(result["summary"][: -len(" ...(생략)")]), 100)
+
+    @async_test
+    async def test_firecrawl_failure_returns_error(self):
+        """Firecrawl 장애 시 예외 대신 error를 반환하는지 테스트합니다."""
+        client = self._client()
+        client.generate_llms_txt.side_effect = FirecrawlUnavailableException(30)
+        with patch.object(tools, "get_shared_client", return_value=client):
+            result = await tools.generate_llms_txt_for_place.ainvoke({"place_id": PLACE_ID, "category": "restaurant"})
+
+        self.assertIn("error", result)
+
+def large_place_doc(menu_size=500):
+    """메뉴가 많은 가게의 전체 문서"""
+    return {
+        "_id": "66b9f0c2e4b0a1a2b3c4d5e6",
+        "source": {"platform": "naver", "placeId": PLACE_ID, "contentHashes": {"home": "a" * 64, "menu": "b" * 64},
+                   "changeHistory": [{"at": datetime(2025, 8, 12), "pages": ["menu"]}] * 20},
+        "profile": {"name": "파이브가이즈 강남", "phone": "1544-3955", "category": ["음식점"]},
+        "hours": [{"day": day, "open": "11:00", "close": "22:00", "break": None, "last_order": None} for day in "월화수목금토일"],
+        "popularTimes": {"now": {"label": "한산", "score": 0, "source": "inference", "confidence": 0.5},
+                         "hourly": [{"hour": h, "score": 50} for h in range(24)]},
+        "restaurant": {"menu": [{"name": f"메뉴 {i}", "price": "12,000원", "description": "직접 만든 패티와 신선한 채소를 넣은 버거입니다.",
+                                 "is_signature": False} for i in range(menu_size)]},
+    }
+
+class TestToolOutputCompaction(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_hours_question_truncates_other_lists_first(self):
+        """full 조회에서 영업시간 질문이면 모든 섹션을 남기되 메뉴부터 잘라내는지 테스트합니다."""
+        doc = large_place_doc()
+        text = compact_tool_output(doc, projection="full", query="영업시간 알려주세요", budget=1500)
+        result = json.loads(text)
+
+        self.assertEqual(len(result["hours"]), 7)
+        self.assertEqual(result["profile"]["phone"], "1544-3955")
+        self.assertGreater(result["_truncated"]["restaurant.menu"], 0)
+        self.assertNotIn("hours", result["_truncated"])
+        self.assertLessEqual(count_tokens(text), 1500)
+
+    def test_ambiguous_question_keeps_all_sections(self):
+        """의도가 분명하지 않은 질문이면 어떤 섹션도 지우지 않는지 테스트합니다."""
+        text = compact_tool_output(large_place_doc(menu_size=3), projection="full", query="대기업 프랜차이즈야?", budget=1500)
+        result = json.loads(text)
+
+        self.assertEqual(result["profile"]["name"], "파이브가이즈 강남")
+        self.assertEqual(len(result["hours"]), 7)
+        self.assertEqual(len(result["restaurant"]["menu"]), 3)
+        self.assertIn("now", result["popularTimes"])
+
+    def test_long_menu_is_truncated_to_budget(self):
+        """메뉴가 예산을 넘으면 뒷부분을 잘라 예산 안에 맞추고 생략된 수를 기록하는지 테스트합니다."""
+        text = compact_tool_output(large_place_doc(), projection="menu", budget=300)
+        result = json.loads(text)
+
+        self.assertLessEqual(count_tokens(text), 300)
+        self.assertGreater(len(result["restaurant"]["menu"]), 0)
+        self.assertEqual(len(result["restaurant"]["menu"]) + result["_truncated"]["restaurant.menu"], 500)
+        self.assertEqual(metrics.get("agent.tool_output.truncated"), 1)
+
+    def test_internal_and_empty_fields_removed(self):
+        """동기화용 내부 필드와 빈 값은 제거하고 0 같은 의미 있는 값은 남기는지 테스트합니다."""
+        result = prune_place(large_place_doc(menu_size=1), projection="congestion")
+
+        self.assertNotIn("_id", result)
+        self.assertNotIn("contentHashes", result["source"])
+        self.assertNotIn("changeHistory", result["source"])
+        self.assertNotIn("break", result["hours"][0])
+        self.assertNotIn("is_signature", result["restaurant"]["menu"][0])
+        self.assertEqual(result["popularTimes"]["now"]["score"], 0)
+        self.assertEqual(len(result["popularTimes"]["hourly"]), 24)
+
+    @async_test
+    async def test_tool_returns_compact_json(self):
+        """get_place_information 도구가 압축된 JSON 문자열을 반환하고 토큰 수를 기록하는지 테스트합니다."""
+        repo = AsyncMock()
+        repo.get_by_id.return_value = large_place_doc()
+        with patch.object(tools, "get_database"), patch.object(tools, "PlaceRepository", return_value=repo):
+            text = await tools.get_place_information.ainvoke(
+                {"place_id": PLACE_ID, "projection": "full", "query": "지금 사람 많아요?"})
+
+        self.assertEqual(text, json.dumps(json.loads(text), ensure_ascii=False, separators=(",", ":")))
+        self.assertEqual(json.loads(text)["popularTimes"]["now"]["label"], "한산")
+        self.assertEqual(metrics.get("agent.tool_output.calls"), 1)
+        self.assertLess(metrics.get("agent.tool_output.tokens"), metrics.get("agent.tool_output.raw_tokens"))
+
+    def test_llm_usage_is_recorded(self):
+        """LLM 호출마다 입력/출력 토큰 수를 기록하는지 테스트합니다."""
+        response = AIMessage(content="오전 11시에 엽니다.",
+                             usage_metadata={"input_tokens": 120, "output_tokens": 8, "total_tokens": 128})
+        Agent._record_usage([AIMessage(content="질문")], response)
+
+        self.assertEqual(metrics.get("agent.tokens.input"), 120)
+        self.assertEqual(metrics.get("agent.tokens.output"), 8)
+        self.assertEqual(metrics.get("agent.llm_calls"), 1)
+
+class TestAgentStreamEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(agents.router, prefix="/api/v1")
+        self.fake_agent = None
+        app.dependency_overrides[agents.get_agent_service] = lambda: AgentService(
+            place_repo=make_repo(), agent_factory=lambda: self.fake_agent, cache=AnswerCache())
+        self.client = TestClient(app)
+        self.body = {"place_id": PLACE_ID, "category": "restaurant", "query": "여기 분위기 어때요?"}
+
+    def _events(self, response):
+        events = []
+        for block in response.text.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.split("\n"))
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_endpoint_sends_sse_events(self):
+        """스트리밍 엔드포인트가 text/event-stream으로 이벤트를 전달하는지 테스트합니다."""
+        self.fake_agent = make_agent(tool_call_turn())
+        with patch.object(agents.refresh_scheduler, "record_query"):
+            response = self.client.post("/api/v1/agent/query/stream", json=self.body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        events = self._events(response)
+        self.assertEqual(events[0], ("tool_start", {"name": "get_place_information",
+                                                    "args": {"place_id": PLACE_ID, "projection": "hours"}}))
+        self.assertEqual(events[-1], ("done", {"answer": "오전 11시에 엽니다.", "route": "llm"}))
+
+    def test_stream_endpoint_reports_errors_as_event(self):
+        """에이전트 실행 중 오류가 나면 error 이벤트로 알리는지 테스트합니다."""
+        class FailingAgent:
+            async def astream(self, **kwargs):
+                yield {"type": "token", "content": "오전"}
+                raise RuntimeError("LLM 호출 실패")
+
+        self.fake_agent = FailingAgent()
+        with patch.object(agents.refresh_scheduler, "record_query"):
+            response = self.client.post("/api/v1/agent/query/stream", json=self.body)
+
+        events = self._events(response)
+        self.assertEqual(events[0], ("token", {"content": "오전"}))
+        self.assertEqual(events[-1][0], "error")
+        self.assertIn("LLM 호출 실패", events[-1][1]["detail"])
+
+    def test_stream_endpoint_fast_path(self):
+        """빠른 경로로 답할 수 있는 질문은 에이전트 없이 한 번에 답변을 보내는지 테스트합니다."""
+        self.body["query"] = "영업시간 알려주세요"
+        with patch.object(agents.refresh_scheduler, "record_query"):
+            response = self.client.post("/api/v1/agent/query/stream", json=self.body)
+
+        events = self._events(response)
+        self.assertEqual([event for event, _ in events], ["token", "done"])
+        self.assertEqual(events[-1][1]["route"], "fast_path")
+
+    def test_query_endpoint_reports_route(self):
+        """/agent/query 응답에 처리 경로가 포함되는지 테스트합니다."""
+        self.body["query"] = "치즈버거 얼마예요?"
+        with patch.object(agents.refresh_scheduler, "record_query"):
+            response = self.client.post("/api/v1/agent/query", json=self.body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["route"], "fast_path")
+        self.assertIn("치즈버거: 15,900원", response.json()["answer"])
+
+if __name__ == '__main__':
+    unittest.main()
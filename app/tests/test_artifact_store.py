@@ -0,0 +1,119 @@
+import unittest
+import asyncio
+import os
+import tempfile
+
+from app.services.artifacts.store import ArtifactStore
+from app.services.monitoring.metrics import metrics
+
+# 통일된 place_id
+PLACE_ID = "1690334952"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class TestArtifactStore(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _blobs(self, place_id=PLACE_ID):
+        # 장소별 index.json과 잠금 파일을 제외한 내용 파일
+        return sorted(name for name in os.listdir(os.path.join(self.tmp.name, place_id))
+                      if name != ArtifactStore.INDEX_FILE and not name.startswith("."))
+
+    @async_test
+    async def test_roundtrip_for_each_compression(self):
+        """압축 방식별로 저장한 내용을 그대로 읽어 오는지 테스트합니다."""
+        for compression in ("zstd", "gzip", "none"):
+            with self.subTest(compression=compression):
+                store = ArtifactStore(os.path.join(self.tmp.name, compression), compression=compression)
+                await store.put(PLACE_ID, "llms.txt", "# 카페\n영업시간 10:00 - 21:00")
+                self.assertEqual(await store.get(PLACE_ID, "llms.txt"), "# 카페\n영업시간 10:00 - 21:00")
+        self.assertIsNone(await store.get(PLACE_ID, "llms-full.txt"))
+
+    @async_test
+    async def test_identical_content_is_written_once(self):
+        """같은 내용을 다시 저장하면 파일을 새로 쓰지 않는지 테스트합니다."""
+        store = ArtifactStore(self.tmp.name, compression="gzip")
+        first = await store.put(PLACE_ID, "llms.txt", "same")
+        second = await store.put(PLACE_ID, "llms.txt", "same")
+        await store.put(PLACE_ID, "llms-full.txt", "same")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self._blobs()), 1)
+        self.assertEqual(metrics.get("artifacts.writes"), 1)
+        self.assertEqual(metrics.get("artifacts.deduplicated"), 2)
+
+    @async_test
+    async def test_replaced_content_removes_unreferenced_file(self):
+        """내용이 바뀌면 더 이상 참조되지 않는 이전 파일을 지우는지 테스트합니다."""
+        store = ArtifactStore(self.tmp.name, compression="none")
+        old = await store.put(PLACE_ID, "llms.txt", "v1")
+        new = await store.put(PLACE_ID, "llms.txt", "v2")
+
+        self.assertNotEqual(old["hash"], new["hash"])
+        self.assertEqual(self._blobs(), [new["hash"]])
+
+    @async_test
+    async def test_index_survives_restart(self):
+        """새 인스턴스가 index.json으로 기존 산출물을 찾는지 테스트합니다."""
+        await ArtifactStore(self.tmp.name, compression="gzip").put(PLACE_ID, "llms.txt", "persisted")
+        reopened = ArtifactStore(self.tmp.name, compression="gzip")
+
+        self.assertEqual(await reopened.get(PLACE_ID, "llms.txt"), "persisted")
+        self.assertEqual(list(await reopened.list(PLACE_ID)), ["llms.txt"])
+
+    @async_test
+    async def test_concurrent_places_do_not_overwrite(self):
+        """여러 장소를 동시에 저장해도 서로의 산출물을 덮어쓰지 않는지 테스트합니다."""
+        store = ArtifactStore(self.tmp.name, compression="gzip")
+        await asyncio.gather(*(store.put(str(i), "llms.txt", f"place {i}") for i in range(20)))
+
+        for i in range(20):
+            self.assertEqual(await store.get(str(i), "llms.txt"), f"place {i}")
+        self.assertFalse([name for name in os.listdir(self.tmp.name) if name.endswith(".tmp")])
+
+    @async_test
+    async def test_other_places_are_not_blocked(self):
+        """한 장소를 저장하는 동안에도 다른 장소는 기다리지 않고 저장되는지 테스트합니다."""
+        store = ArtifactStore(self.tmp.name, compression="gzip")
+        with store._locked(PLACE_ID):
+            await asyncio.wait_for(store.put("1", "llms.txt", "other place"), timeout=2)
+        self.assertEqual(await store.get("1", "llms.txt"), "other place")
+
+    @async_test
+    async def test_separate_instances_share_entries(self):
+        """워커마다 따로 만든 저장소 인스턴스가 서로 저장한 산출물을 덮어쓰지 않고 보는지 테스트합니다."""
+        worker_a = ArtifactStore(self.tmp.name, compression="gzip")
+        worker_b = ArtifactStore(self.tmp.name, compression="gzip")
+        await worker_a.get(PLACE_ID, "llms.txt")
+
+        await worker_a.put(PLACE_ID, "llms.txt", "from a")
+        await worker_b.put(PLACE_ID, "llms-full.txt", "from b")
+
+        self.assertEqual(sorted(await worker_a.list(PLACE_ID)), ["llms-full.txt", "llms.txt"])
+        self.assertEqual(await worker_a.get(PLACE_ID, "llms-full.txt"), "from b")
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, PLACE_ID, ArtifactStore.INDEX_FILE)))
+
+    @async_test
+    async def test_rejects_non_numeric_place_id(self):
+        """경로를 벗어나는 place_id는 저장/조회하지 않는지 테스트합니다."""
+        store = ArtifactStore(os.path.join(self.tmp.name, "store"), compression="none")
+        for place_id in ("../..", "..", "1/../../x", "abc", ""):
+            with self.subTest(place_id=place_id):
+                with self.assertRaises(ValueError):
+                    await store.put(place_id, "llms.txt", "escaped")
+                with self.assertRaises(ValueError):
+                    await store.get(place_id, "llms.txt")
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
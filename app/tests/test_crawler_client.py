@@ -0,0 +1,399 @@
+import unittest
+import asyncio
+import time
+import os
+import tempfile
+from aiohttp import web
+
+from app.services.crawler.client import FirecrawlClient, FirecrawlException, FirecrawlUnavailableException
+from app.services.crawler.rate_limiter import TokenBucket
+from app.services.crawler.circuit_breaker import CircuitBreaker
+from app.services.crawler.cache import ScrapeCache
+from app.services.crawler.replay import FixtureStore, FirecrawlReplayer
+from app.services.artifacts.store import ArtifactStore
+from benchmarks.fake_firecrawl import FakeFirecrawlServer as StandInServer
+from app.services.monitoring.metrics import metrics
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class FakeFirecrawlServer:
+    """미리 정한 응답을 순서대로 돌려주는 로컬 Firecrawl 서버"""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.runner = None
+        self.url = None
+
+    async def _handle(self, request):
+        self.calls += 1
+        status, headers = self.responses.pop(0) if self.responses else (200, {})
+        if status == 200:
+            return web.json_response({"data": {"content": "ok"}})
+        return web.Response(status=status, text="error", headers=headers)
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/v0/scrape", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/v0/scrape"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.runner.cleanup()
+
+class TestTokenBucket(unittest.TestCase):
+
+    @async_test
+    async def test_burst_then_rate(self):
+        """burst만큼은 즉시 통과하고, 이후에는 rate에 맞춰 대기하는지 테스트합니다."""
+        bucket = TokenBucket(rate=20, burst=2)
+        started = time.monotonic()
+        waits = [await bucket.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertGreater(waits[2], 0)
+        self.assertGreaterEqual(elapsed, 0.09)
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_after_threshold_and_recovers(self):
+        """연속 실패 후 열리고, 회복 시간이 지나면 시험 요청 하나만 허용하는지 테스트합니다."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        """half-open 시험 요청이 실패하면 다시 열리는지 테스트합니다."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+class TestFirecrawlClientRetry(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def _client(self, url, max_retries=3):
+        return FirecrawlClient(
+            api_key="fake_key",
+            base_url=url,
+            rate_limiter=TokenBucket(rate=1000, burst=100),
+            max_retries=max_retries,
+            backoff_base=0.01,
+        )
+
+    @async_test
+    async def test_retries_429_with_retry_after(self):
+        """429 응답 후 Retry-After만큼 기다렸다가 재시도하여 성공하는지 테스트합니다."""
+        async with FakeFirecrawlServer([(429, {"Retry-After": "0.1"}), (503, {})]) as server:
+            async with self._client(server.url) as client:
+                started = time.monotonic()
+                result = await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+                elapsed = time.monotonic() - started
+
+        self.assertEqual(result, {"content": "ok"})
+        self.assertEqual(server.calls, 3)
+        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertEqual(metrics.get("firecrawl.retried"), 2)
+        self.assertEqual(metrics.get("firecrawl.rate_limited"), 1)
+
+    @async_test
+    async def test_gives_up_after_max_retries(self):
+        """재시도 횟수를 모두 쓰면 FirecrawlException을 발생시키는지 테스트합니다."""
+        async with FakeFirecrawlServer([(500, {})] * 5) as server:
+            async with self._client(server.url, max_retries=2) as client:
+                with self.assertRaises(FirecrawlException):
+                    await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+
+        self.assertEqual(server.calls, 3)
+        self.assertEqual(metrics.get("firecrawl.failed"), 1)
+
+    @async_test
+    async def test_client_error_is_not_retried(self):
+        """400 같은 클라이언트 오류는 재시도하지 않는지 테스트합니다."""
+        async with FakeFirecrawlServer([(400, {})]) as server:
+            async with self._client(server.url) as client:
+                with self.assertRaises(FirecrawlException):
+                    await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+
+        self.assertEqual(server.calls, 1)
+        self.assertEqual(metrics.get("firecrawl.retried"), 0)
+
+    @async_test
+    async def test_open_circuit_fails_fast(self):
+        """연속 실패로 서킷이 열리면 서버를 호출하지 않고 즉시 실패하는지 테스트합니다."""
+        async with FakeFirecrawlServer([(503, {})] * 10) as server:
+            client = self._client(server.url, max_retries=0)
+            client.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+            async with client:
+                for _ in range(2):
+                    with self.assertRaises(FirecrawlException):
+                        await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+                with self.assertRaises(FirecrawlUnavailableException):
+                    await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+
+        self.assertEqual(server.calls, 2)
+        self.assertEqual(client.circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(metrics.get("firecrawl.short_circuited"), 1)
+
+    @async_test
+    async def test_request_timeout(self):
+        """응답이 늦으면 지정된 타임아웃으로 실패하는지 테스트합니다."""
+        async def slow(request):
+            await asyncio.sleep(1)
+            return web.json_response({"data": {}})
+
+        app = web.Application()
+        app.router.add_post("/v0/scrape", slow)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with self._client(f"http://127.0.0.1:{port}/v0/scrape", max_retries=0) as client:
+                started = time.monotonic()
+                with self.assertRaises(FirecrawlException):
+                    await client.scrape_url("https://m.place.naver.com/restaurant/1/home", timeout=0.1)
+                self.assertLess(time.monotonic() - started, 0.5)
+        finally:
+            await runner.cleanup()
+        self.assertEqual(metrics.get("firecrawl.timeouts"), 1)
+
+    @async_test
+    async def test_long_retry_after_fails_without_waiting(self):
+        """Retry-After가 허용 범위보다 길면 기다리지 않고 바로 실패하는지 테스트합니다."""
+        async with FakeFirecrawlServer([(429, {"Retry-After": "3600"})]) as server:
+            client = self._client(server.url)
+            client.retry_after_max = 10.0
+            async with client:
+                started = time.monotonic()
+                with self.assertRaises(FirecrawlException):
+                    await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+                self.assertLess(time.monotonic() - started, 1.0)
+
+        self.assertEqual(server.calls, 1)
+        self.assertEqual(metrics.get("firecrawl.retried"), 0)
+        self.assertEqual(metrics.get("firecrawl.failed"), 1)
+
+    def test_retry_delay_honours_full_retry_after(self):
+        """Retry-After가 백오프 상한보다 길어도 줄이지 않고 그대로 따르는지 테스트합니다."""
+        client = self._client("http://127.0.0.1/v0/scrape")
+        delay = client._retry_delay(1, "45")
+        self.assertGreaterEqual(delay, 45.0)
+        self.assertLess(delay, 45.02)
+
+    def test_retry_delay_uses_http_date(self):
+        """HTTP 날짜 형식의 Retry-After도 처리하는지 테스트합니다."""
+        client = self._client("http://127.0.0.1/v0/scrape")
+        delay = client._retry_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT")
+        self.assertLess(delay, 0.02)
+
+class TestScrapeCache(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache(self, **kwargs):
+        options = {"max_entries": 10, "cache_dir": self.tmp.name, "ttls": {"default": 60}}
+        options.update(kwargs)
+        return ScrapeCache(**options)
+
+    def test_key_normalizes_url(self):
+        """끝 슬래시, fragment, 쿼리 순서가 달라도 같은 키를 만드는지 테스트합니다."""
+        a = ScrapeCache.make_key("scrape", "https://M.place.naver.com/restaurant/1/home/?b=2&a=1#x")
+        b = ScrapeCache.make_key("scrape", "https://m.place.naver.com/restaurant/1/home?a=1&b=2")
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, ScrapeCache.make_key("scrape", "https://m.place.naver.com/restaurant/1/home", {"formats": ["html"]}))
+        self.assertEqual(ScrapeCache.page_type("scrape", "https://m.place.naver.com/restaurant/1/menu/list"), "menu")
+
+    @async_test
+    async def test_disk_hit_after_memory_cleared(self):
+        """메모리 계층이 비어도 디스크 계층에서 읽어 메모리로 다시 올리는지 테스트합니다."""
+        cache = self._cache()
+        await cache.set("k", "default", {"content": "ok"})
+        cache.clear_memory()
+
+        self.assertEqual(await cache.get("k"), {"content": "ok"})
+        self.assertEqual(await cache.get("k"), {"content": "ok"})
+        self.assertEqual(metrics.get("scrape_cache.hits.disk"), 1)
+        self.assertEqual(metrics.get("scrape_cache.hits.memory"), 1)
+
+    @async_test
+    async def test_expired_entry_is_miss(self):
+        """TTL이 지난 항목은 메모리와 디스크 모두에서 미스로 처리되는지 테스트합니다."""
+        cache = self._cache(ttls={"default": 0.05})
+        await cache.set("k", "default", {"content": "ok"})
+        await asyncio.sleep(0.06)
+
+        self.assertIsNone(await cache.get("k"))
+        self.assertEqual(metrics.get("scrape_cache.misses"), 1)
+
+    @async_test
+    async def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 내보내는지 테스트합니다."""
+        cache = self._cache(max_entries=2, cache_dir="")
+        await cache.set("a", "default", {"v": 1})
+        await cache.set("b", "default", {"v": 2})
+        await cache.get("a")
+        await cache.set("c", "default", {"v": 3})
+
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(await cache.get("a"), {"v": 1})
+        self.assertEqual(metrics.get("scrape_cache.evictions"), 1)
+
+    def _disk_files(self):
+        return [name for _, _, names in os.walk(self.tmp.name) for name in names if name.endswith(".json.gz")]
+
+    @async_test
+    async def test_disk_tier_is_bounded(self):
+        """디스크 계층이 최대 파일 수를 넘으면 만료가 가장 가까운 파일부터 삭제하는지 테스트합니다."""
+        cache = self._cache(disk_max_entries=3, sweep_every=1)
+        for i in range(5):
+            await cache.set(f"key-{i}", "default", {"v": i})
+        cache.clear_memory()
+
+        self.assertEqual(len(self._disk_files()), 3)
+        self.assertIsNone(await cache.get("key-0"))
+        self.assertEqual(await cache.get("key-4"), {"v": 4})
+        self.assertEqual(metrics.get("scrape_cache.disk_evictions"), 2)
+
+    @async_test
+    async def test_expired_files_are_swept_without_reads(self):
+        """다시 조회되지 않는 만료 파일도 정리 주기에 삭제되는지 테스트합니다."""
+        cache = self._cache(ttls={"default": 0.05, "menu": 60}, sweep_every=2)
+        await cache.set("old", "default", {"v": 1})
+        await asyncio.sleep(0.06)
+        await cache.set("new", "menu", {"v": 2})
+
+        self.assertEqual(len(self._disk_files()), 1)
+        cache.clear_memory()
+        self.assertEqual(await cache.get("new"), {"v": 2})
+
+    @async_test
+    async def test_client_serves_repeat_from_cache(self):
+        """같은 URL을 다시 요청하면 서버를 호출하지 않고, use_cache=False면 다시 호출하는지 테스트합니다."""
+        url = "https://m.place.naver.com/restaurant/1/home"
+        async with FakeFirecrawlServer([]) as server:
+            client = FirecrawlClient(
+                api_key="fake_key",
+                base_url=server.url,
+                rate_limiter=TokenBucket(rate=1000, burst=100),
+                cache=self._cache(),
+            )
+            async with client:
+                first = await client.scrape_url(url)
+                second = await client.scrape_url(url + "/")
+                await client.scrape_url(url, use_cache=False)
+
+        self.assertEqual(first, second)
+        self.assertEqual(server.calls, 2)
+        self.assertEqual(client.cache.stats()["hit_rate"], 0.5)
+
+class TestStandInServer(unittest.TestCase):
+
+    @async_test
+    async def test_all_endpoints_follow_api_url(self):
+        """api_url 하나로 scrape/search/llmstxt 엔드포인트가 모두 로컬 대체 서버를 향하는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as artifact_dir:
+            artifacts = ArtifactStore(artifact_dir, compression="gzip")
+            async with StandInServer(latency=0, payload_kb=4) as server:
+                async with FirecrawlClient(api_key="fake_key", api_url=server.url, mode="live", artifacts=artifacts) as client:
+                    menu = await client.scrape_url("https://m.place.naver.com/restaurant/1/menu")
+                    results = await client.search("카페")
+                    llms = await client.generate_llms_txt("https://m.place.naver.com/restaurant/1/home")
+            self.assertEqual(await artifacts.get("1", "llms-full.txt"), llms["llms-full.txt"])
+
+        self.assertIn("_4,500_ 원", menu["content"])
+        self.assertGreaterEqual(len(menu["content"].encode("utf-8")), 4 * 1024)
+        self.assertEqual(len(results), 1)
+        self.assertIn("llms-full.txt", llms)
+        self.assertEqual(server.requests, 3)
+
+class TestRecordReplay(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _replay_client(self, **replayer_options):
+        store = FixtureStore(self.tmp.name)
+        return FirecrawlClient(
+            api_key=None,
+            mode="replay",
+            max_retries=1,
+            backoff_base=0.01,
+            fixtures=store,
+            replayer=FirecrawlReplayer(store, **replayer_options),
+        )
+
+    @async_test
+    async def test_record_then_replay_offline(self):
+        """record 모드로 저장한 응답을 replay 모드에서 서버 없이 그대로 돌려주는지 테스트합니다."""
+        url = "https://m.place.naver.com/restaurant/1/home"
+        async with FakeFirecrawlServer([]) as server:
+            recorder = FirecrawlClient(
+                api_key="fake_key",
+                base_url=server.url,
+                rate_limiter=TokenBucket(rate=1000, burst=100),
+                mode="record",
+                fixtures=FixtureStore(self.tmp.name),
+            )
+            async with recorder:
+                recorded = await recorder.scrape_url(url)
+
+        async with self._replay_client(latency=0.05) as client:
+            started = time.monotonic()
+            replayed = await client.scrape_url(url)
+            self.assertGreaterEqual(time.monotonic() - started, 0.05)
+            with self.assertRaises(FirecrawlException):
+                await client.scrape_url("https://m.place.naver.com/restaurant/2/home")
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(metrics.get("firecrawl.replay.hits"), 1)
+        self.assertEqual(metrics.get("firecrawl.replay.misses"), 1)
+
+    @async_test
+    async def test_injected_errors_are_retried(self):
+        """주입된 503 오류가 일반 오류처럼 재시도와 서킷 브레이커에 집계되는지 테스트합니다."""
+        async with self._replay_client(error_rate=1.0, seed=1) as client:
+            with self.assertRaises(FirecrawlException):
+                await client.scrape_url("https://m.place.naver.com/restaurant/1/home")
+
+        self.assertEqual(metrics.get("firecrawl.replay.injected_errors"), 2)
+        self.assertEqual(metrics.get("firecrawl.retried"), 1)
+        self.assertEqual(client.circuit_breaker.snapshot()["consecutive_failures"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import unittest
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, AsyncMock
+
+from app.services.sync.job_queue import SyncJobQueue
+from app.services.sync.scheduler import RefreshScheduler
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class FakePipeline:
+    """호출 기록을 남기고, 지정된 장소는 정해진 횟수만큼 실패하는 가짜 파이프라인"""
+    def __init__(self, failures=None, delay=0.01):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run_sync(self, place_id, category, force=False):
+        self.calls.append(place_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures.get(place_id, 0) > 0:
+                self.failures[place_id] -= 1
+                raise RuntimeError("일시적 오류")
+            return {"place_id": place_id, "modified_count": 1}
+        finally:
+            self.in_flight -= 1
+
+class TestSyncJobQueue(unittest.TestCase):
+
+    @async_test
+    async def test_worker_pool_bounds_concurrency(self):
+        """워커 수만큼만 동시에 동기화하고 모든 장소를 완료하는지 테스트합니다."""
+        pipeline = FakePipeline()
+        queue = SyncJobQueue(worker_count=3, retry_backoff=0)
+        await queue.start(lambda: pipeline)
+
+        job = queue.submit([(str(i), "restaurant") for i in range(10)])
+        await queue.join()
+        await queue.stop()
+
+        self.assertEqual(pipeline.max_in_flight, 3)
+        self.assertEqual(job.counts, {"succeeded": 10})
+        self.assertEqual(job.status, "completed")
+        self.assertIsNotNone(job.finished_at)
+
+    @async_test
+    async def test_failed_place_is_retried(self):
+        """실패한 장소가 재시도되고, 최대 시도 횟수를 넘으면 failed가 되는지 테스트합니다."""
+        pipeline = FakePipeline(failures={"1": 1, "2": 5})
+        queue = SyncJobQueue(worker_count=2, max_attempts=3, retry_backoff=0)
+        await queue.start(lambda: pipeline)
+
+        job = queue.submit([("1", "restaurant"), ("2", "restaurant")])
+        await queue.join()
+        await queue.stop()
+
+        self.assertEqual(job.places["1"]["status"], "succeeded")
+        self.assertEqual(job.places["1"]["attempts"], 2)
+        self.assertEqual(job.places["2"]["status"], "failed")
+        self.assertEqual(job.places["2"]["attempts"], 3)
+        self.assertEqual(job.places["2"]["error"], "일시적 오류")
+
+    @async_test
+    async def test_inflight_place_is_shared(self):
+        """진행 중인 장소를 다시 요청하면 크롤링 없이 같은 실행 결과를 공유하는지 테스트합니다."""
+        pipeline = FakePipeline(delay=0.05)
+        queue = SyncJobQueue(worker_count=2, retry_backoff=0)
+        await queue.start(lambda: pipeline)
+
+        first = queue.submit([("1", "restaurant")])
+        await asyncio.sleep(0.01)
+        second = queue.submit([("1", "restaurant"), ("2", "restaurant")])
+        self.assertIs(queue.find_inflight_job("1"), first)
+
+        await queue.join()
+        await queue.stop()
+
+        self.assertEqual(sorted(pipeline.calls), ["1", "2"])
+        self.assertEqual(first.places["1"]["status"], "succeeded")
+        self.assertEqual(second.places["1"]["status"], "succeeded")
+        self.assertTrue(second.places["1"]["deduplicated"])
+        self.assertIsNone(queue.find_inflight_job("1"))
+
+    @async_test
+    async def test_skipped_result_is_final(self):
+        """파이프라인이 최신 상태라 건너뛴 장소는 skipped로 완료되는지 테스트합니다."""
+        class FreshPipeline:
+            async def run_sync(self, place_id, category, force=False):
+                return {"place_id": place_id, "modified_count": 0, "skipped": not force}
+
+        queue = SyncJobQueue(worker_count=1)
+        await queue.start(FreshPipeline)
+        job = queue.submit([("1", "restaurant")])
+        forced = queue.submit([("2", "restaurant")], force=True)
+        await queue.join()
+        await queue.stop()
+
+        self.assertEqual(job.counts, {"skipped": 1})
+        self.assertEqual(forced.counts, {"succeeded": 1})
+        self.assertEqual(job.status, "completed")
+
+    def test_submit_requires_running_pool(self):
+        """워커 풀이 시작되지 않았으면 작업 등록을 거부하는지 테스트합니다."""
+        with self.assertRaises(RuntimeError):
+            SyncJobQueue().submit([("1", "restaurant")])
+
+class TestRefreshScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime(2025, 8, 12, 12, 0, 0)
+        self.queue = MagicMock()
+        self.queue.find_inflight_job.return_value = None
+        self.scheduler = RefreshScheduler(self.queue, budget_per_minute=8, tick_seconds=60, min_refresh_interval=600)
+
+    def _doc(self, place_id, hours_ago, changes=0, category="restaurant"):
+        return {
+            "source": {
+                "placeId": place_id,
+                "lastFetchedAt": self.now - timedelta(hours=hours_ago),
+                "changeHistory": [{"at": self.now - timedelta(days=2)} for _ in range(changes)],
+            },
+            "profile": {"category": [category]},
+        }
+
+    def test_priority_prefers_changing_and_queried_places(self):
+        """자주 바뀌거나 자주 조회되는 장소의 우선순위가 더 높은지 테스트합니다."""
+        static = self._doc("1", hours_ago=10)
+        changing = self._doc("2", hours_ago=10, changes=6)
+        queried = self._doc("3", hours_ago=10)
+        for _ in range(5):
+            self.scheduler.record_query("3")
+
+        self.assertGreater(self.scheduler.priority(changing, self.now), self.scheduler.priority(static, self.now))
+        self.assertGreater(self.scheduler.priority(queried, self.now), self.scheduler.priority(static, self.now))
+
+    @async_test
+    async def test_run_once_respects_request_budget(self):
+        """분당 요청 예산 안에서 우선순위가 높은 장소만 큐에 넣는지 테스트합니다."""
+        repo = AsyncMock()
+        repo.find_refresh_candidates.return_value = [
+            self._doc("1", hours_ago=30),
+            self._doc("2", hours_ago=10, changes=10),
+            self._doc("3", hours_ago=5),
+        ]
+        self.scheduler.place_repo_factory = lambda: repo
+
+        selected = await self.scheduler.run_once(now=self.now)
+
+        # 식당은 장소당 4페이지 -> 예산 8이면 2곳
+        self.assertEqual(selected, [("2", "restaurant"), ("1", "restaurant")])
+        self.queue.submit.assert_called_once_with(selected)
+        cutoff = repo.find_refresh_candidates.call_args[0][0]
+        self.assertEqual(cutoff, self.now - timedelta(seconds=600))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import places
+from app.db.repositories.place_cache import PlaceCache
+from typing import get_args
+
+from app.db.repositories.place_repository import PlaceRepository, PROJECTIONS, INTERNAL_PROJECTIONS
+from app.schemas.place_schema import PlaceProjection
+from app.services.monitoring.metrics import metrics
+
+# 통일된 place_id
+PLACE_ID = "1690334952"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class SlowLoader:
+    """호출 횟수를 세고, 지연 후 문서를 돌려주는 가짜 DB 조회"""
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"source": {"placeId": PLACE_ID}, "version": self.calls}
+
+class TestPlaceCache(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    @async_test
+    async def test_concurrent_misses_load_once(self):
+        """같은 장소를 동시에 조회하면 DB 조회를 한 번만 하는지 테스트합니다."""
+        cache = PlaceCache(max_entries=10, ttl=60)
+        loader = SlowLoader()
+
+        docs = await asyncio.gather(*(cache.get_or_load(PLACE_ID, loader) for _ in range(5)))
+
+        self.assertEqual(loader.calls, 1)
+        self.assertTrue(all(doc == docs[0] for doc in docs))
+        self.assertEqual(metrics.get("place_cache.misses"), 1)
+        self.assertEqual(metrics.get("place_cache.coalesced"), 4)
+        self.assertEqual(cache.stats()["hit_rate"], 0.8)
+
+    @async_test
+    async def test_returned_documents_are_copies(self):
+        """호출자가 결과를 수정해도 캐시된 문서는 바뀌지 않는지 테스트합니다."""
+        cache = PlaceCache(max_entries=10, ttl=60)
+        loader = SlowLoader(delay=0)
+        doc = await cache.get_or_load(PLACE_ID, loader)
+        doc["_id"] = "changed"
+
+        self.assertNotIn("_id", await cache.get_or_load(PLACE_ID, loader))
+        self.assertEqual(loader.calls, 1)
+
+    @async_test
+    async def test_invalidation_during_load_is_not_cached(self):
+        """조회 중에 무효화되면 그 조회 결과를 캐시에 남기지 않는지 테스트합니다."""
+        cache = PlaceCache(max_entries=10, ttl=60)
+        loader = SlowLoader()
+        pending = asyncio.create_task(cache.get_or_load(PLACE_ID, loader))
+        await asyncio.sleep(0.005)
+        cache.invalidate(PLACE_ID)
+        await pending
+
+        second = await cache.get_or_load(PLACE_ID, loader)
+        self.assertEqual(second["version"], 2)
+
+    @async_test
+    async def test_ttl_and_lru_eviction(self):
+        """TTL이 지나거나 최대 항목 수를 넘으면 다시 조회하는지 테스트합니다."""
+        cache = PlaceCache(max_entries=1, ttl=0.03)
+        loader = SlowLoader(delay=0)
+        await cache.get_or_load(PLACE_ID, loader)
+        await asyncio.sleep(0.04)
+        await cache.get_or_load(PLACE_ID, loader)
+        await cache.get_or_load("other", loader)
+        await cache.get_or_load(PLACE_ID, loader)
+
+        self.assertEqual(loader.calls, 4)
+        self.assertEqual(metrics.get("place_cache.evictions"), 2)
+
+    @async_test
+    async def test_repository_write_invalidates(self):
+        """저장소로 장소를 갱신하면 캐시된 문서를 버리는지 테스트합니다."""
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"source": {"placeId": PLACE_ID}})
+        collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+        repo = PlaceRepository({"places": collection}, cache=PlaceCache(max_entries=10, ttl=60))
+
+        await repo.get_by_id(PLACE_ID)
+        await repo.get_by_id(PLACE_ID)
+        await repo.touch_last_fetched(PLACE_ID)
+        await repo.get_by_id(PLACE_ID)
+
+        self.assertEqual(collection.find_one.await_count, 2)
+
+class TestPlaceProjections(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = MagicMock()
+        self.collection.find_one = AsyncMock(return_value={"source": {"placeId": PLACE_ID}, "hours": []})
+        self.collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+        self.repo = PlaceRepository({"places": self.collection}, cache=PlaceCache(max_entries=10, ttl=60))
+
+    def test_api_projection_names_match_repository(self):
+        """API에서 받는 projection 이름이 저장소 정의에서 내부용을 뺀 것과 같은지 테스트합니다."""
+        self.assertEqual(set(get_args(PlaceProjection)), set(PROJECTIONS) - INTERNAL_PROJECTIONS)
+        self.assertTrue(INTERNAL_PROJECTIONS <= set(PROJECTIONS))
+
+    @async_test
+    async def test_projection_is_sent_to_mongo_and_cached_separately(self):
+        """projection별로 필요한 필드만 조회하고, 캐시도 projection별로 보관하는지 테스트합니다."""
+        await self.repo.get_by_id(PLACE_ID, projection="hours")
+        await self.repo.get_by_id(PLACE_ID, projection="hours")
+        await self.repo.get_by_id(PLACE_ID)
+
+        projections = [call.args[1] for call in self.collection.find_one.await_args_list]
+        self.assertEqual(projections, [PROJECTIONS["hours"], None])
+        self.assertNotIn("restaurant.menu", PROJECTIONS["hours"])
+
+    @async_test
+    async def test_write_invalidates_every_projection(self):
+        """장소를 갱신하면 모든 projection의 캐시를 버리는지 테스트합니다."""
+        for projection in ("hours", "menu"):
+            await self.repo.get_by_id(PLACE_ID, projection=projection)
+        await self.repo.touch_last_fetched(PLACE_ID)
+        for projection in ("hours", "menu"):
+            await self.repo.get_by_id(PLACE_ID, projection=projection)
+
+        self.assertEqual(self.collection.find_one.await_count, 4)
+
+    def test_api_rejects_internal_projection(self):
+        """내부용 projection(version)은 API에서 422로 거절하는지 테스트합니다."""
+        app = FastAPI()
+        app.include_router(places.router, prefix="/api/v1")
+        app.dependency_overrides[places.get_place_repository] = lambda: self.repo
+        response = TestClient(app).get(f"/api/v1/places/{PLACE_ID}", params={"projection": "version"})
+
+        self.assertEqual(response.status_code, 422)
+        self.collection.find_one.assert_not_awaited()
+
+    @async_test
+    async def test_unknown_projection(self):
+        """정의되지 않은 projection이면 ValueError를 발생시키는지 테스트합니다."""
+        with self.assertRaises(ValueError):
+            await self.repo.get_by_id(PLACE_ID, projection="reviews")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from app.db.repositories.place_repository import PlaceRepository, build_changeset
+from app.services.sync.write_batcher import PlaceWriteBatcher
+from app.db.indexes import ensure_indexes, INDEX_SPECS
+
+# 통일된 place_id
+PLACE_ID = "1690334952"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+def _menu(*prices):
+    return [{"name": f"메뉴{i}", "price": price, "description": None, "is_signature": False}
+            for i, price in enumerate(prices)]
+
+class TestBuildChangeset(unittest.TestCase):
+
+    def test_single_menu_price_change(self):
+        """메뉴 하나의 가격만 바뀌면 해당 경로 하나만 반환하는지 테스트합니다."""
+        current = {"restaurant": {"menu": _menu("4500", "5000", "5500")}}
+        changes = build_changeset(current, {"restaurant.menu": _menu("4500", "5200", "5500")})
+
+        self.assertEqual(changes, [
+            {"op": "set", "path": "restaurant.menu.1.price", "old": "5000", "new": "5200"}
+        ])
+
+    def test_identical_data_has_no_changes(self):
+        """저장된 값과 같으면 빈 변경 내역을 반환하는지 테스트합니다."""
+        current = {"hours": [{"day": "MON", "open": "10:00", "close": "21:00"}]}
+        self.assertEqual(build_changeset(current, {"hours": current["hours"]}), [])
+
+    def test_length_change_replaces_whole_array(self):
+        """배열 길이가 바뀌면 배열 전체를 교체하는지 테스트합니다."""
+        current = {"restaurant": {"menu": _menu("4500")}}
+        new_menu = _menu("4500", "5000")
+        changes = build_changeset(current, {"restaurant.menu": new_menu})
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["path"], "restaurant.menu")
+        self.assertEqual(changes[0]["new"], new_menu)
+
+    def test_missing_field_and_removed_key(self):
+        """새 필드는 set, 사라진 하위 키는 unset으로 반환하는지 테스트합니다."""
+        current = {"source": {"contentHashes": {"home": "a", "menu": "b"}}}
+        changes = build_changeset(current, {
+            "source.contentHashes": {"home": "a"},
+            "popularTimes.now": {"label": "여유"},
+        })
+
+        self.assertIn({"op": "unset", "path": "source.contentHashes.menu", "old": "b", "new": None}, changes)
+        self.assertIn({"op": "set", "path": "popularTimes.now", "old": None, "new": {"label": "여유"}}, changes)
+
+class TestPlaceRepositoryDelta(unittest.TestCase):
+
+    @async_test
+    async def test_update_synced_delta_sets_only_changed_paths(self):
+        """update_synced_delta가 바뀐 경로만 $set 하는지 테스트합니다."""
+        collection = MagicMock()
+        collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+        repo = PlaceRepository({"places": collection})
+
+        current = {"restaurant": {"menu": _menu("4500", "5000")}}
+        result = await repo.update_synced_delta(PLACE_ID, {"restaurant.menu": _menu("4500", "5900")}, current=current)
+
+        update = collection.update_one.call_args[0][1]
+        self.assertEqual(set(update["$set"]), {"restaurant.menu.1.price", "source.lastFetchedAt"})
+        self.assertNotIn("$unset", update)
+        self.assertEqual(result["modified_count"], 1)
+        self.assertEqual(len(result["changes"]), 1)
+
+    def test_sync_upsert_skips_overlapping_skeleton_paths(self):
+        """$setOnInsert 기본 필드 중 $set과 겹치는 경로는 빼는지 테스트합니다."""
+        repo = PlaceRepository({"places": MagicMock()})
+
+        operation, _ = repo.build_sync_upsert(PLACE_ID, "cafe", {"restaurant.menu": _menu("4500")})
+        update = operation._doc
+        self.assertTrue(operation._upsert)
+        self.assertEqual(update["$setOnInsert"], {"source.platform": "naver", "profile.category": ["cafe"]})
+        self.assertIn("restaurant.menu", update["$set"])
+
+        operation, _ = repo.build_sync_upsert(PLACE_ID, "cafe", {"profile": {"category": ["카페"]}})
+        self.assertEqual(operation._doc["$setOnInsert"], {"source.platform": "naver"})
+
+class TestPlaceWriteBatcher(unittest.TestCase):
+
+    def _batcher(self, collection, **kwargs):
+        batcher = PlaceWriteBatcher(**kwargs)
+        batcher.place_repo_factory = lambda: PlaceRepository({"places": collection})
+        return batcher
+
+    @async_test
+    async def test_concurrent_writes_share_one_bulk_write(self):
+        """동시에 들어온 여러 장소의 쓰기를 한 번의 비순차 bulk_write로 보내는지 테스트합니다."""
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock()
+        batcher = self._batcher(collection, max_batch_size=3, max_delay=1)
+
+        results = await asyncio.gather(
+            batcher.upsert_synced_delta("1", "cafe", {"hours": []}),
+            batcher.upsert_synced_delta("2", "cafe", {"hours": []}),
+            batcher.touch_last_fetched("3"),
+        )
+
+        collection.bulk_write.assert_awaited_once()
+        operations = collection.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 3)
+        self.assertEqual(collection.bulk_write.call_args[1], {"ordered": False})
+        self.assertTrue(results[0]["upserted"])
+
+    @async_test
+    async def test_partial_failure_only_fails_its_caller(self):
+        """bulk_write 중 실패한 연산의 호출자만 오류를 받는지 테스트합니다."""
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock(side_effect=BulkWriteError({
+            "writeErrors": [{"index": 1, "errmsg": "duplicate key"}],
+        }))
+        batcher = self._batcher(collection, max_batch_size=10, max_delay=0.01)
+
+        results = await asyncio.gather(
+            batcher.touch_last_fetched("1"),
+            batcher.touch_last_fetched("2"),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], RuntimeError)
+
+class TestEnsureIndexes(unittest.TestCase):
+
+    @async_test
+    async def test_creates_unique_place_index_and_continues_on_failure(self):
+        """places에 unique 인덱스를 만들고, 한 컬렉션이 실패해도 나머지를 계속 만드는지 테스트합니다."""
+        places = MagicMock()
+        places.create_indexes = AsyncMock(return_value=["source_placeId_unique", "source_lastFetchedAt", "profile_category"])
+        polices = MagicMock()
+        polices.create_indexes = AsyncMock(side_effect=OperationFailure("index build failed"))
+
+        created = await ensure_indexes({"places": places, "polices": polices})
+
+        unique = [index.document for index in INDEX_SPECS["places"] if index.document.get("unique")]
+        self.assertEqual([dict(index["key"]) for index in unique], [{"source.placeId": 1}])
+        self.assertEqual(len(created["places"]), 3)
+        self.assertEqual(created["polices"], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+
+from app.services.artifacts.store import ArtifactStore
+from app.services.retrieval.index import RetrievalIndex, chunk_markdown, tokenize
+from app.services.monitoring.metrics import metrics
+
+# 통일된 place_id
+PLACE_ID = "1690334952"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+LLMS_FULL_TXT = """# 파이브가이즈 강남
+
+서울 서초구 강남대로 435에 있는 햄버거 전문점입니다.
+
+## 메뉴
+### 버거
+치즈버거 15,900원. 패티 두 장과 치즈가 들어갑니다.
+베이컨버거 16,900원.
+
+### 사이드
+감자튀김 6,900원. 땅콩기름으로 튀깁니다.
+
+## 편의시설
+주차는 건물 지하 주차장을 이용할 수 있으며 2시간 무료입니다.
+유아용 의자가 있습니다.
+
+## 공지
+매월 첫째 주 월요일은 정기 휴무입니다.
+"""
+
+class TestChunking(unittest.TestCase):
+
+    def test_chunks_follow_markdown_sections(self):
+        """마크다운 제목 단위로 청크를 나누고 상위 제목 경로를 기록하는지 테스트합니다."""
+        chunks = chunk_markdown(LLMS_FULL_TXT, "llms-full.txt")
+
+        headings = [chunk["heading"] for chunk in chunks]
+        self.assertEqual(headings, [
+            "파이브가이즈 강남",
+            "파이브가이즈 강남 > 메뉴 > 버거",
+            "파이브가이즈 강남 > 메뉴 > 사이드",
+            "파이브가이즈 강남 > 편의시설",
+            "파이브가이즈 강남 > 공지",
+        ])
+        self.assertIn("감자튀김", chunks[2]["text"])
+
+    def test_long_section_is_split(self):
+        """최대 글자 수를 넘는 섹션은 문단 단위로 나누는지 테스트합니다."""
+        text = "## 리뷰\n" + "\n\n".join(f"리뷰 {i}: " + "맛있어요 " * 20 for i in range(10))
+        chunks = chunk_markdown(text, "llms-full.txt", max_chars=300)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk["text"]) <= 300 for chunk in chunks))
+
+    def test_korean_tokens_match_with_particles(self):
+        """조사가 붙은 한글 단어도 같은 토큰을 공유하는지 테스트합니다."""
+        self.assertTrue(set(tokenize("주차")) & set(tokenize("주차는 가능한가요")))
+
+class TestRetrievalIndex(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.artifacts = ArtifactStore(root_dir=os.path.join(self.tmp.name, "artifacts"), compression="gzip")
+        self.index_dir = os.path.join(self.tmp.name, "retrieval")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _index(self):
+        return RetrievalIndex(root_dir=self.index_dir, artifacts=self.artifacts)
+
+    @async_test
+    async def test_search_returns_relevant_top_k(self):
+        """질문과 관련 있는 섹션만 top-k로 반환하는지 테스트합니다."""
+        await self.artifacts.put(PLACE_ID, "llms-full.txt", LLMS_FULL_TXT)
+
+        results = await self._index().asearch(PLACE_ID, "주차 가능한가요?", k=1)
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0]["heading"].endswith("편의시설"))
+        self.assertIn("2시간 무료", results[0]["text"])
+
+    @async_test
+    async def test_index_is_persisted(self):
+        """인덱스를 디스크에 저장하고, 새 프로세스에서는 다시 색인하지 않는지 테스트합니다."""
+        await self.artifacts.put(PLACE_ID, "llms-full.txt", LLMS_FULL_TXT)
+        await self._index().arefresh(PLACE_ID)
+        self.assertTrue(os.path.exists(os.path.join(self.index_dir, f"{PLACE_ID}.json")))
+
+        stats = await self._index().arefresh(PLACE_ID)
+        results = await self._index().asearch(PLACE_ID, "정기 휴무", k=1)
+
+        self.assertEqual(stats, {"added": 0, "removed": 0})
+        self.assertEqual(metrics.get("retrieval.reindexed"), 1)
+        self.assertTrue(results[0]["heading"].endswith("공지"))
+
+    @async_test
+    async def test_changed_content_reindexes_only_changed_chunks(self):
+        """내용이 바뀌면 바뀐 섹션의 청크만 다시 색인하는지 테스트합니다."""
+        index = self._index()
+        await self.artifacts.put(PLACE_ID, "llms-full.txt", LLMS_FULL_TXT)
+        await index.arefresh(PLACE_ID)
+
+        await self.artifacts.put(PLACE_ID, "llms-full.txt", LLMS_FULL_TXT.replace("2시간 무료", "3시간 무료"))
+        stats = await index.arefresh(PLACE_ID)
+        results = await index.asearch(PLACE_ID, "주차", k=1)
+
+        self.assertEqual(stats, {"added": 1, "removed": 1})
+        self.assertIn("3시간 무료", results[0]["text"])
+        with open(os.path.join(self.index_dir, f"{PLACE_ID}.json"), encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["chunks"]), 5)
+
+    @async_test
+    async def test_summary_is_used_without_full_text(self):
+        """llms-full.txt가 없으면 llms.txt를 색인하고, 생기면 llms-full.txt로 바꾸는지 테스트합니다."""
+        index = self._index()
+        await self.artifacts.put(PLACE_ID, "llms.txt", "# 요약\n햄버거 전문점")
+        self.assertEqual(len(await index.asearch(PLACE_ID, "햄버거")), 1)
+
+        await self.artifacts.put(PLACE_ID, "llms-full.txt", LLMS_FULL_TXT)
+        results = await index.asearch(PLACE_ID, "햄버거", k=5)
+
+        self.assertTrue(all(result["source"] == "llms-full.txt" for result in results))
+
+    @async_test
+    async def test_place_without_artifacts(self):
+        """수집된 산출물이 없는 장소는 빈 결과를 반환하는지 테스트합니다."""
+        self.assertEqual(await self._index().asearch(PLACE_ID, "주차"), [])
+        self.assertEqual(metrics.get("retrieval.empty_results"), 1)
+
+    @async_test
+    async def test_memory_keeps_recent_places_only(self):
+        """메모리에는 최근에 검색한 장소의 인덱스만 남기고, 내린 인덱스는 디스크에서 다시 읽는지 테스트합니다."""
+        index = RetrievalIndex(root_dir=self.index_dir, artifacts=self.artifacts, max_places=2)
+        for place_id in ["1", "2", PLACE_ID]:
+            await self.artifacts.put(place_id, "llms-full.txt", LLMS_FULL_TXT)
+            await index.asearch(place_id, "주차")
+
+        self.assertEqual(list(index._indexes), ["2", PLACE_ID])
+        self.assertEqual(metrics.get("retrieval.evictions"), 1)
+        results = await index.asearch("1", "주차", k=1)
+        self.assertIn("2시간 무료", results[0]["text"])
+        self.assertEqual(metrics.get("retrieval.reindexed"), 3)
+
+    @async_test
+    async def test_rejects_non_numeric_place_id(self):
+        """경로를 벗어나는 place_id로는 인덱스 파일을 만들지 않는지 테스트합니다."""
+        with self.assertRaises(ValueError):
+            await self._index().asearch("../..", "주차")
+        self.assertFalse(os.path.exists(self.index_dir))
+
+if __name__ == '__main__':
+    unittest.main()
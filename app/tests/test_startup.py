@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 임포트만으로 불러오면 안 되는 무거운 모듈 (첫 요청 또는 lifespan에서 불러옴)
+HEAVY_MODULES = ["langchain_openai", "langgraph", "firecrawl"]
+
+# 워커 부팅 시 app.main 임포트에 허용하는 시간(초)
+IMPORT_BUDGET = 3.0
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+from app.db.connection import MongoDBConnection
+print(elapsed)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+print(MongoDBConnection._client is None)
+"""
+
+class TestStartup(unittest.TestCase):
+
+    def _import_app(self):
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("MONGO_URI", "FIRECRAWL_API_KEY", "OPENAI_API_KEY")}
+        env["PYTHONPATH"] = ROOT_DIR
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        # uvicorn처럼 저장소 루트에서 실행 (static 디렉토리 경로 기준)
+        return subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", PROBE.format(heavy=HEAVY_MODULES)],
+            cwd=ROOT_DIR,
+            env=env, capture_output=True, text=True, timeout=60,
+        )
+
+    def test_import_without_env_keys(self):
+        """환경 변수 없이도 app.main을 임포트할 수 있는지 테스트합니다."""
+        result = self._import_app()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_import_does_not_load_heavy_clients(self):
+        """임포트 시 langchain/Firecrawl SDK를 불러오거나 DB 연결을 만들지 않는지 테스트합니다."""
+        result = self._import_app()
+        self.assertEqual(result.returncode, 0, result.stderr)
+        elapsed, loaded, no_client = result.stdout.strip().splitlines()[-3:]
+        self.assertEqual(loaded, "", f"임포트 시 불러온 무거운 모듈: {loaded}")
+        self.assertEqual(no_client, "True")
+
+    def test_import_time_budget(self):
+        """app.main 임포트 시간이 예산 안에 있는지 테스트합니다."""
+        # 첫 실행은 디스크 캐시 영향을 받으므로 두 번 중 빠른 값을 사용
+        timings = []
+        for _ in range(2):
+            result = self._import_app()
+            self.assertEqual(result.returncode, 0, result.stderr)
+            timings.append(float(result.stdout.strip().splitlines()[-3]))
+        self.assertLess(min(timings), IMPORT_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, AsyncMock
+
+from app.services.sync.sync_pipeline import SyncPipeline, content_hash
+from app.services.normalizer.data_normalizer import DataNormalizer
+from app.services.congestion.predictor import CongestionPredictor
+
+# 통일된 place_id
+PLACE_ID = "1690334952"
+
+MENU_CONTENT = "- [아메리카노\\\\ 고소한 원두 _4,500_ 원](https://m.place.naver.com/menu/1)"
+INFO_CONTENT = "**영업시간**\n월-금 10:00 - 21:00\n"
+
+# 비동기 테스트를 위한 데코레이터
+def async_test(f):
+    def wrapper(*args, **kwargs):
+        asyncio.run(f(*args, **kwargs))
+    return wrapper
+
+class FakeCrawler:
+    """지연 시간을 두고 페이지별 content를 돌려주는 가짜 크롤러"""
+    def __init__(self, contents, delay=0.05):
+        self.contents = contents
+        self.delay = delay
+        self.requested = []
+        self.cache_flags = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def scrape_url(self, url, params=None, use_cache=True):
+        self.requested.append(url)
+        self.cache_flags.append(use_cache)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        page = url.rstrip("/").split("/")[-1]
+        return {"content": self.contents.get(page, "")}
+
+class TestSyncPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = AsyncMock()
+        self.repo.get_by_id.return_value = None
+        self.repo.upsert_synced_delta.return_value = {"modified_count": 1, "changes": []}
+
+    def _pipeline(self, crawler, page_concurrency=4):
+        return SyncPipeline(
+            place_repo=self.repo,
+            crawler=crawler,
+            normalizer=DataNormalizer(),
+            predictor=CongestionPredictor(),
+            page_concurrency=page_concurrency,
+        )
+
+    @async_test
+    async def test_sync_bypasses_scrape_cache(self):
+        """강제 동기화가 아니어도 스크랩 캐시를 거치지 않고 원본을 가져오는지 테스트합니다."""
+        crawler = FakeCrawler({"menu": MENU_CONTENT, "info": INFO_CONTENT}, delay=0)
+        await self._pipeline(crawler).run_sync(PLACE_ID, "restaurant")
+
+        self.assertTrue(crawler.cache_flags)
+        self.assertEqual(set(crawler.cache_flags), {False})
+
+    @async_test
+    async def test_pages_fetched_concurrently(self):
+        """모든 페이지가 동시에 크롤링되고 정규화 결과가 저장되는지 테스트합니다."""
+        crawler = FakeCrawler({"menu": MENU_CONTENT, "info": INFO_CONTENT})
+        result = await self._pipeline(crawler).run_sync(PLACE_ID, "restaurant")
+
+        self.assertEqual(len(crawler.requested), 4)
+        self.assertEqual(crawler.max_in_flight, 4)
+        self.assertEqual(result["synced_data"]["restaurant.menu"][0]["name"], "아메리카노")
+        self.assertEqual(len(result["synced_data"]["hours"]), 5)
+        # 새 장소는 조회 한 번과 upsert 한 번으로 끝남
+        self.repo.get_by_id.assert_awaited_once_with(PLACE_ID, use_cache=False)
+        args, kwargs = self.repo.upsert_synced_delta.call_args
+        self.assertEqual(args[:2], (PLACE_ID, "restaurant"))
+        self.assertIsNone(kwargs["current"])
+
+    @async_test
+    async def test_page_concurrency_cap(self):
+        """장소별 동시 크롤링 수가 설정값을 넘지 않는지 테스트합니다."""
+        crawler = FakeCrawler({})
+        await self._pipeline(crawler, page_concurrency=2).run_sync(PLACE_ID, "restaurant")
+        self.assertEqual(crawler.max_in_flight, 2)
+
+    @async_test
+    async def test_category_without_menu_skips_menu_page(self):
+        """메뉴 페이지가 없는 카테고리는 메뉴를 크롤링하지 않는지 테스트합니다."""
+        crawler = FakeCrawler({})
+        result = await self._pipeline(crawler).run_sync(PLACE_ID, "salon")
+
+        self.assertEqual(len(crawler.requested), 3)
+        self.assertFalse(any(url.endswith("/menu") for url in crawler.requested))
+        self.assertNotIn("restaurant.menu", result["synced_data"])
+
+    @async_test
+    async def test_unchanged_pages_skip_normalization_and_write(self):
+        """모든 페이지 해시가 이전과 같으면 DB 쓰기 없이 fetch 시간만 갱신하는지 테스트합니다."""
+        contents = {"menu": MENU_CONTENT, "info": INFO_CONTENT}
+        stored = {page: content_hash(contents.get(page, "")) for page in ("home", "info", "menu", "review")}
+        self.repo.get_by_id.return_value = {"source": {"contentHashes": stored}}
+        normalizer = MagicMock(wraps=DataNormalizer())
+
+        pipeline = self._pipeline(FakeCrawler(contents))
+        pipeline.normalizer = normalizer
+        result = await pipeline.run_sync(PLACE_ID, "restaurant")
+
+        self.assertTrue(result["unchanged"])
+        normalizer.normalize_menu.assert_not_called()
+        normalizer.normalize_hours.assert_not_called()
+        self.repo.upsert_synced_delta.assert_not_awaited()
+        self.repo.touch_last_fetched.assert_awaited_once_with(PLACE_ID)
+
+    @async_test
+    async def test_only_changed_pages_are_written(self):
+        """해시가 바뀐 페이지에서 나온 필드만 갱신하는지 테스트합니다."""
+        contents = {"menu": MENU_CONTENT, "info": INFO_CONTENT}
+        stored = {page: content_hash(contents.get(page, "")) for page in ("home", "info", "review")}
+        self.repo.get_by_id.return_value = {"source": {"contentHashes": stored}}
+
+        result = await self._pipeline(FakeCrawler(contents)).run_sync(PLACE_ID, "restaurant")
+
+        synced = result["synced_data"]
+        self.assertIn("restaurant.menu", synced)
+        self.assertNotIn("hours", synced)
+        self.assertNotIn("popularTimes.now", synced)
+        self.assertEqual(synced["source.contentHashes"]["menu"], content_hash(MENU_CONTENT))
+
+    @async_test
+    async def test_recently_synced_place_is_not_crawled(self):
+        """최소 갱신 간격 안에 동기화된 장소는 크롤링하지 않고, force면 다시 크롤링하는지 테스트합니다."""
+        self.repo.get_by_id.return_value = {"source": {
+            "contentHashes": {"home": "x"},
+            "lastFetchedAt": datetime.utcnow() - timedelta(seconds=30),
+        }}
+        crawler = FakeCrawler({})
+        pipeline = self._pipeline(crawler)
+
+        result = await pipeline.run_sync(PLACE_ID, "restaurant")
+        self.assertTrue(result["skipped"])
+        self.assertEqual(crawler.requested, [])
+
+        await pipeline.run_sync(PLACE_ID, "restaurant", force=True)
+        self.assertEqual(len(crawler.requested), 4)
+
+if __name__ == '__main__':
+    unittest.main()
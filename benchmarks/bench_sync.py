@@ -0,0 +1,165 @@
+"""
+SyncPipeline 처리량 벤치마크.
+
+로컬 Firecrawl 대체 서버(benchmarks.fake_firecrawl)를 띄우고, 동시성을 단계적으로 늘려 가며
+장소 동기화를 실행합니다. 단계별로 초당 처리 장소 수, 장소당 지연 시간 p50/p99, 최대 RSS를 출력합니다.
+MongoDB 없이 돌 수 있도록 메모리 저장소를 사용합니다.
+
+실행 예:
+    python -m benchmarks.bench_sync --places 200 --concurrency 1,4,16,64 --latency 0.2
+    python -m benchmarks.bench_sync --api-url http://127.0.0.1:3002   # 이미 떠 있는 서버 사용
+"""
+import argparse
+import asyncio
+import copy
+import resource
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from app.db.repositories.place_repository import build_changeset
+from app.services.crawler.client import FirecrawlClient
+from app.services.crawler.rate_limiter import TokenBucket
+from app.services.normalizer.data_normalizer import DataNormalizer
+from app.services.congestion.predictor import CongestionPredictor
+from app.services.sync.sync_pipeline import SyncPipeline
+from app.services.monitoring.metrics import metrics
+from .fake_firecrawl import add_server_arguments, server_from_args
+
+
+class InMemoryPlaceRepository:
+    """SyncPipeline이 사용하는 PlaceRepository 메서드만 메모리 dict로 구현한 저장소"""
+    def __init__(self):
+        self.docs: Dict[str, Dict[str, Any]] = {}
+
+    async def get_by_id(self, place_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        doc = self.docs.get(place_id)
+        return copy.deepcopy(doc) if doc is not None else None
+
+
+    async def touch_last_fetched(self, place_id: str) -> int:
+        self.docs[place_id]["source"]["lastFetchedAt"] = datetime.utcnow()
+        return 1
+
+    async def upsert_synced_delta(self, place_id, category, update_data, current=None, changed_pages=None) -> Dict[str, Any]:
+        upserted = place_id not in self.docs
+        doc = self.docs.setdefault(place_id, {
+            "source": {"platform": "naver", "placeId": place_id},
+            "profile": {"category": [category]},
+        })
+        changes = build_changeset(current, update_data)
+        for path, value in update_data.items():
+            target = doc
+            *parents, leaf = path.split(".")
+            for key in parents:
+                target = target.setdefault(key, {})
+            target[leaf] = value
+        doc["source"]["lastFetchedAt"] = datetime.utcnow()
+        return {"modified_count": 1 if changes else 0, "upserted": upserted, "changes": changes}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_level(client: FirecrawlClient, concurrency: int, places: int, category: str, offset: int) -> Dict[str, Any]:
+    """동시에 concurrency개 장소씩 places개 장소를 동기화하고 결과를 집계합니다."""
+    pipeline = SyncPipeline(
+        place_repo=InMemoryPlaceRepository(),
+        crawler=client,
+        normalizer=DataNormalizer(),
+        predictor=CongestionPredictor(),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def sync_one(place_id: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await pipeline.run_sync(place_id, category, force=True)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    metrics.reset()
+    started = time.perf_counter()
+    await asyncio.gather(*(sync_one(str(offset + i)) for i in range(places)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "places": places,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "places_per_s": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "retried": int(metrics.get("firecrawl.retried")),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    columns = ["concurrency", "places", "errors", "elapsed_s", "places_per_s", "p50_ms", "p99_ms", "retried", "peak_rss_mb"]
+    print(" ".join(f"{c:>13}" for c in columns))
+    for row in rows:
+        print(" ".join(f"{row[c]:>13}" for c in columns))
+
+
+async def main_async(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    server = None
+    api_url = args.api_url
+    if not api_url:
+        server = server_from_args(args, seed=args.seed)
+        api_url = await server.start()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    # 벤치마크 대상은 클라이언트/파이프라인이므로 기본적으로 속도 제한은 사실상 끔
+    rate = args.rate_limit or 1_000_000
+    rate_limiter = TokenBucket(rate=rate, burst=max(1, int(rate)))
+    rows = []
+    try:
+        async with FirecrawlClient(
+            api_key="bench", api_url=api_url, mode="live", rate_limiter=rate_limiter,
+            pool_limit=args.pool_limit, pool_limit_per_host=args.pool_limit,
+        ) as client:
+            for index, concurrency in enumerate(levels):
+                row = await run_level(client, concurrency, args.places, args.category, offset=index * args.places)
+                rows.append(row)
+    finally:
+        if server is not None:
+            await server.stop()
+    _print_table(rows)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SyncPipeline 처리량 벤치마크")
+    parser.add_argument("--places", type=int, default=100, help="단계별 동기화할 장소 수")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="쉼표로 구분한 동시 동기화 장소 수")
+    parser.add_argument("--category", default="restaurant")
+    parser.add_argument("--api-url", default=None, help="이미 실행 중인 Firecrawl(대체) 서버 주소")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="클라이언트 초당 요청 제한 (0이면 사용 안 함)")
+    parser.add_argument("--pool-limit", type=int, default=100, help="커넥션 풀 크기")
+    parser.add_argument("--seed", type=int, default=0)
+    add_server_arguments(parser)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Firecrawl API를 흉내 내는 로컬 대체 서버.
+
+/v0/scrape, /v0/search, /v0/llmstxt 엔드포인트에 미리 만든 네이버 플레이스 마크다운으로 응답하며,
+지연 시간, 429 응답 비율, 응답 크기를 조절할 수 있습니다.
+
+실행 예:
+    python -m benchmarks.fake_firecrawl --port 3002 --latency 0.3 --rate-limit-ratio 0.05
+    FIRECRAWL_API_URL=http://127.0.0.1:3002 FIRECRAWL_API_KEY=fake uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import random
+from typing import Optional
+from aiohttp import web
+
+HOME_CONTENT = """**실시간 인기 토픽**
+지금 방문자가 많아 보통 수준으로 붐비고 있어요.
+
+**영업시간**
+월-금 10:00 - 21:00 (20:30 라스트오더)
+토,일 11:00 - 22:00
+매주 월요일 정기 휴무
+"""
+
+INFO_CONTENT = """**영업시간**
+월-금 10:00 - 21:00 (20:30 라스트오더)
+토,일 11:00 - 22:00
+
+**편의시설**
+주차, 포장, 예약, 무선 인터넷
+"""
+
+MENU_ITEMS = [
+    ("대표\\\\ 아메리카노\\\\ 고소한 원두", "4,500"),
+    ("카페라떼\\\\ 우유와 에스프레소", "5,000"),
+    ("바닐라라떼", "5,500"),
+    ("치즈케이크\\\\ 매일 직접 굽는 케이크", "6,500"),
+]
+
+REVIEW_LINE = "- 커피가 맛있고 매장이 조용해서 작업하기 좋아요. 다음에도 방문할게요.\n"
+
+
+def _menu_content(place_id: str) -> str:
+    return "\n".join(
+        f"- [{text} _{price}_ 원](https://m.place.naver.com/restaurant/{place_id}/menu/{i})"
+        for i, (text, price) in enumerate(MENU_ITEMS)
+    )
+
+
+def _pad(content: str, payload_kb: int) -> str:
+    """응답 크기를 맞추기 위해 리뷰 문장을 덧붙입니다."""
+    target = payload_kb * 1024
+    size = len(content.encode("utf-8"))
+    if size >= target:
+        return content
+    repeat = (target - size) // len(REVIEW_LINE.encode("utf-8")) + 1
+    return content + "\n**방문자 리뷰**\n" + REVIEW_LINE * repeat
+
+
+class FakeFirecrawlServer:
+    """
+    aiohttp로 구현한 Firecrawl 대체 서버.
+    latency 초(±jitter)만큼 기다린 뒤 응답하며, rate_limit_ratio 비율로 429와 Retry-After를 돌려줍니다.
+    """
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.0,
+        rate_limit_ratio: float = 0.0,
+        retry_after: float = 0.1,
+        payload_kb: int = 0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.payload_kb = payload_kb
+        self.requests = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v0/scrape", self._scrape)
+        app.router.add_post("/v0/search", self._search)
+        app.router.add_post("/v0/llmstxt", self._llmstxt)
+        return app
+
+    async def _delay(self) -> Optional[web.Response]:
+        """지연 시간을 적용하고, 429로 응답해야 하면 그 응답을 반환합니다."""
+        self.requests += 1
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.rate_limit_ratio > 0 and self._random.random() < self.rate_limit_ratio:
+            self.rate_limited += 1
+            return web.Response(
+                status=429, text="Rate limit exceeded", headers={"Retry-After": str(self.retry_after)}
+            )
+        return None
+
+    async def _scrape(self, request: web.Request) -> web.Response:
+        throttled = await self._delay()
+        if throttled is not None:
+            return throttled
+        payload = await request.json()
+        segments = payload.get("url", "").rstrip("/").split("/")
+        place_id = segments[4] if len(segments) > 4 else "0"
+        page = segments[5] if len(segments) > 5 else "home"
+        if page == "menu":
+            content = _menu_content(place_id)
+        elif page == "info":
+            content = INFO_CONTENT
+        elif page == "review":
+            content = "**방문자 리뷰**\n" + REVIEW_LINE * 5
+        else:
+            content = HOME_CONTENT
+        return web.json_response({
+            "success": True,
+            "data": {"content": _pad(content, self.payload_kb), "metadata": {"sourceURL": payload.get("url")}},
+        })
+
+    async def _search(self, request: web.Request) -> web.Response:
+        throttled = await self._delay()
+        if throttled is not None:
+            return throttled
+        payload = await request.json()
+        return web.json_response({
+            "success": True,
+            "data": [{"url": "https://m.place.naver.com/restaurant/1690334952/home", "title": payload.get("query", ""), "content": HOME_CONTENT}],
+        })
+
+    async def _llmstxt(self, request: web.Request) -> web.Response:
+        throttled = await self._delay()
+        if throttled is not None:
+            return throttled
+        full = _pad(HOME_CONTENT + "\n" + INFO_CONTENT + "\n" + _menu_content("0"), self.payload_kb)
+        return web.json_response({
+            "success": True,
+            "data": {"llms.txt": HOME_CONTENT, "llms-full.txt": full},
+        })
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 API 주소(예: http://127.0.0.1:3002)를 반환합니다."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeFirecrawlServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.2, help="응답 지연 시간(초)")
+    parser.add_argument("--jitter", type=float, default=0.05, help="지연 시간 편차(초)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="429로 응답할 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--payload-kb", type=int, default=0, help="scrape 응답 content의 최소 크기(KB)")
+
+
+def server_from_args(args: argparse.Namespace, seed: Optional[int] = None) -> FakeFirecrawlServer:
+    return FakeFirecrawlServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after,
+        payload_kb=args.payload_kb,
+        seed=seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 Firecrawl 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3002)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    server = server_from_args(args)
+    print(f"Fake Firecrawl 서버 시작: http://{args.host}:{args.port}")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
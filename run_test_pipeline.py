@@ -25,13 +25,15 @@ async def main():
     print("="*50)
 
     # --- 사전 준비 ---
-    if not os.getenv("FIRECRAWL_API_KEY") or not os.getenv("MONGO_URI"):
-        print(".env 파일에 FIRECRAWL_API_KEY와 MONGO_URI를 모두 설정해야 합니다.")
+    # FIRECRAWL_MODE=record로 한 번 실행해 두면, 이후에는 FIRECRAWL_MODE=replay로 네트워크 없이 실행할 수 있음
+    replay = os.getenv("FIRECRAWL_MODE", "live").lower() == "replay"
+    if not (os.getenv("FIRECRAWL_API_KEY") or replay) or not os.getenv("MONGO_URI"):
+        print(".env 파일에 FIRECRAWL_API_KEY(replay 모드 제외)와 MONGO_URI를 모두 설정해야 합니다.")
         return
         
     try:
         db = get_database()
-        print(f"MongoDB 연결 성공: {db.client.server_info()['version']}")
+        print(f"MongoDB 연결 성공: {(await db.client.server_info())['version']}")
         print(f"연결된 데이터베이스: '{db.name}'")
     except Exception as e:
         print(f"MongoDB 연결 실패: {e}")
@@ -44,7 +46,7 @@ async def main():
 
     # --- 1. 테스트 데이터 삭제 ---
     print(f"\n[STEP 1] DB에서 기존 테스트 데이터 (place_id: {place_id}) 삭제 시도...")
-    delete_result = place_repo.collection.delete_one({"source.placeId": place_id})
+    delete_result = await place_repo.collection.delete_one({"source.placeId": place_id})
     if delete_result.deleted_count > 0:
         print(f"기존 문서 {delete_result.deleted_count}개 삭제 완료.")
     else:
@@ -53,13 +55,14 @@ async def main():
     # --- 2. 파이프라인 실행 ---
     print("\n[STEP 2] 전체 동기화 파이프라인 실행...")
     try:
-        pipeline = SyncPipeline(
-            place_repo=place_repo,
-            crawler=FirecrawlClient(),
-            normalizer=DataNormalizer(),
-            predictor=CongestionPredictor()
-        )
-        result = await pipeline.run_sync(place_id, category)
+        async with FirecrawlClient() as crawler:
+            pipeline = SyncPipeline(
+                place_repo=place_repo,
+                crawler=crawler,
+                normalizer=DataNormalizer(),
+                predictor=CongestionPredictor()
+            )
+            result = await pipeline.run_sync(place_id, category)
         print("파이프라인 실행 완료.")
         pprint(result)
 
@@ -69,7 +72,7 @@ async def main():
 
     # --- 3. 최종 DB 데이터 확인 ---
     print("\n[STEP 3] DB에서 최종 데이터 조회 및 검증...")
-    final_db_data = place_repo.get_by_id(place_id)
+    final_db_data = await place_repo.get_by_id(place_id)
     
     print("--- DB에 저장된 최종 문서 ---")
     pprint(final_db_data)